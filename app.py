@@ -1,13 +1,26 @@
 ## Contextual Article Analyzer - Enhanced UX with Sidebar Layout and Tabs
 
 import streamlit as st
-import requests
-import json
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.express as px
-import re
-from urllib.parse import urlparse, urlencode
+import time
+
+from liz_analyzer.batch import (
+    DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST_LIMIT, batch_rows_to_csv, build_batch_row, parse_url_list, run_batch
+)
+from liz_analyzer.cascade import PATH_LOCAL, analysis_path
+from liz_analyzer.categories import LOCAL_CATEGORY_SECTION
+from liz_analyzer.charts import create_age_chart, create_gender_chart, create_intentionality_chart, create_keyword_chart
+from liz_analyzer.client import AnalysisError
+from liz_analyzer.engine import IAB_TIER1_CATEGORIES, AnalysisEngine, is_valid_url
+from liz_analyzer.history import AnalysisHistory
+from liz_analyzer.intent_model import LOCAL_INTENT_SECTION
+from liz_analyzer.jobs import JobRunner
+from liz_analyzer.keywords import LOCAL_KEYWORDS_SECTION
+from liz_analyzer.scoring import (
+    calculate_final_intention_score, calculate_intentionality_score,
+    get_final_intention_grade, get_intentionality_grade
+)
+from liz_analyzer.ui import display_error, inject_app_styles, waiting_background_html
+from liz_analyzer.urls import canonicalize_url
 
 
 # Page configuration
@@ -17,924 +30,163 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# IAB Tier 1 Categories
-IAB_TIER1_CATEGORIES = [
-    "Arts & Entertainment",
-    "Automotive", 
-    "Business",
-    "Careers",
-    "Education",
-    "Family & Parenting",
-    "Health & Fitness",
-    "Food & Drink",
-    "Hobbies & Interests",
-    "Home & Garden",
-    "Law, Government & Politics",
-    "News",
-    "Personal Finance",
-    "Society",
-    "Science",
-    "Pets",
-    "Sports",
-    "Style & Fashion",
-    "Technology & Computing",
-    "Travel",
-    "Real Estate",
-    "Shopping",
-    "Religion & Spirituality",
-    "Non-Standard Content"
-]
+# Analysis engine (result cache + pooled webhook client) shared by all sessions
+@st.cache_resource
+def get_analysis_engine():
+    return AnalysisEngine.from_env()
 
-# Function to validate URL format
-def is_valid_url(url):
-    """Validate URL format before sending to API"""
-    if not url or not url.strip():
-        return False, "Please enter a URL"
-    
-    url = url.strip()
-    
-    # Add protocol if missing
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-    
-    # Validate URL format
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)', re.IGNORECASE)
-    
-    if url_pattern.match(url):
-        return True, url
-    else:
-        return False, "Please enter a valid URL (e.g., https://example.com/article)"
+# Background job runner so webhook calls never block the script thread
+@st.cache_resource
+def get_job_runner():
+    return JobRunner.from_env()
 
-# Function to display error messages with styling
-def display_error(error_type, message, suggestions=None, technical_details=None):
-    icon = "⚠️"
-    color = "#CD574C"
+# Past analyses, searchable from the sidebar and reopened without calling the webhook
+@st.cache_resource
+def get_analysis_history():
+    return AnalysisHistory.from_env()
 
-    error_html = f"""
-    <div style="margin-top: 1.5rem; color: {color};">
-        <h4 style="color: {color}; font-family: Inter; margin-bottom: 0.5rem;">{icon} {message}</h4>
-    """
-    if suggestions:
-        error_html += "<ul style='text-align: left; color: #D1D5DB; line-height: 1.6;'>"
-        for s in suggestions:
-            error_html += f"<li>{s}</li>"
-        error_html += "</ul>"
-    if technical_details:
-        error_html += f"""
-        <details style="margin-top: 1rem; text-align: left;">
-            <summary style="color: #9CA3AF; cursor: pointer; font-size: 0.9rem;">Technical Details</summary>
-            <div style="margin-top: 0.5rem; padding: 1rem; background: #272b39bf; border-radius: 8px; font-family: monospace; font-size: 0.8rem; color: #9CA3AF;">
-                {technical_details}
-            </div>
-        </details>
-        """
-    error_html += "</div>"
+# Seconds between reruns while an analysis job is running
+JOB_POLL_INTERVAL = 1.0
 
-    st.markdown(error_html, unsafe_allow_html=True)
+# Result sections, rendered one at a time
+SECTION_OVERVIEW = "📊 Overview"
+SECTION_AUDIENCE = "👤 Audience 📈 Insights"
+SECTION_CAMPAIGN = "🎯 Campaign"
+SECTION_KEYWORDS = "🔑  Keywords"
 
-# Enhanced styling with sidebar layout and tabs
-st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    .stApp {
-        background: #181c2b;
-        color: #E4E4E4;
-        font-family: 'Inter', sans-serif;
-    }
-    
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {
-        background: #272b39bf;
-        border-radius: 12px;
-        padding: 0.5rem;
-        margin-bottom: 2rem;
-        border: 1px solid #374151;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: transparent;
-        border: none;
-        color: #9CA3AF;
-        font-family: 'Inter', sans-serif;
-        font-weight: 500;
-        font-size: 0.95rem;
-        padding: 0.75rem 1.5rem;
-        border-radius: 8px;
-        margin: 0 0.25rem;
-        transition: all 0.2s ease;
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        background: #374151;
-        color: #E4E4E4;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: #8B5CF6 !important;
-        color: #FFFFFF !important;
-        font-weight: 600;
-    }
-    
-    .stTabs [data-baseweb="tab-panel"] {
-        padding: 0;
-        background: transparent;
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg, .css-1lcbmhc {
-        background: #1f2333 !important;
-        border-right: 1px solid #374151;
-    }
-    
-    .css-17lntkn {
-        background: #1f2333 !important;
-    }
-    
-    /* Main content area */
-    .main .block-container {
-        padding-top: 2rem !important;
-        padding-left: 1rem !important;
-        padding-right: 1rem !important;
-        max-width: none !important;
-    }
-    
-    .main-header {
-        text-align: center;
-        font-family: 'Inter', sans-serif;
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: #f7c3dc !important;
-        margin-bottom: 0.5rem;
-        letter-spacing: -0.02em;
-    }
-    
-    .subtitle {
-        text-align: center;
-        font-family: 'Inter', sans-serif;
-        font-size: 1rem;
-        color: #9CA3AF;
-        margin-bottom: 2rem;
-        font-weight: 400;
-    }
-    
-    .sidebar-header {
-        font-family: 'Inter', sans-serif;
-        font-size: 1.25rem;
-        font-weight: 700;
-        color: #f7c3dc !important;
-        margin-bottom: 1rem;
-        text-align: center;
-    }
-    
-    .sidebar-section {
-        background: #272b39bf;
-        border-radius: 12px;
-        margin-bottom: 1.5rem;
-    }
-    
-    .sidebar-section-title {
-        font-family: 'Inter', sans-serif;
-        font-size: 1.5rem;
-        font-weight: 600;
-        color: #CD574C;
-        margin-bottom: 1rem;
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-            
-    .st-emotion-cache-6qob1r {
-        position: relative;
-        height: 100%;
-        width: 100%;
-        overflow: overlay;
-        background-color: #181c2b;
-    }
-            
-    .st-emotion-cache-1f3w014 {
-        vertical-align: middle;
-        overflow: hidden;
-        color: inherit;
-        fill: currentcolor;
-        display: inline-flex;
-        -webkit-box-align: center;
-        align-items: center;
-        font-size: 1.5rem;
-        width: 1.5rem;
-        height: 1.5rem;
-        flex-shrink: 0;
-    }
-    
-    .section-header {
-        font-family: 'Inter', sans-serif;
-        font-size: 1.5rem;
-        font-weight: 600;
-        color: #f7c3dc;
-        margin: 2rem 0 1.5rem 0;
-        letter-spacing: -0.01em;
-    }
-    
-    .content-card {
-        background: #272b39bf;
-        border: 1px solid #2A2A3E;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 0.5rem 0;
-        transition: all 0.2s ease;
-    }
-    
-    .content-card:hover {
-        border-color: #374151;
-    }
-    
-    .card-title {
-        font-family: 'Inter', sans-serif;
-        font-size: 1.125rem;
-        font-weight: 600;
-        color: #CD574C;
-        margin-bottom: 1rem;
-        letter-spacing: -0.01em;
-    }
-    
-    .tag {
-        display: inline-flex;
-        align-items: center;
-        padding: 0.375rem 0.75rem;
-        margin: 0.25rem 0.25rem 0.25rem 0;
-        background: #8B5CF6;
-        color: #FFFFFF;
-        border-radius: 6px;
-        font-family: 'Inter', sans-serif;
-        font-size: 0.875rem;
-        font-weight: 500;
-        transition: all 0.2s ease;
-    }
-    
-    .tag:hover {
-        background: #7C3AED;
-        transform: translateY(-1px);
-    }
-    
-    .tag-secondary {
-        background: #CD574C;
-        color: #FFFFFF;
-    }
-    
-    .tag-secondary:hover {
-        background: #B8503C;
-    }
-    
-    .metric-card {
-        background: #272b39bf;
-        border: 1px solid #2A2A3E;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 0.5rem 0;
-        transition: all 0.2s ease;
-    }
-    
-    .metric-card:hover {
-        border-color: #8B5CF6;
-        box-shadow: 0 4px 12px rgba(139, 92, 246, 0.15);
-    }
-    
-    .metric-title {
-        font-family: 'Inter', sans-serif;
-        font-size: 0.875rem;
-        color: #CD574C;
-        font-weight: 500;
-        margin-bottom: 0.5rem;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-    
-    .metric-value {
-        font-family: 'Inter', sans-serif;
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: #FFFFFF;
-        line-height: 1.2;
-    }
-    
-    .campaign-preview {
-        background: linear-gradient(135deg, #272b39bf 0%, #2A2A3E 100%);
-        border: 2px solid #8B5CF6;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-    }
-    
-    /* Toggle switch styling */
-    .toggle-container {
-        background: #272b39bf;
-        border: 1px solid #8B5CF6;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-bottom: 1rem;
-        text-align: center;
-    }
-    
-    /* Campaign fields styling */
-    .campaign-fields {
-        background: linear-gradient(135deg, #272b39bf 0%, #2A2A3E 100%);
-        border: 1px solid #8B5CF6;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-top: 1rem;
-    }
-    
-    /* Streamlit component overrides */
-    .stTextInput > div > div > input {
-        background: #272b39bf !important;
-        border: 1px solid #374151 !important;
-        border-radius: 8px !important;
-        color: #FFFFFF !important;
-        font-family: 'Inter', sans-serif !important;
-        font-size: 1rem !important;
-        padding: 0.75rem 1rem !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #8B5CF6 !important;
-        box-shadow: 0 0 0 3px rgba(139, 92, 246, 0.1) !important;
-    }
-    
-    .stTextArea > div > div > textarea {
-        background: #272b39bf !important;
-        border: 1px solid #374151 !important;
-        border-radius: 8px !important;
-        color: #FFFFFF !important;
-        font-family: 'Inter', sans-serif !important;
-        font-size: 1rem !important;
-        padding: 0.75rem 1rem !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    .stTextArea > div > div > textarea:focus {
-        border-color: #8B5CF6 !important;
-        box-shadow: 0 0 0 3px rgba(139, 92, 246, 0.1) !important;
-    }
-    
-    .summary-card {
-        background: linear-gradient(135deg, #272b39bf 0%, #2A2A3E 100%);
-        border: 1px solid #374151;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-    }
-    
-    .summary-text {
-        font-family: 'Inter', sans-serif;
-        font-size: 1rem;
-        line-height: 1.6;
-        color: #D1D5DB;
-        font-weight: 400;
-    }
-    
-    .stSelectbox > div > div > select {
-        background: #272b39bf !important;
-        border: 1px solid #374151 !important;
-        border-radius: 8px !important;
-        color: #FFFFFF !important;
-        font-family: 'Inter', sans-serif !important;
-    }
-    
-    .stButton > button {
-        background: #8B5CF6 !important;
-        color: #FFFFFF !important;
-        border: none !important;
-        border-radius: 8px !important;
-        padding: 0.75rem 1.5rem !important;
-        font-family: 'Inter', sans-serif !important;
-        font-weight: 600 !important;
-        font-size: 0.875rem !important;
-        transition: all 0.2s ease !important;
-        width: 100% !important;
-    }
-    
-    .stButton > button:hover {
-        background: #7C3AED !important;
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 12px rgba(139, 92, 246, 0.4) !important;
-    }
-    
-    /* Sidebar specific button styling */
-    .css-1lcbmhc .stButton > button {
-        margin-top: 1rem !important;
-    }
-    
-    /* Hide Streamlit branding */
-    .stDeployButton {display:none;}
-    footer {visibility: hidden;}
-    .stApp > header {visibility: hidden;}
-    
-    /* Results area styling */
-    .results-container {
-        min-height: 80vh;
-        background: #181c2b;
-    }
-    
-    /* Main container for waiting state - constrained to main content area */
-    .waiting-state {
-        position: relative;
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        justify-content: center;
-        height: calc(100vh - 8rem);
-        min-height: 600px;
-        width: 100%;
-        overflow: hidden;
-        padding: 0;
-        margin: 0;
-    }
-
-    /* Video background - contained within main content area */
-    .video__bg {
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        object-fit: cover;
-        z-index: 1;
-    }
-
-    /* Content overlay - fixed positioning relative to main area */
-    .audiences-home-page__content {
-        position: fixed;
-        z-index: 10;
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        justify-content: center;
-        height: 100%;
-        width: 100%;
-        padding: 2rem;
-    }
-
-    /* Logo styling */
-    .logo__home {
-        margin-bottom: 3rem;
-        max-width: 150px;
-        height: auto;
-        z-index: 11;
-    }
-
-    /* Content wrapper */
-    .home-content__wrapper--inner {
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        justify-content: center;
-        width: 100%;
-        max-width: 800px;
-    }
-
-    .home-content__wrapper--flex {
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        gap: 2rem;
-        text-align: center;
-    }
-
-    /* Text styling - fixed and centered */
-    .home__text {
-        margin: 0;
-        padding: 1.5rem 2rem;
-        max-width: 700px;
-        text-align: center;
-        line-height: 45px;
-        letter-spacing: 12px;
-        color: #ffffff;
-        font-size: 24px !important;
-        font-weight: 700;
-        font-family: "Poppins", sans-serif;
-        background: #282b38b3;
-        backdrop-filter: blur(10px);
-        border-radius: 15px;
-        border: 1px solid rgba(255, 255, 255, 0.1);
-    }
-
-    /* CTA wrapper */
-    .home-content__cta__wrapper {
-        display: flex;
-        justify-content: center;
-        margin-top: 1rem;
-    }
+def show_analysis_result(result, stale_age, processed_url, campaign_definition="", vertical=""):
+    st.session_state.pending_job = None
+    st.session_state.analysis_results = result
+    st.session_state.analysis_url = processed_url
+    st.session_state.stale_age = stale_age
+    st.session_state.analysis_complete = True
+    st.session_state.fallback_keywords = None
+    # Stale fallbacks are older analyses, not new ones
+    if stale_age is None:
+        get_analysis_history().record(processed_url, result, campaign_definition, vertical)
 
-    /* Button styling - fixed positioning */
-    .button.home-content__cta {
-        background: rgba(0, 0, 0, 0.2);
-        border: 2px solid #ffffff;
-        color: #ffffff;
-        padding: 15px 30px;
-        font-family: 'Inter', sans-serif;
-        font-size: 1rem;
-        font-weight: 500;
-        border-radius: 30px;
-        cursor: pointer;
-        transition: all 0.3s ease;
-        text-decoration: none;
-        display: inline-block;
-        backdrop-filter: blur(10px);
-    }
+def reopen_history_entry(entry_id):
+    loaded = get_analysis_history().load(entry_id)
+    if loaded is None:
+        return
+    entry, result = loaded
+    st.session_state.pending_job = None
+    st.session_state.analysis_results = result
+    st.session_state.analysis_url = entry.url
+    st.session_state.stale_age = None
+    st.session_state.analysis_complete = True
+    st.session_state.fallback_keywords = None
+    st.session_state.campaign_analysis = bool(entry.campaign_definition)
 
-    .button.home-content__cta:hover {
-        background: #ffffff;
-        color: #000000;
-        transform: translateY(-2px);
-        box-shadow: 0 5px 15px rgba(255, 255, 255, 0.2);
+def request_full_analysis(processed_url):
+    """Send a locally scored URL to the workflow, skipping the cascade"""
+    job_id = get_job_runner().submit_streaming(get_analysis_engine().fetch_or_stale, processed_url, full_analysis=True)
+    st.session_state.pending_job = {
+        'id': job_id,
+        'url': processed_url,
+        'campaign_definition': "",
+        'vertical': ""
     }
 
-    /* Ensure main content area doesn't scroll when video is playing */
-    .main .block-container {
-        padding-top: 1rem !important;
-    }
-    section.stSidebar.st-emotion-cache {
-        background-color: rgb(35 39 54);
-    }
-            
-    .st-emotion-cache-1xulwhk {
-        font-family: 'Inter', sans-serif;
-        font-size: 1rem;
-        font-weight: 600;
-        color: #CD574C;
-        margin-bottom: 1rem;
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-    .st-emotion-cache-p7i6r9 {
-        font-family: "Source Sans Pro", sans-serif;
-        font-size: 1rem;
-        color: rgb(253 253 253);
-        font-weight: 900;
-    }
-     
-    .st-emotion-cache-169dgwr {
-        z-index: 999990;
-        color: rgb(255 255 255 / 60%);
-        margin-top: 0.25rem;
-    }
-            
-    .st-emotion-cache-1f3w014 {
-        vertical-align: middle;
-        overflow: hidden;
-        color: inherit;
-        fill: rgb(205 87 76);
-        display: inline-flex;
-        -webkit-box-align: center;
-        align-items: center;
-        font-size: 5rem;
-        width: 1.5rem;
-        height: 1.5rem;
-        flex-shrink: 0;
-    }
-    .st-emotion-cache-102y9h7 {
-        font-family: "Source Sans Pro", sans-serif;
-        font-size: 1rem;
-        margin-bottom: -1rem;
-        color: #cd574c;
-    }         
-    [data-testid="stSidebar"],
-    [data-testid="stSidebar"] > div,
-    .stApp section[data-testid="stSidebar"],
-    .stApp section[data-testid="stSidebar"] > div {
-        background-color: rgb(35, 39, 54) !important;
-        border-right: 1px solid #374151 !important;
-    }
-
-    /* Force all sidebar content to have correct background */
-
-    [data-testid="stSidebar"] > div > div {
-        background-color: rgb(35, 39, 54) !important;
-    }       
-    [data-testid="stWidgetLabel"] * {
-        color: #ffc8c8 !important;
-    }
-
-    </style>
-""", unsafe_allow_html=True)
-
-# All your existing chart functions (keep these unchanged)
-def create_age_chart(demographics):
-    if not demographics:
-        return None
-    
-    age_distribution = demographics.get('age_distribution', {})
-    if not age_distribution:
-        return None
-    
-    # Filter out zero values
-    filtered_age_dist = {k: v for k, v in age_distribution.items() if v > 0}
-    if not filtered_age_dist:
-        return None
-    
-    age_groups = list(filtered_age_dist.keys())
-    percentages = list(filtered_age_dist.values())
-    
-    # Create vibrant color palette for age groups
-    colors = ['#f7c3dc', '#CD574C', '#8B5CF6', '#10B981', '#F59E0B', '#EF4444', '#06B6D4', '#84CC16'][:len(age_groups)]
-    
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        x=age_groups,
-        y=percentages,
-        marker=dict(
-            color=colors,
-            line=dict(color='rgba(255,255,255,0.2)', width=1)
-        ),
-        text=[f"{p}%" for p in percentages],
-        textposition='auto',
-        textfont=dict(color="#FFFFFF", size=12, family="Inter")
-    ))
-    
-    fig.update_layout(
-        title="Real-Time Age Distribution",
-        title_font=dict(color="#f7c3dc", family="Inter", size=16),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color="#9CA3AF", family="Inter"),
-        xaxis=dict(
-            gridcolor='rgba(75, 85, 99, 0.3)',
-            tickfont=dict(color="#9CA3AF", family="Inter")
-        ),
-        yaxis=dict(
-            gridcolor='rgba(75, 85, 99, 0.3)',
-            tickfont=dict(color="#9CA3AF", family="Inter")
-        ),
-        showlegend=False,
-        height=350,
-        margin=dict(l=40, r=40, t=60, b=40)
-    )
-    
-    return fig
-
-def create_gender_chart(demographics):
-    if not demographics:
-        return None
-    
-    gender_distribution = demographics.get('gender_distribution', {})
-    if not gender_distribution:
-        return None
-    
-    genders = list(gender_distribution.keys())
-    values = list(gender_distribution.values())
-    display_labels = [gender.capitalize() for gender in genders]
-    
-    fig = go.Figure()
-    fig.add_trace(go.Pie(
-        labels=display_labels,
-        values=values,
-        hole=0.6,
-        marker=dict(
-            colors=['#f7c3dc', '#CD574C'],
-            line=dict(color='#272b39', width=2)
-        ),
-        textfont=dict(color="#FFFFFF", family="Inter", size=12),
-        textinfo='label+percent'
-    ))
-    
-    fig.update_layout(
-        title="Real-Time Gender Distribution",
-        title_font=dict(color="#f7c3dc", family="Inter", size=16),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color="#9CA3AF", family="Inter"),
-        showlegend=False,
-        height=350,
-        margin=dict(l=40, r=40, t=60, b=40)
-    )
-    
-    return fig
-
-def create_intentionality_chart(intentionality_data):
-    if not intentionality_data:
-        return None
-    
-    # Filter out zero values
-    filtered_data = {k: v for k, v in intentionality_data.items() if v > 0}
-    if not filtered_data:
-        return None
-    
-    intent_types = [k.capitalize() for k in filtered_data.keys()]
-    values = list(filtered_data.values())
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(
-        r=values,
-        theta=intent_types,
-        fill='toself',
-        marker=dict(color='#f7c3dc', size=6),
-        line=dict(color='#CD574C', width=2),
-        fillcolor='rgba(247, 195, 220, 0.2)',
-        name='Intent Distribution'
-    ))
-    
-    fig.update_layout(
-        title="Intent Breakdown",
-        title_font=dict(color="#f7c3dc", family="Inter", size=16),
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, max(values) + 10] if values else [0, 100],
-                gridcolor='rgba(75, 85, 99, 0.3)',
-                tickfont=dict(color="#9CA3AF", family="Inter", size=10)
-            ),
-            angularaxis=dict(
-                gridcolor='rgba(75, 85, 99, 0.3)',
-                tickfont=dict(color="#9CA3AF", family="Inter", size=11)
-            )
-        ),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        showlegend=False,
-        height=350,
-        margin=dict(l=40, r=40, t=60, b=40)
-    )
-    
-    return fig
+def show_analysis_error(error, processed_url, campaign_definition="", vertical=""):
+    if isinstance(error, AnalysisError):
+        display_error(
+            error_type=error.error_type,
+            message=error.message,
+            suggestions=error.suggestions,
+            technical_details=error.technical_details or f"URL: {processed_url}" + (f"\nCampaign: {campaign_definition}\nVertical: {vertical}" if campaign_definition else "")
+        )
+    else:
+        display_error(
+            error_type="parse_error",
+            message="Failed to process the analysis results",
+            suggestions=["Try analyzing the article again", "Check if the URL is accessible"],
+            technical_details=f"Parse error: {str(error)}"
+        )
 
-def create_keyword_chart(primary_kw, secondary_kw):
-    if not primary_kw and not secondary_kw:
-        return None
-    
-    labels = primary_kw + secondary_kw
-    values = [90] * len(primary_kw) + [60] * len(secondary_kw)
-    colors = ['#f7c3dc'] * len(primary_kw) + ['#CD574C'] * len(secondary_kw)
-    
-    fig = go.Figure(data=[go.Pie(
-        labels=labels,
-        values=values,
-        hole=0.6,
-        marker=dict(colors=colors, line=dict(color='#272b39', width=2)),
-        textfont=dict(color="#ffffff", family="Inter", size=11),
-        textinfo='label+percent'
-    )])
-    
-    fig.update_layout(
-        title="Keyword Distribution",
-        title_font=dict(color="#f7c3dc", family="Inter", size=16),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color="#9CA3AF", family="Inter"),
-        showlegend=True,
-        legend=dict(
-            font=dict(color="#ffffff"),
-            orientation="h",
-            yanchor="bottom",
-            y=-0.2,
-            xanchor="center",
-            x=0.5
-        ),
-        height=400,
-        margin=dict(l=40, r=40, t=60, b=60)
-    )
-    
-    return fig
+# Overview cards filled in as streamed sections of a running analysis arrive.
+# `partial` holds the raw sections; the result is validated once it is complete.
+def render_progressive_overview(partial):
+    pending = '<span style="color: #6B7280;">analyzing…</span>'
+    st.markdown('<h2 class="section-header">📊 Content Intelligence Overview</h2>', unsafe_allow_html=True)
 
-# Performance calculation functions (keep your existing ones)
-def calculate_intent_accuracy(result):
-    intention = result.get('intention', {})
-    confidence = intention.get('confidence', 'low')
-    confidence_accuracy = {'high': 85, 'medium': 70, 'low': 50}
-    accuracy = confidence_accuracy.get(confidence, 85)
-    
-    intentionality = result.get('intentionality_breakdown', {})
-    if intentionality and any(val > 0 for val in intentionality.values()):
-        accuracy += 10
-    
-    return min(accuracy, 99)
+    intention = partial.get('intention', {})
+    intent_subtitle = intention.get('confidence', '')
+    # The local intent model's prediction stands in until the workflow's arrives
+    local_intent = partial.get(LOCAL_INTENT_SECTION)
+    if not intention and local_intent:
+        intention = local_intent['intention']
+        intent_subtitle = f"local preview · score {local_intent['intentionality_score']}"
+    category = partial.get('tier1_category')
+    category_subtitle = ""
+    local_category = partial.get(LOCAL_CATEGORY_SECTION)
+    if not category and local_category:
+        category = local_category['tier1_category']
+        category_subtitle = "local preview"
+    demographics = partial.get('audience_profile', {}).get('demographics', {})
+    cards = [
+        ("Intent", intention.get('primary', '').title() or pending, intent_subtitle),
+        ("Category", category or pending, category_subtitle),
+        ("Age Range", demographics.get('age_range') or pending, ""),
+        ("Income Range", demographics.get('income_range') or pending, ""),
+    ]
+    for col, (title, value, subtitle) in zip(st.columns(len(cards)), cards):
+        with col:
+            st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-title">{title}</div>
+                    <div class="metric-value">{value}</div>
+                    <div class="metric-subtitle"><span style="color: #9CA3AF;">{subtitle}</span></div>
+                </div>
+            """, unsafe_allow_html=True)
 
-def calculate_intentionality_score(result):
-    intentionality = result.get('intentionality_breakdown', {})
-    intention = result.get('intention', {})
-    confidence = intention.get('confidence', 'medium')
-    
-    if not intentionality:
-        return 0
-    
-    intent_weights = {
-        'transactional': 95,
-        'commercial': 75,
-        'navigational': 45,
-        'informational': 15
-    }
-    
-    weighted_score = 0
-    for intent_type, percentage in intentionality.items():
-        weight = intent_weights.get(intent_type.lower(), 0)
-        weighted_score += (percentage / 100) * weight
-    
-    confidence_multipliers = {
-        'high': 1.0,
-        'medium': 0.85,
-        'low': 0.7
-    }
-    
-    confidence_multiplier = confidence_multipliers.get(confidence, 0.85)
-    final_score = weighted_score * confidence_multiplier
-    
-    return min(round(final_score), 100)
+    if 'summary_rationale' in partial:
+        st.markdown('<h3 class="section-header">📝 Summary</h3>', unsafe_allow_html=True)
+        st.markdown(f"""
+            <div class="summary-card">
+                <div class="summary-text">{partial['summary_rationale']}</div>
+            </div>
+        """, unsafe_allow_html=True)
 
-def calculate_final_intention_score(result, campaign_relevancy=None):
-    """
-    Calculate the final intention score based on:
-    - 80% Campaign Fit Score (if available)
-    - 20% Action Intent Score
-    
-    If campaign analysis is disabled, returns only the Action Intent Score
-    """
-    # Get the action intent score (intentionality score)
-    action_intent_score = calculate_intentionality_score(result)
-    
-    # If no campaign data, return just the action intent score
-    if not campaign_relevancy:
-        return action_intent_score, "action_only"
-    
-    # Get campaign fit score
-    campaign_fit_score = campaign_relevancy.get('overall_relevancy_score', 0)
-    
-    # Calculate weighted final score: 80% campaign fit + 20% action intent
-    final_score = (campaign_fit_score * 0.8) + (action_intent_score * 0.2)
-    
-    return round(final_score), "combined"
+    intentionality_data = partial.get('intentionality_breakdown') or (local_intent or {}).get('intentionality_breakdown', {})
+    if intentionality_data:
+        intent_chart = create_intentionality_chart(intentionality_data)
+        if intent_chart:
+            st.plotly_chart(intent_chart, use_container_width=True)
 
-def get_final_intention_grade(score, score_type="combined"):
-    """
-    Get grade and description for the final intention score
-    """
-    if score_type == "action_only":
-        prefix = "Action Intent: "
-    else:
-        prefix = "Overall Intent: "
-    
-    if score >= 90:
-        return "A+", f"{prefix}Exceptional"
-    elif score >= 80:
-        return "A", f"{prefix}Excellent"
-    elif score >= 70:
-        return "B+", f"{prefix}Very Good"
-    elif score >= 60:
-        return "B", f"{prefix}Good"
-    elif score >= 50:
-        return "C+", f"{prefix}Fair"
-    elif score >= 40:
-        return "C", f"{prefix}Below Average"
-    elif score >= 30:
-        return "D", f"{prefix}Poor"
-    else:
-        return "F", f"{prefix}Very Poor"
+    # Keywords extracted locally from the page stand in until the workflow's arrive
+    keywords = partial.get('primary_keywords', [])
+    keywords_title = "Primary Keywords"
+    if not keywords and partial.get(LOCAL_KEYWORDS_SECTION):
+        keywords = partial[LOCAL_KEYWORDS_SECTION]['primary']
+        keywords_title = "Primary Keywords (local preview)"
+    if keywords:
+        st.markdown(f"""
+            <div class="content-card">
+                <div class="card-title">{keywords_title}</div>
+                <div style="margin-top: 1rem;">
+                    {''.join(f'<span class="tag">{keyword}</span>' for keyword in keywords)}
+                </div>
+            </div>
+        """, unsafe_allow_html=True)
 
-def get_intentionality_grade(score):
-    if score >= 85:
-        return "A+", "Very High Action Intent"
-    elif score >= 75:
-        return "A", "High Action Intent"
-    elif score >= 65:
-        return "B+", "Good Action Intent"
-    elif score >= 55:
-        return "B", "Moderate Action Intent"
-    elif score >= 45:
-        return "C+", "Some Action Intent"
-    elif score >= 35:
-        return "C", "Low Action Intent"
-    elif score >= 25:
-        return "D", "Very Low Action Intent"
-    else:
-        return "F", "Minimal Action Intent"
+# Keywords extracted locally from the page, shown when the full analysis failed
+def render_fallback_keywords(keywords):
+    st.markdown('<h2 class="section-header">🔑 Keywords found on the page</h2>', unsafe_allow_html=True)
+    st.caption("The full analysis failed; these keywords were extracted locally from the article text.")
+    keyword_chart = create_keyword_chart(keywords['primary'], keywords['secondary'])
+    if keyword_chart:
+        st.plotly_chart(keyword_chart, use_container_width=True)
+    st.markdown(f"""
+        <div class="content-card">
+            <div style="margin-top: 1rem;">
+                {''.join(f'<span class="tag">{keyword}</span>' for keyword in keywords['primary'] + keywords['secondary'])}
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
 
-def calculate_content_score(result):
-    score = 0
-    confidence = result.get('intention', {}).get('confidence', 'Low')
-    confidence_scores = {'high': 40, 'medium': 30, 'low': 20}
-    score += confidence_scores.get(confidence, 20)
-    
-    primary_kw = len(result.get('primary_keywords', []))
-    secondary_kw = len(result.get('secondary_keywords', []))
-    keyword_score = min((primary_kw * 3 + secondary_kw * 2), 20)
-    score += keyword_score
-    
-    tier2_categories = result.get('tier2_categories', [])
-    category_score = min(len(tier2_categories) * 5, 15)
-    score += category_score
-    
-    audience_types = result.get('audience_profile', {}).get('type', [])
-    interest_groups = result.get('audience_profile', {}).get('interest_groups', [])
-    audience_score = min((len(audience_types) * 3 + len(interest_groups) * 2), 15)
-    score += audience_score
-    
-    return min(score, 100)
+# Enhanced styling with sidebar layout and tabs
+inject_app_styles()
 
 # Initialize session state
 if 'campaign_analysis' not in st.session_state:
@@ -943,24 +195,70 @@ if 'analysis_complete' not in st.session_state:
     st.session_state.analysis_complete = False
 if 'analysis_results' not in st.session_state:
     st.session_state.analysis_results = None
+if 'analysis_url' not in st.session_state:
+    st.session_state.analysis_url = None
+if 'batch_request' not in st.session_state:
+    st.session_state.batch_request = None
+if 'batch_rows' not in st.session_state:
+    st.session_state.batch_rows = []
+if 'pending_job' not in st.session_state:
+    st.session_state.pending_job = None
+if 'stale_age' not in st.session_state:
+    st.session_state.stale_age = None
+if 'fallback_keywords' not in st.session_state:
+    st.session_state.fallback_keywords = None
+
+# Sections received so far from a running (streamed) analysis
+partial_result = None
 
 # SIDEBAR - Input Section (20% width)
 with st.sidebar:
     st.markdown('<h2 class="sidebar-header">🔮 Article Analyzer</h2>', unsafe_allow_html=True)
     
-    # URL Input Section
-    st.markdown("""
-        <div class="sidebar-section">
-            <div class="sidebar-section-title">📄 Article URL</div>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    url = st.text_input(
-        "Enter article URL",
-        placeholder="https://example.com/article",
-        help="Enter the full URL of the article you want to analyze",
+    # Single URL or batch mode
+    analysis_mode = st.radio(
+        "Analysis mode",
+        options=["Single URL", "Batch"],
+        horizontal=True,
         label_visibility="collapsed"
     )
+    batch_mode = analysis_mode == "Batch"
+    
+    url = ""
+    if batch_mode:
+        # Batch URL Input Section
+        st.markdown("""
+            <div class="sidebar-section">
+                <div class="sidebar-section-title">📚 Article URLs</div>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        batch_text = st.text_area(
+            "Article URLs",
+            placeholder="https://example.com/article-1\nhttps://example.com/article-2",
+            help="Paste one URL per line",
+            height=150,
+            label_visibility="collapsed"
+        )
+        batch_file = st.file_uploader(
+            "Or upload a CSV",
+            type=["csv"],
+            help="Uses the 'url' column, or the first column when there is no header"
+        )
+    else:
+        # URL Input Section
+        st.markdown("""
+            <div class="sidebar-section">
+                <div class="sidebar-section-title">📄 Article URL</div>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        url = st.text_input(
+            "Enter article URL",
+            placeholder="https://example.com/article",
+            help="Enter the full URL of the article you want to analyze",
+            label_visibility="collapsed"
+        )
     
     # Campaign Toggle Section
     st.markdown("""
@@ -999,6 +297,31 @@ with st.sidebar:
             help="Select the primary industry/vertical for your campaign"
         )
     
+    # Batch controls
+    if batch_mode:
+        max_workers = st.slider(
+            "Concurrent requests",
+            min_value=1, max_value=32, value=DEFAULT_MAX_WORKERS,
+            help="Number of articles analyzed in parallel"
+        )
+        per_host_limit = st.slider(
+            "Max concurrent requests per site",
+            min_value=1, max_value=8, value=DEFAULT_PER_HOST_LIMIT,
+            help="Caps parallel requests for articles from the same website"
+        )
+        batch_urls = parse_url_list(batch_text, batch_file)
+        batch_disabled = not batch_urls or (st.session_state.campaign_analysis and (not campaign_definition or not vertical))
+        
+        if st.button(f"🔍 Analyze {len(batch_urls)} Articles", disabled=batch_disabled, use_container_width=True):
+            st.session_state.batch_rows = []
+            st.session_state.batch_request = {
+                'urls': batch_urls,
+                'campaign_definition': campaign_definition,
+                'vertical': vertical,
+                'max_workers': max_workers,
+                'per_host_limit': per_host_limit
+            }
+    
     # Dynamic Analyze Button
     if st.session_state.campaign_analysis:
         button_text = "🔍 Analyze Article & Campaign Relevancy"
@@ -1008,7 +331,7 @@ with st.sidebar:
         button_disabled = not url
     
     # Analyze button
-    if st.button(button_text, disabled=button_disabled, use_container_width=True):
+    if not batch_mode and st.button(button_text, disabled=button_disabled, use_container_width=True):
         # Validate URL format
         is_valid, processed_url = is_valid_url(url)
         if not is_valid:
@@ -1016,135 +339,87 @@ with st.sidebar:
         else:
             # Start analysis
             st.session_state.analysis_complete = False
+            st.session_state.fallback_keywords = None
             
-            # Show appropriate spinner message
-            spinner_message = "🔮 Liz - Analyzing content and campaign relevancy..." if st.session_state.campaign_analysis else "🔮 Liz - Analyzing article content..."
+            # Repeat lookups are served straight from the shared result cache
+            analysis_engine = get_analysis_engine()
+            cached_result = analysis_engine.cached(processed_url, campaign_definition, vertical)
+            if cached_result is not None:
+                show_analysis_result(cached_result, None, processed_url, campaign_definition, vertical)
+                st.rerun()
             
-            with st.spinner(spinner_message):
+            if analysis_engine.fails_fast():
+                # Webhook is down: answer immediately with an older cached result or the error
+                st.session_state.pending_job = None
                 try:
-                    # API endpoints
-                    n8n_webhook_url_basic = "https://rajkpillai.app.n8n.cloud/webhook/contextual-engine-test"
-                    n8n_webhook_url_campaign = "https://rajkpillai.app.n8n.cloud/webhook/contextual-engine-test"
-                    
-                    # Choose API endpoint and payload based on toggle
-                    if st.session_state.campaign_analysis:
-                        # Campaign analysis enabled
-                        api_url = n8n_webhook_url_campaign
-                        params = {
-                            'url': processed_url,
-                            'campaign_definition': campaign_definition,
-                            'vertical': vertical
-                        }
-                        encoded_params = urlencode(params)
-                        full_api_url = f"{api_url}?{encoded_params}"
-                        
-                        # Try GET first, then POST
-                        response = requests.get(full_api_url, timeout=90)
-                        
-                        if response.status_code == 200:
-                            try:
-                                result_data = response.json()
-                                
-                                # Handle error responses
-                                if isinstance(result_data, list) and len(result_data) > 0 and "error" in result_data[0]:
-                                    result = result_data[0]
-                                    display_error(
-                                        error_type=result.get("error_type", "api_error"),
-                                        message=result.get("message", "An error occurred during analysis."),
-                                        suggestions=result.get("suggestions", []),
-                                        technical_details=f"URL: {processed_url}" + (f"\nCampaign: {campaign_definition}\nVertical: {vertical}" if st.session_state.campaign_analysis else "")
-                                    )
-                                else:
-                                    if isinstance(result_data, list):
-                                        result = result_data[0]
-                                    else:
-                                        result = result_data
-                                    
-                                    # Store results in session state
-                                    st.session_state.analysis_results = result
-                                    st.session_state.analysis_complete = True
-                                    st.rerun()
-                                    
-                            except Exception as e:
-                                display_error(
-                                    error_type="parse_error",
-                                    message="Failed to process the analysis results",
-                                    suggestions=["Try analyzing the article again", "Check if the URL is accessible"],
-                                    technical_details=f"Parse error: {str(e)}"
-                                )
-                        else:
-                            display_error(
-                                error_type="api_request_failed",
-                                message=f"API request failed with status code {response.status_code}",
-                                suggestions=[
-                                    "Check your internet connection",
-                                    "Try again in a few moments",
-                                    "Verify the URL is accessible"
-                                ],
-                                technical_details=f"Response: {response.text[:500]}"
-                            )
-                    else:
-                        api_url = n8n_webhook_url_campaign
-                        params = {
-                            'url': processed_url
-                        }
-                        encoded_params = urlencode(params)
-                        full_api_url = f"{api_url}?{encoded_params}"
-                        
-                        # Try GET first, then POST
-                        response = requests.get(full_api_url, timeout=90)
-                        
-                        if response.status_code == 200:
-                            try:
-                                result_data = response.json()
-                                
-                                # Handle error responses
-                                if isinstance(result_data, list) and len(result_data) > 0 and "error" in result_data[0]:
-                                    result = result_data[0]
-                                    display_error(
-                                        error_type=result.get("error_type", "api_error"),
-                                        message=result.get("message", "An error occurred during analysis."),
-                                        suggestions=result.get("suggestions", []),
-                                        technical_details=f"URL: {processed_url}" + (f"\nCampaign: {campaign_definition}\nVertical: {vertical}" if st.session_state.campaign_analysis else "")
-                                    )
-                                else:
-                                    if isinstance(result_data, list):
-                                        result = result_data[0]
-                                    else:
-                                        result = result_data
-                                    
-                                    # Store results in session state
-                                    st.session_state.analysis_results = result
-                                    st.session_state.analysis_complete = True
-                                    st.rerun()
-                                    
-                            except Exception as e:
-                                display_error(
-                                    error_type="parse_error",
-                                    message="Failed to process the analysis results",
-                                    suggestions=["Try analyzing the article again", "Check if the URL is accessible"],
-                                    technical_details=f"Parse error: {str(e)}"
-                                )
-                        else:
-                            display_error(
-                                error_type="api_request_failed",
-                                message=f"API request failed with status code {response.status_code}",
-                                suggestions=[
-                                    "Check your internet connection",
-                                    "Try again in a few moments",
-                                    "Verify the URL is accessible"
-                                ],
-                                technical_details=f"Response: {response.text[:500]}"
-                            )
+                    result, stale_age = analysis_engine.fetch_or_stale(processed_url, campaign_definition, vertical)
+                except AnalysisError as e:
+                    show_analysis_error(e, processed_url, campaign_definition, vertical)
+                else:
+                    show_analysis_result(result, stale_age, processed_url, campaign_definition, vertical)
+                    st.rerun()
+            else:
+                # Otherwise run the webhook call in the background and poll for it
+                job_id = get_job_runner().submit_streaming(analysis_engine.fetch_or_stale, processed_url, campaign_definition, vertical)
+                st.session_state.pending_job = {
+                    'id': job_id,
+                    'url': processed_url,
+                    'campaign_definition': campaign_definition,
+                    'vertical': vertical
+                }
+    
+    # Poll the running analysis job
+    pending_job = st.session_state.pending_job
+    if pending_job:
+        job = get_job_runner().get(pending_job['id'])
+        if job is None:
+            st.session_state.pending_job = None
+        elif not job.done:
+            spinner_message = "🔮 Liz - Analyzing content and campaign relevancy..." if pending_job['campaign_definition'] else "🔮 Liz - Analyzing article content..."
+            st.info(f"{spinner_message} ({job.elapsed:.0f}s)")
+            partial_result = dict(job.partial)
+        else:
+            st.session_state.pending_job = None
+            get_job_runner().discard(job.id)
+            if job.error is not None:
+                st.session_state.fallback_keywords = job.partial.get(LOCAL_KEYWORDS_SECTION)
+                show_analysis_error(job.error, pending_job['url'], pending_job['campaign_definition'], pending_job['vertical'])
+            else:
+                # Store results in session state
+                result, stale_age = job.result
+                show_analysis_result(result, stale_age, pending_job['url'], pending_job['campaign_definition'], pending_job['vertical'])
+                st.rerun()
+    
+    # History of past analyses, reopened from the local store
+    with st.expander("🕘 History"):
+        analysis_history = get_analysis_history()
+        history_query = st.text_input(
+            "Search history",
+            placeholder="URL or keyword",
+            label_visibility="collapsed"
+        )
+        history_category = st.selectbox("Category", options=["All"] + analysis_history.categories())
+        history_intent = st.selectbox("Intent", options=["All"] + analysis_history.intents(), format_func=str.title)
+        history_min_score = st.slider("Minimum intention score", min_value=0, max_value=100, value=0, step=5)
+
+        history_entries = analysis_history.search(
+            history_query,
+            category=None if history_category == "All" else history_category,
+            intent=None if history_intent == "All" else history_intent,
+            min_score=history_min_score
+        )
+        if not history_entries:
+            st.caption("No past analyses match")
+        for entry in history_entries:
+            st.button(
+                f"{entry.final_score} {entry.final_grade} · {entry.tier1_category or 'Unknown'}\n\n{entry.url}",
+                key=f"history_{entry.id}",
+                help=f"{entry.primary_intent.title()} intent · analyzed {time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.analyzed_at))}",
+                on_click=reopen_history_entry,
+                args=(entry.id,),
+                use_container_width=True
+            )
 
-                except Exception as e:
-                    display_error(
-                        error_type="parse_error",
-                        message="Failed to process the analysis results",
-                        suggestions=["Try analyzing the article again", "Check if the URL is accessible"],
-                        technical_details=f"Parse error: {str(e)}"
-                    )
-    
     # Help section
     st.markdown("""
         <div class="sidebar-section" style="margin-top: 2rem;">
@@ -1156,17 +431,93 @@ with st.sidebar:
             </div>
         </div>
     """, unsafe_allow_html=True)
+    
+    # Cache statistics for sizing the shared result store
+    with st.expander("⚡ Result Cache"):
+        cache_stats = get_analysis_engine().cache.stats()
+        inflight_stats = get_analysis_engine().inflight.stats()
+        st.caption(
+            f"Entries: {cache_stats['entries']}/{cache_stats['max_entries']} · "
+            f"Hits: {cache_stats['hits']} · Misses: {cache_stats['misses']} · "
+            f"Hit rate: {cache_stats['hit_rate']:.0%}"
+        )
+        st.caption(f"Evictions: {cache_stats['evictions']} · Expirations: {cache_stats['expirations']}")
+        st.caption(f"Webhook calls: {inflight_stats['executions']} · Shared with concurrent requests: {inflight_stats['coalesced']}")
+        circuit_stats = get_analysis_engine().breaker.stats()
+        if circuit_stats['state'] != 'closed':
+            st.caption(f"🔴 Webhook circuit {circuit_stats['state'].replace('_', '-')} · retry in {circuit_stats['retry_in']:.0f}s · rejected: {circuit_stats['rejected']}")
+        endpoint_stats = get_analysis_engine().client.endpoints.stats()
+        if len(endpoint_stats) > 1:
+            for endpoint in endpoint_stats:
+                latency = f"{endpoint['latency']:.1f}s" if endpoint['latency'] is not None else "n/a"
+                status = "🟢" if endpoint['healthy'] else "🔴"
+                st.caption(f"{status} {endpoint['url']} · p50 {latency} · errors {endpoint['error_rate']:.0%}")
+
+    # Where end-to-end time goes: article fetch, extraction, local models, webhook
+    stage_timings = get_analysis_engine().timings.summary()
+    if stage_timings:
+        with st.expander("⏱ Stage Timings"):
+            for stage, figures in stage_timings.items():
+                st.caption(
+                    f"{stage}: p50 {figures['p50_ms']:.0f} ms · p95 {figures['p95_ms']:.0f} ms · "
+                    f"{figures['share']:.0%} of time · {figures['count']} runs"
+                )
 
 # MAIN CONTENT AREA - Results Section (80% width)
 # Results Container
-if not st.session_state.analysis_complete or st.session_state.analysis_results is None:
+if batch_mode:
+    st.markdown('<h2 class="section-header">📚 Batch Analysis</h2>', unsafe_allow_html=True)
+    
+    table_placeholder = st.empty()
+    batch_request = st.session_state.batch_request
+    
+    if batch_request:
+        st.session_state.batch_request = None
+        batch_urls = batch_request['urls']
+        analysis_engine = get_analysis_engine()
+        
+        def analyze_url(raw_url):
+            return analysis_engine.analyze_url(raw_url, batch_request['campaign_definition'], batch_request['vertical'])
+        
+        progress = st.progress(0.0, text=f"🔮 Liz - Analyzing {len(batch_urls)} articles...")
+        rows = []
+        for completed, outcome in enumerate(run_batch(batch_urls, analyze_url, batch_request['max_workers'], batch_request['per_host_limit']), start=1):
+            rows.append(build_batch_row(outcome, bool(batch_request['campaign_definition'])))
+            if outcome.error is None:
+                get_analysis_history().record(
+                    canonicalize_url(outcome.url), outcome.result, batch_request['campaign_definition'], batch_request['vertical']
+                )
+            progress.progress(completed / len(batch_urls), text=f"🔮 Liz - {completed}/{len(batch_urls)} articles analyzed")
+            table_placeholder.dataframe(rows, use_container_width=True, hide_index=True)
+        
+        progress.empty()
+        st.session_state.batch_rows = rows
+    
+    batch_rows = st.session_state.batch_rows
+    if batch_rows:
+        table_placeholder.dataframe(batch_rows, use_container_width=True, hide_index=True)
+        failed = sum(1 for row in batch_rows if row["Error"])
+        local = sum(1 for row in batch_rows if row["Path"] == PATH_LOCAL)
+        caption = f"{len(batch_rows) - failed} analyzed · {failed} failed"
+        if local:
+            caption += f" · {local} scored locally ({local / len(batch_rows):.0%} fewer LLM calls)"
+        st.caption(caption)
+        st.download_button(
+            "⬇️ Download results as CSV",
+            data=batch_rows_to_csv(batch_rows),
+            file_name="liz_batch_analysis.csv",
+            mime="text/csv"
+        )
+    else:
+        table_placeholder.info("Paste article URLs or upload a CSV in the sidebar, then click Analyze.")
+elif partial_result:
+    render_progressive_overview(partial_result)
+elif st.session_state.fallback_keywords and not st.session_state.analysis_complete:
+    render_fallback_keywords(st.session_state.fallback_keywords)
+elif not st.session_state.analysis_complete or st.session_state.analysis_results is None:
     # Waiting state
-    st.markdown("""
-        <div class="waiting-state">
-            <video loop autoplay muted class="video__bg">
-                <source src="https://lizos.seedtag.com/assets/videos/loop_videos/red_network/red_network_loop.webm" type="video/webm">
-                Your browser does not support the video tag.
-            </video>
+    st.markdown(f"""
+        <div class="waiting-state">{waiting_background_html()}
             <div class="audiences-home-page__content">
                 <div class="home-content__wrapper--inner">
                     <div class="home-content__wrapper--flex">
@@ -1182,29 +533,48 @@ if not st.session_state.analysis_complete or st.session_state.analysis_results i
 else:
     # Display results with tabs
     result = st.session_state.analysis_results
+    if st.session_state.stale_age is not None:
+        st.warning(
+            f"⚠️ The analysis service is unavailable, so this is a cached result from "
+            f"{st.session_state.stale_age / 3600:.1f} hours ago. Analyze again later for a fresh result."
+        )
+    if analysis_path(result) == PATH_LOCAL:
+        st.info(
+            f"⚡ Scored by the local models (confidence {result.analysis_metadata.get('local_confidence', 0):.0%}) "
+            "without calling the analysis service, so audience and summary sections are empty."
+        )
+        st.button(
+            "🔁 Run full analysis",
+            on_click=request_full_analysis,
+            args=(st.session_state.analysis_url,),
+            disabled=st.session_state.analysis_url is None or st.session_state.pending_job is not None
+        )
     
     # Create dynamic tab list based on campaign analysis toggle
-    tab_list = ["📊 Overview", "👤 Audience 📈 Insights", "🔑  Keywords",]
+    tab_list = [SECTION_OVERVIEW, SECTION_AUDIENCE, SECTION_KEYWORDS]
     
     # Add campaign tab if campaign analysis is enabled and data exists
-    campaign_relevancy = result.get('campaign_relevancy', {})
+    campaign_relevancy = result.campaign_relevancy
     if st.session_state.campaign_analysis and campaign_relevancy:
-        tab_list.insert(2, "🎯 Campaign")
+        tab_list.insert(2, SECTION_CAMPAIGN)
     
-    # Create tabs
-    tabs = st.tabs(tab_list)
+    # Section picker styled as tabs; only the selected section is built and sent to the browser
+    if st.session_state.get('result_section') not in tab_list:
+        st.session_state.result_section = SECTION_OVERVIEW
+    section = st.radio("Section", tab_list, key="result_section", horizontal=True, label_visibility="collapsed")
+    
+    demographics = result.audience_profile.demographics
     
     # TAB 1: OVERVIEW
-    with tabs[0]:
+    if section == SECTION_OVERVIEW:
         st.markdown('<h2 class="section-header">📊 Content Intelligence Overview</h2>', unsafe_allow_html=True)
         
         # Key metrics row
         col1, col2, col3, col4, col5 = st.columns(5)
         
         with col1:
-            intention = result.get('intention', {})
-            primary_intent = intention.get('primary', 'Unknown')
-            confidence = intention.get('confidence', 'Unknown')
+            primary_intent = result.intention.primary or 'Unknown'
+            confidence = result.intention.confidence or 'Unknown'
             
             st.markdown(f"""
                 <div class="metric-card">
@@ -1217,7 +587,7 @@ else:
             """, unsafe_allow_html=True)
         
         with col2:
-            category = result.get('tier1_category', 'Unknown')
+            category = result.tier1_category or 'Unknown'
             st.markdown(f"""
                 <div class="metric-card">
                     <div class="metric-title">Category</div>
@@ -1226,8 +596,7 @@ else:
             """, unsafe_allow_html=True)
         
         with col3:
-            demographics = result.get('audience_profile', {}).get('demographics', {})
-            age_range = demographics.get('age_range', 'Unknown')
+            age_range = demographics.age_range or 'Unknown'
             st.markdown(f"""
                 <div class="metric-card">
                     <div class="metric-title">Age Range</div>
@@ -1236,7 +605,7 @@ else:
             """, unsafe_allow_html=True)
         
         with col4:
-            income = demographics.get('income_range', 'Unknown')
+            income = demographics.income_range or 'Unknown'
             st.markdown(f"""
                 <div class="metric-card">
                     <div class="metric-title">Income Range</div>
@@ -1246,7 +615,7 @@ else:
         
         
         with col5:
-            campaign_score = campaign_relevancy.get('overall_relevancy_score', 0) if st.session_state.campaign_analysis and campaign_relevancy else None
+            campaign_score = campaign_relevancy.overall_relevancy_score if st.session_state.campaign_analysis and campaign_relevancy else None
             if st.session_state.campaign_analysis and campaign_score is not None:
                 # Final Intentionality Score
                 final_intentionality_score,score_type = calculate_final_intention_score(result,campaign_relevancy)
@@ -1295,7 +664,7 @@ else:
         # Content Summary
         st.markdown('<h3 class="section-header">📝 Summary</h3>', unsafe_allow_html=True)
         
-        summary = result.get('summary_rationale', 'No summary available')
+        summary = result.summary_rationale or 'No summary available'
         st.markdown(f"""
             <div class="summary-card">
                 <div class="summary-text">{summary}</div>
@@ -1304,7 +673,7 @@ else:
         
         # Intentionality Score Explanation
         # Dynamic Intentionality Score Explanation
-        campaign_score = campaign_relevancy.get('overall_relevancy_score', 0) if st.session_state.campaign_analysis and campaign_relevancy else None
+        campaign_score = campaign_relevancy.overall_relevancy_score if st.session_state.campaign_analysis and campaign_relevancy else None
 
         if st.session_state.campaign_analysis and campaign_score is not None:
             # Final Intention Score Explanation (Combined Score)
@@ -1339,7 +708,7 @@ else:
                         <br><br>
                         <strong>Content Intent Distribution:</strong>
                         <ul style="margin: 0.5rem 0; padding-left: 1.5rem;">
-                            {"".join([f"<li><strong>{intent.title()}:</strong> {percent}% (Weight: {['Transactional: 95pts', 'Commercial: 75pts', 'Navigational: 45pts', 'Informational: 15pts'][['transactional', 'commercial', 'navigational', 'informational'].index(intent.lower())]})</li>" for intent, percent in result.get('intentionality_breakdown', {}).items() if percent > 0])}
+                            {"".join([f"<li><strong>{intent.title()}:</strong> {percent}% (Weight: {['Transactional: 95pts', 'Commercial: 75pts', 'Navigational: 45pts', 'Informational: 15pts'][['transactional', 'commercial', 'navigational', 'informational'].index(intent.lower())]})</li>" for intent, percent in result.intentionality_breakdown.items() if percent > 0])}
                         </ul>
                     </div>
                 </div>
@@ -1366,7 +735,7 @@ else:
                         <br><br>
                         <strong>Intent Breakdown:</strong>
                         <ul style="margin: 0.5rem 0; padding-left: 1.5rem;">
-                            {"".join([f"<li><strong>{intent.title()}:</strong> {percent}% (Weight: {['Transactional: 95pts', 'Commercial: 75pts', 'Navigational: 45pts', 'Informational: 15pts'][['transactional', 'commercial', 'navigational', 'informational'].index(intent.lower())]})</li>" for intent, percent in result.get('intentionality_breakdown', {}).items() if percent > 0])}
+                            {"".join([f"<li><strong>{intent.title()}:</strong> {percent}% (Weight: {['Transactional: 95pts', 'Commercial: 75pts', 'Navigational: 45pts', 'Informational: 15pts'][['transactional', 'commercial', 'navigational', 'informational'].index(intent.lower())]})</li>" for intent, percent in result.intentionality_breakdown.items() if percent > 0])}
                         </ul>
                         <br>
                         <div style="background: #374151; padding: 1rem; border-radius: 8px; margin-top: 1rem;">
@@ -1378,11 +747,11 @@ else:
 
         st.markdown('<h2 class="section-header">📊 Performance Metrics</h2>', unsafe_allow_html=True)
 
-        analysis_metadata = result.get("analysis_metadata", {})
+        analysis_metadata = result.analysis_metadata or {}
         intentionality_score = calculate_intentionality_score(result)
-        keyword_count = len(result.get("primary_keywords", [])) + len(result.get("secondary_keywords", []))
-        audience_complexity = len(result.get("audience_profile", {}).get("type", []))
-        campaign_score = campaign_relevancy.get('overall_relevancy_score', 0) if st.session_state.campaign_analysis and campaign_relevancy else None
+        keyword_count = len(result.primary_keywords) + len(result.secondary_keywords)
+        audience_complexity = len(result.audience_profile.type)
+        campaign_score = campaign_relevancy.overall_relevancy_score if st.session_state.campaign_analysis and campaign_relevancy else None
 
         # Dynamic column layout based on whether campaign analysis is enabled
         if st.session_state.campaign_analysis and campaign_score is not None:
@@ -1448,23 +817,23 @@ else:
                 """, unsafe_allow_html=True)
     
     # TAB 2: ANALYTICS
-    with tabs[1]:
+    if section == SECTION_AUDIENCE:
         st.markdown('<h2 class="section-header">📈 Audience Analytics </h2>', unsafe_allow_html=True)
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            age_chart = create_age_chart(demographics)
+            age_chart = create_age_chart(demographics.age_distribution)
             if age_chart:
                 st.plotly_chart(age_chart, use_container_width=True)
         
         with col2:
-            gender_chart = create_gender_chart(demographics)
+            gender_chart = create_gender_chart(demographics.gender_distribution)
             if gender_chart:
                 st.plotly_chart(gender_chart, use_container_width=True)
         
         with col3:
-            intentionality_data = result.get('intentionality_breakdown', {})
+            intentionality_data = result.intentionality_breakdown
             if intentionality_data:
                 intent_chart = create_intentionality_chart(intentionality_data)
                 if intent_chart:
@@ -1474,11 +843,8 @@ else:
         col1, col2 = st.columns(2)
         
         with col1:
-            audience_types = result.get('audience_profile', {}).get('type', ['Unknown'])
-            audience_text = ', '.join(audience_types) if isinstance(audience_types, list) else str(audience_types)
-            
-            regions = demographics.get('region', ['Unknown'])
-            region_text = ', '.join(regions) if isinstance(regions, list) else str(regions)
+            audience_text = ', '.join(result.audience_profile.type) or 'Unknown'
+            region_text = ', '.join(demographics.region) or 'Unknown'
             
             st.markdown(f"""
                 <div class="content-card">
@@ -1493,14 +859,14 @@ else:
                     </div>
                     <div>
                         <div style="color: #9CA3AF; font-size: 0.875rem; margin-bottom: 0.25rem;">Gender</div>
-                        <div style="color: #E4E4E4; font-weight: 500;">{demographics.get('gender', 'Unknown')}</div>
+                        <div style="color: #E4E4E4; font-weight: 500;">{demographics.gender or 'Unknown'}</div>
                     </div>
                 </div>
             """, unsafe_allow_html=True)
         
         with col2:
-            profession = demographics.get('profession', 'Unknown')
-            intent_signal = result.get('audience_profile', {}).get('intent_signal', 'No signal detected')
+            profession = demographics.profession or 'Unknown'
+            intent_signal = result.audience_profile.intent_signal or 'No signal detected'
             
             st.markdown(f"""
                 <div class="content-card">
@@ -1517,7 +883,7 @@ else:
             """, unsafe_allow_html=True)
         
          # Interest Groups
-        interest_groups = result.get('audience_profile', {}).get('interest_groups', [])
+        interest_groups = result.audience_profile.interest_groups
         if interest_groups:
             st.markdown('<h3 class="section-header">👥 Interest Groups</h3>', unsafe_allow_html=True)
             st.markdown(f"""
@@ -1530,124 +896,121 @@ else:
             """, unsafe_allow_html=True)
     
     # TAB 3: CAMPAIGN (only if campaign analysis is enabled and data exists)
-    tab_index = 2
-    if st.session_state.campaign_analysis and campaign_relevancy:
-        with tabs[tab_index]:
-            st.markdown('<h2 class="section-header">🎯 Campaign Relevancy Analysis</h2>', unsafe_allow_html=True)
-            
-            overall_score = campaign_relevancy.get('overall_relevancy_score', 0)
-            relevancy_level = campaign_relevancy.get('relevancy_level', 'unknown')
-            recommendation = campaign_relevancy.get('recommendation', 'consider')
-            
-            # Campaign Summary Card
-            recommendation_emoji = {
-                'highly_recommend': '🚀',
-                'recommend': '✅', 
-                'consider': '⚠️',
-                'avoid': '❌'
-            }.get(recommendation, '🤔')
-            
-            st.markdown(f"""
-                <div class="content-card">
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem;">
-                        <div>
-                            <h3 style="color: #f7c3dc; margin: 0; font-size: 1.25rem;">Campaign Relevancy Assessment</h3>
-                        </div>
-                        <div style="text-align: right;">
-                            <div style="font-size: 2.5rem; margin-bottom: 0.5rem;">{recommendation_emoji}</div>
-                            <div style="color: {'#10B981' if overall_score >= 80 else '#F59E0B' if overall_score >= 60 else '#EF4444'}; font-weight: 700; font-size: 1.5rem;">
-                                {overall_score}/100
-                            </div>
-                        </div>
+    if section == SECTION_CAMPAIGN:
+        st.markdown('<h2 class="section-header">🎯 Campaign Relevancy Analysis</h2>', unsafe_allow_html=True)
+        
+        overall_score = campaign_relevancy.overall_relevancy_score
+        relevancy_level = campaign_relevancy.relevancy_level or 'unknown'
+        recommendation = campaign_relevancy.recommendation or 'consider'
+        
+        # Campaign Summary Card
+        recommendation_emoji = {
+            'highly_recommend': '🚀',
+            'recommend': '✅', 
+            'consider': '⚠️',
+            'avoid': '❌'
+        }.get(recommendation, '🤔')
+        
+        st.markdown(f"""
+            <div class="content-card">
+                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1.5rem;">
+                    <div>
+                        <h3 style="color: #f7c3dc; margin: 0; font-size: 1.25rem;">Campaign Relevancy Assessment</h3>
                     </div>
-                    <div style="color: #D1D5DB; font-size: 1rem; margin-bottom: 0.5rem;">
-                        <strong>Recommendation:</strong> {recommendation.replace('_', ' ').title()}
+                    <div style="text-align: right;">
+                        <div style="font-size: 2.5rem; margin-bottom: 0.5rem;">{recommendation_emoji}</div>
+                        <div style="color: {'#10B981' if overall_score >= 80 else '#F59E0B' if overall_score >= 60 else '#EF4444'}; font-weight: 700; font-size: 1.5rem;">
+                            {overall_score}/100
+                        </div>
                     </div>
                 </div>
-            """, unsafe_allow_html=True)
-
-            # Campaign Metrics Grid
-            col1, col2, col3 = st.columns(3)
+                <div style="color: #D1D5DB; font-size: 1rem; margin-bottom: 0.5rem;">
+                    <strong>Recommendation:</strong> {recommendation.replace('_', ' ').title()}
+                </div>
+            </div>
+        """, unsafe_allow_html=True)
 
-            with col1:
-                strengths = campaign_relevancy.get('content_strengths_for_campaign', [])
-                if strengths:
-                    st.markdown(f"""
-                        <div class="content-card">
-                            <div class="card-title">✅ Content Strengths</div>
-                            <ul style="color: #D1D5DB; line-height: 1.7; margin: 0; padding-left: 1.5rem;">
-                                {''.join([f'<li>{strength}</li>' for strength in strengths])}
-                            </ul>
-                        </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                        <div class="content-card">
-                            <div class="card-title">✅ Content Strengths</div>
-                            <p style="color: #9CA3AF; font-style: italic;">No matching content for the campaign definition</p>
-                        </div>
-                    """, unsafe_allow_html=True)
+        # Campaign Metrics Grid
+        col1, col2, col3 = st.columns(3)
 
-            with col2:
-                intent_score = campaign_relevancy.get('intent_alignment_score', 0)
+        with col1:
+            strengths = campaign_relevancy.content_strengths_for_campaign
+            if strengths:
                 st.markdown(f"""
-                    <div class="metric-card">
-                        <div class="metric-title">Intent Match</div>
-                        <div class="metric-value">{intent_score}%</div>
-                        <div class="metric-subtitle">User intent alignment</div>
+                    <div class="content-card">
+                        <div class="card-title">✅ Content Strengths</div>
+                        <ul style="color: #D1D5DB; line-height: 1.7; margin: 0; padding-left: 1.5rem;">
+                            {''.join([f'<li>{strength}</li>' for strength in strengths])}
+                        </ul>
                     </div>
                 """, unsafe_allow_html=True)
-            
-            with col3:
-                vertical_score = campaign_relevancy.get('vertical_alignment_score', 0)
+            else:
                 st.markdown(f"""
-                    <div class="metric-card">
-                        <div class="metric-title">Vertical Match</div>
-                        <div class="metric-value">{vertical_score}%</div>
-                        <div class="metric-subtitle">Industry alignment</div>
+                    <div class="content-card">
+                        <div class="card-title">✅ Content Strengths</div>
+                        <p style="color: #9CA3AF; font-style: italic;">No matching content for the campaign definition</p>
                     </div>
                 """, unsafe_allow_html=True)
+
+        with col2:
+            intent_score = campaign_relevancy.intent_alignment_score
+            st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-title">Intent Match</div>
+                    <div class="metric-value">{intent_score}%</div>
+                    <div class="metric-subtitle">User intent alignment</div>
+                </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            vertical_score = campaign_relevancy.vertical_alignment_score
+            st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-title">Vertical Match</div>
+                    <div class="metric-value">{vertical_score}%</div>
+                    <div class="metric-subtitle">Industry alignment</div>
+                </div>
+            """, unsafe_allow_html=True)
+        
+        # Performance Summary for campaign
+        performance_summary = result.performance_summary
+        if performance_summary:
+            st.markdown('<h3 class="section-header">🎯 Performance Summary</h3>', unsafe_allow_html=True)
             
-            # Performance Summary for campaign
-            performance_summary = result.get('performance_summary', {})
-            if performance_summary:
-                st.markdown('<h3 class="section-header">🎯 Performance Summary</h3>', unsafe_allow_html=True)
-                
-                st.markdown(f"""
-                    <div class="summary-card">
-                        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 1.5rem;">
-                            <div>
-                                <div class="metric-title" style="font-size: 0.875rem; margin-bottom: 0.25rem;">Article Intent</div>
-                                <div class="metric-value" >{performance_summary.get('content_intent', 'Unknown').title()}</div>
-                            </div>
-                            <div>
-                                <div class="metric-title" style=" font-size: 0.875rem; margin-bottom: 0.25rem;">Campaign Suitability</div>
-                                <div class="metric-value" >{performance_summary.get('campaign_suitability', 'Unknown').title()}</div>
-                            </div>
-                            <div>
-                                <div class="metric-title" style="font-size: 0.875rem; margin-bottom: 0.25rem;">Overall Relevancy</div>
-                                <div class="metric-value" >{performance_summary.get('overall_relevancy', 'Unknown').title()}</div>
-                            </div>
-                            <div>
-                                <div class="metric-title" style="margin-bottom: 0.25rem;">Final Recommendation</div>
-                                <div class="metric-value" style="color: {'#10B981' if 'recommend' in performance_summary.get('recommendation', '') else '#F59E0B'}; font-weight: 600;">
-                                    {performance_summary.get('recommendation', 'Unknown').replace('_', ' ').title()}
-                                </div>
+            st.markdown(f"""
+                <div class="summary-card">
+                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 1.5rem;">
+                        <div>
+                            <div class="metric-title" style="font-size: 0.875rem; margin-bottom: 0.25rem;">Article Intent</div>
+                            <div class="metric-value" >{(performance_summary.content_intent or 'Unknown').title()}</div>
+                        </div>
+                        <div>
+                            <div class="metric-title" style=" font-size: 0.875rem; margin-bottom: 0.25rem;">Campaign Suitability</div>
+                            <div class="metric-value" >{(performance_summary.campaign_suitability or 'Unknown').title()}</div>
+                        </div>
+                        <div>
+                            <div class="metric-title" style="font-size: 0.875rem; margin-bottom: 0.25rem;">Overall Relevancy</div>
+                            <div class="metric-value" >{(performance_summary.overall_relevancy or 'Unknown').title()}</div>
+                        </div>
+                        <div>
+                            <div class="metric-title" style="margin-bottom: 0.25rem;">Final Recommendation</div>
+                            <div class="metric-value" style="color: {'#10B981' if 'recommend' in performance_summary.recommendation else '#F59E0B'}; font-weight: 600;">
+                                {(performance_summary.recommendation or 'Unknown').replace('_', ' ').title()}
                             </div>
                         </div>
                     </div>
-                """, unsafe_allow_html=True)
-        
-        tab_index += 1
+                </div>
+            """, unsafe_allow_html=True)
+
     
     # TAB: KEYWORDS
-    with tabs[tab_index]:
+    if section == SECTION_KEYWORDS:
         st.markdown('<h2 class="section-header">🔑 Keywords</h2>', unsafe_allow_html=True)
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            primary_keywords = result.get('primary_keywords', [])
+            primary_keywords = result.primary_keywords
             if primary_keywords:
                 st.markdown(f"""
                     <div class="content-card">
@@ -1659,7 +1022,7 @@ else:
                 """, unsafe_allow_html=True)
         
         with col2:
-            secondary_keywords = result.get('secondary_keywords', [])
+            secondary_keywords = result.secondary_keywords
             if secondary_keywords:
                 st.markdown(f"""
                     <div class="content-card">
@@ -1679,7 +1042,7 @@ else:
         
         # Matching Keywords (only show if campaign analysis was enabled)
         if st.session_state.campaign_analysis and campaign_relevancy:
-            matching_keywords = campaign_relevancy.get('matching_keywords', [])
+            matching_keywords = campaign_relevancy.matching_keywords
             if matching_keywords:
                 st.markdown(f"""
                     <div class="content-card">
@@ -1708,4 +1071,9 @@ st.markdown(f"""
             🎯 {footer_message} - Powered by Liz - Contextual Intelligence
         </p>
     </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+# Keep polling while an analysis job is running; widgets stay responsive between polls
+if st.session_state.pending_job:
+    time.sleep(JOB_POLL_INTERVAL)
+    st.rerun()
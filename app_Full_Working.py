@@ -1,14 +1,21 @@
 ## Contextual Article Analyzer - Enhanced UX with Sidebar Layout
 
+import os
+
 import streamlit as st
 import requests
 import json
-import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.express as px
-import re
 from urllib.parse import urlparse, urlencode
 
+from liz_analyzer.charts import create_age_chart, create_gender_chart, create_intentionality_chart, create_keyword_chart
+from liz_analyzer.client import AnalysisError
+from liz_analyzer.engine import IAB_TIER1_CATEGORIES, is_valid_url
+from liz_analyzer.models import AnalysisResult
+from liz_analyzer.scoring import calculate_intentionality_score, get_intentionality_grade
+from liz_analyzer.ui import inject_legacy_styles
+
 # Page configuration
 st.set_page_config(
     page_title="🔮 Contextual Article Analyzer",
@@ -16,724 +23,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# IAB Tier 1 Categories
-IAB_TIER1_CATEGORIES = [
-    "Arts & Entertainment",
-    "Automotive", 
-    "Business",
-    "Careers",
-    "Education",
-    "Family & Parenting",
-    "Health & Fitness",
-    "Food & Drink",
-    "Hobbies & Interests",
-    "Home & Garden",
-    "Law, Government & Politics",
-    "News",
-    "Personal Finance",
-    "Society",
-    "Science",
-    "Pets",
-    "Sports",
-    "Style & Fashion",
-    "Technology & Computing",
-    "Travel",
-    "Real Estate",
-    "Shopping",
-    "Religion & Spirituality",
-    "Non-Standard Content"
-]
-
-# Function to validate URL format
-def is_valid_url(url):
-    """Validate URL format before sending to API"""
-    if not url or not url.strip():
-        return False, "Please enter a URL"
-    
-    url = url.strip()
-    
-    # Add protocol if missing
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-    
-    # Validate URL format
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)', re.IGNORECASE)
-    
-    if url_pattern.match(url):
-        return True, url
-    else:
-        return False, "Please enter a valid URL (e.g., https://example.com/article)"
-
-# Function to display error messages with styling
-def display_error(error_type, message, suggestions=None, technical_details=None):
-    icon = "⚠️"
-    color = "#CD574C"
-
-    error_html = f"""
-    <div style="margin-top: 1.5rem; color: {color};">
-        <h4 style="color: {color}; font-family: Inter; margin-bottom: 0.5rem;">{icon} {message}</h4>
-    """
-    if suggestions:
-        error_html += "<ul style='text-align: left; color: #D1D5DB; line-height: 1.6;'>"
-        for s in suggestions:
-            error_html += f"<li>{s}</li>"
-        error_html += "</ul>"
-    if technical_details:
-        error_html += f"""
-        <details style="margin-top: 1rem; text-align: left;">
-            <summary style="color: #9CA3AF; cursor: pointer; font-size: 0.9rem;">Technical Details</summary>
-            <div style="margin-top: 0.5rem; padding: 1rem; background: #272b39bf; border-radius: 8px; font-family: monospace; font-size: 0.8rem; color: #9CA3AF;">
-                {technical_details}
-            </div>
-        </details>
-        """
-    error_html += "</div>"
-
-    st.markdown(error_html, unsafe_allow_html=True)
-
 # Enhanced styling with sidebar layout
-st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    .stApp {
-        background: #181c2b;
-        color: #E4E4E4;
-        font-family: 'Inter', sans-serif;
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg, .css-1lcbmhc {
-        background: #1f2333 !important;
-        border-right: 1px solid #374151;
-    }
-    
-    .css-17lntkn {
-        background: #1f2333 !important;
-    }
-    
-    /* Main content area */
-    .main .block-container {
-        padding-top: 2rem !important;
-        padding-left: 1rem !important;
-        padding-right: 1rem !important;
-        max-width: none !important;
-    }
-    
-    .main-header {
-        text-align: center;
-        font-family: 'Inter', sans-serif;
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: #f7c3dc !important;
-        margin-bottom: 0.5rem;
-        letter-spacing: -0.02em;
-    }
-    
-    .subtitle {
-        text-align: center;
-        font-family: 'Inter', sans-serif;
-        font-size: 1rem;
-        color: #9CA3AF;
-        margin-bottom: 2rem;
-        font-weight: 400;
-    }
-    
-    .sidebar-header {
-        font-family: 'Inter', sans-serif;
-        font-size: 1.25rem;
-        font-weight: 700;
-        color: #f7c3dc !important;
-        margin-bottom: 1rem;
-        text-align: center;
-    }
-    
-    .sidebar-section {
-        background: #272b39bf;
-        # border: 1px solid #374151;
-        border-radius: 12px;
-        # padding: 1.5rem;
-        margin-bottom: 1.5rem;
-    }
-    
-    .sidebar-section-title {
-        font-family: 'Inter', sans-serif;
-        font-size: 1rem;
-        font-weight: 600;
-        color: #CD574C;
-        margin-bottom: 1rem;
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-            
-    .st-emotion-cache-1f3w014 {
-    vertical-align: middle;
-    overflow: hidden;
-    color: inherit;
-    fill: currentcolor;
-    display: inline-flex;
-    -webkit-box-align: center;
-    align-items: center;
-    font-size: 1.5rem;
-    width: 1.5rem;
-    height: 1.5rem;
-    flex-shrink: 0;
-}
-    
-    .section-header {
-        font-family: 'Inter', sans-serif;
-        font-size: 1.5rem;
-        font-weight: 600;
-        color: #f7c3dc;
-        margin: 2rem 0 1.5rem 0;
-        letter-spacing: -0.01em;
-    }
-    
-    .content-card {
-        background: #272b39bf;
-        border: 1px solid #2A2A3E;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 0.5rem 0;
-        transition: all 0.2s ease;
-    }
-    
-    .content-card:hover {
-        border-color: #374151;
-    }
-    
-    .card-title {
-        font-family: 'Inter', sans-serif;
-        font-size: 1.125rem;
-        font-weight: 600;
-        color: #CD574C;
-        margin-bottom: 1rem;
-        letter-spacing: -0.01em;
-    }
-    
-    .tag {
-        display: inline-flex;
-        align-items: center;
-        padding: 0.375rem 0.75rem;
-        margin: 0.25rem 0.25rem 0.25rem 0;
-        background: #8B5CF6;
-        color: #FFFFFF;
-        border-radius: 6px;
-        font-family: 'Inter', sans-serif;
-        font-size: 0.875rem;
-        font-weight: 500;
-        transition: all 0.2s ease;
-    }
-    
-    .tag:hover {
-        background: #7C3AED;
-        transform: translateY(-1px);
-    }
-    
-    .tag-secondary {
-        background: #CD574C;
-        color: #FFFFFF;
-    }
-    
-    .tag-secondary:hover {
-        background: #B8503C;
-    }
-    
-    .metric-card {
-        background: #272b39bf;
-        border: 1px solid #2A2A3E;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 0.5rem 0;
-        transition: all 0.2s ease;
-    }
-    
-    .metric-card:hover {
-        border-color: #8B5CF6;
-        box-shadow: 0 4px 12px rgba(139, 92, 246, 0.15);
-    }
-    
-    .metric-title {
-        font-family: 'Inter', sans-serif;
-        font-size: 0.875rem;
-        color: #CD574C;
-        font-weight: 500;
-        margin-bottom: 0.5rem;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-    
-    .metric-value {
-        font-family: 'Inter', sans-serif;
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: #FFFFFF;
-        line-height: 1.2;
-    }
-    
-    .campaign-preview {
-        background: linear-gradient(135deg, #272b39bf 0%, #2A2A3E 100%);
-        border: 2px solid #8B5CF6;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-    }
-    
-    /* Toggle switch styling */
-    .toggle-container {
-        background: #272b39bf;
-        border: 1px solid #8B5CF6;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-bottom: 1rem;
-        text-align: center;
-    }
-    
-    /* Campaign fields styling */
-    .campaign-fields {
-        background: linear-gradient(135deg, #272b39bf 0%, #2A2A3E 100%);
-        border: 1px solid #8B5CF6;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-top: 1rem;
-    }
-    
-    /* Streamlit component overrides */
-    .stTextInput > div > div > input {
-        background: #272b39bf !important;
-        border: 1px solid #374151 !important;
-        border-radius: 8px !important;
-        color: #FFFFFF !important;
-        font-family: 'Inter', sans-serif !important;
-        font-size: 1rem !important;
-        padding: 0.75rem 1rem !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #8B5CF6 !important;
-        box-shadow: 0 0 0 3px rgba(139, 92, 246, 0.1) !important;
-    }
-    
-    .stTextArea > div > div > textarea {
-        background: #272b39bf !important;
-        border: 1px solid #374151 !important;
-        border-radius: 8px !important;
-        color: #FFFFFF !important;
-        font-family: 'Inter', sans-serif !important;
-        font-size: 1rem !important;
-        padding: 0.75rem 1rem !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    .stTextArea > div > div > textarea:focus {
-        border-color: #8B5CF6 !important;
-        box-shadow: 0 0 0 3px rgba(139, 92, 246, 0.1) !important;
-    }
-    
-    .summary-card {
-        background: linear-gradient(135deg, #272b39bf 0%, #2A2A3E 100%);
-        border: 1px solid #374151;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-    }
-    
-    .summary-text {
-        font-family: 'Inter', sans-serif;
-        font-size: 1rem;
-        line-height: 1.6;
-        color: #D1D5DB;
-        font-weight: 400;
-    }
-    
-    .stSelectbox > div > div > select {
-        background: #272b39bf !important;
-        border: 1px solid #374151 !important;
-        border-radius: 8px !important;
-        color: #FFFFFF !important;
-        font-family: 'Inter', sans-serif !important;
-    }
-    
-    .stButton > button {
-        background: #8B5CF6 !important;
-        color: #FFFFFF !important;
-        border: none !important;
-        border-radius: 8px !important;
-        padding: 0.75rem 1.5rem !important;
-        font-family: 'Inter', sans-serif !important;
-        font-weight: 600 !important;
-        font-size: 0.875rem !important;
-        transition: all 0.2s ease !important;
-        width: 100% !important;
-    }
-    
-    .stButton > button:hover {
-        background: #7C3AED !important;
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 12px rgba(139, 92, 246, 0.4) !important;
-    }
-    
-    /* Sidebar specific button styling */
-    .css-1lcbmhc .stButton > button {
-        margin-top: 1rem !important;
-    }
-    
-    /* Hide Streamlit branding */
-    .stDeployButton {display:none;}
-    footer {visibility: hidden;}
-    .stApp > header {visibility: hidden;}
-    
-    /* Results area styling */
-    .results-container {
-        min-height: 80vh;
-        background: #181c2b;
-    }
-    
-    .waiting-state {
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        justify-content: center;
-        min-height: 60vh;
-        text-align: center;
-        color: #9CA3AF;
-    }
-    
-    .waiting-icon {
-        font-size: 4rem;
-        margin-bottom: 1rem;
-        opacity: 0.6;
-    }
-    
-    .waiting-text {
-        font-family: 'Inter', sans-serif;
-        font-size: 1.25rem;
-        font-weight: 500;
-        margin-bottom: 0.5rem;
-    }
-    
-    .waiting-subtext {
-        font-family: 'Inter', sans-serif;
-        font-size: 1rem;
-        opacity: 0.7;
-    }
-    section.stSidebar.st-emotion-cache-11ig4q4.edtmxes0 {
-    background-color: rgb(35 39 54);
-    }
-            
-    .st-emotion-cache-1xulwhk {
-    font-family: 'Inter', sans-serif;
-    font-size: 1rem;
-    font-weight: 600;
-    color: #CD574C;
-    margin-bottom: 1rem;
-    display: flex;
-    align-items: center;
-    gap: 0.5rem;
-    }
-    .st-emotion-cache-p7i6r9 {
-    font-family: "Source Sans Pro", sans-serif;
-    font-size: 1rem;
-    color: rgb(253 253 253);
-    font-weight: 900;
-    }
-     
-    .st-emotion-cache-169dgwr {
-    z-index: 999990;
-    color: rgb(255 255 255 / 60%);
-    margin-top: 0.25rem;
-    }
-            
-    .st-emotion-cache-1f3w014 {
-    vertical-align: middle;
-    overflow: hidden;
-    color: inherit;
-    fill: rgb(205 87 76);
-    display: inline-flex;
-    -webkit-box-align: center;
-    align-items: center;
-    font-size: 5rem;
-    width: 1.5rem;
-    height: 1.5rem;
-    flex-shrink: 0;
-    }
-    .st-emotion-cache-102y9h7 {
-    font-family: "Source Sans Pro", sans-serif;
-    font-size: 1rem;
-    margin-bottom: -1rem;
-    color: #cd574c;
-}
-    </style>
-""", unsafe_allow_html=True)
-
-# All your existing chart functions (keep these unchanged)
-def create_age_chart(demographics):
-    if not demographics:
-        return None
-    
-    age_distribution = demographics.get('age_distribution', {})
-    if not age_distribution:
-        return None
-    
-    # Filter out zero values
-    filtered_age_dist = {k: v for k, v in age_distribution.items() if v > 0}
-    if not filtered_age_dist:
-        return None
-    
-    age_groups = list(filtered_age_dist.keys())
-    percentages = list(filtered_age_dist.values())
-    
-    # Create vibrant color palette for age groups
-    colors = ['#f7c3dc', '#CD574C', '#8B5CF6', '#10B981', '#F59E0B', '#EF4444', '#06B6D4', '#84CC16'][:len(age_groups)]
-    
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        x=age_groups,
-        y=percentages,
-        marker=dict(
-            color=colors,
-            line=dict(color='rgba(255,255,255,0.2)', width=1)
-        ),
-        text=[f"{p}%" for p in percentages],
-        textposition='auto',
-        textfont=dict(color="#FFFFFF", size=12, family="Inter")
-    ))
-    
-    fig.update_layout(
-        title="Real-Time Age Distribution",
-        title_font=dict(color="#f7c3dc", family="Inter", size=16),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color="#9CA3AF", family="Inter"),
-        xaxis=dict(
-            gridcolor='rgba(75, 85, 99, 0.3)',
-            tickfont=dict(color="#9CA3AF", family="Inter")
-        ),
-        yaxis=dict(
-            gridcolor='rgba(75, 85, 99, 0.3)',
-            tickfont=dict(color="#9CA3AF", family="Inter")
-        ),
-        showlegend=False,
-        height=350,
-        margin=dict(l=40, r=40, t=60, b=40)
-    )
-    
-    return fig
-
-def create_gender_chart(demographics):
-    if not demographics:
-        return None
-    
-    gender_distribution = demographics.get('gender_distribution', {})
-    if not gender_distribution:
-        return None
-    
-    genders = list(gender_distribution.keys())
-    values = list(gender_distribution.values())
-    display_labels = [gender.capitalize() for gender in genders]
-    
-    fig = go.Figure()
-    fig.add_trace(go.Pie(
-        labels=display_labels,
-        values=values,
-        hole=0.6,
-        marker=dict(
-            colors=['#f7c3dc', '#CD574C'],
-            line=dict(color='#272b39', width=2)
-        ),
-        textfont=dict(color="#FFFFFF", family="Inter", size=12),
-        textinfo='label+percent'
-    ))
-    
-    fig.update_layout(
-        title="Real-Time Gender Distribution",
-        title_font=dict(color="#f7c3dc", family="Inter", size=16),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color="#9CA3AF", family="Inter"),
-        showlegend=False,
-        height=350,
-        margin=dict(l=40, r=40, t=60, b=40)
-    )
-    
-    return fig
-
-def create_intentionality_chart(intentionality_data):
-    if not intentionality_data:
-        return None
-    
-    # Filter out zero values
-    filtered_data = {k: v for k, v in intentionality_data.items() if v > 0}
-    if not filtered_data:
-        return None
-    
-    intent_types = [k.capitalize() for k in filtered_data.keys()]
-    values = list(filtered_data.values())
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(
-        r=values,
-        theta=intent_types,
-        fill='toself',
-        marker=dict(color='#f7c3dc', size=6),
-        line=dict(color='#CD574C', width=2),
-        fillcolor='rgba(247, 195, 220, 0.2)',
-        name='Intent Distribution'
-    ))
-    
-    fig.update_layout(
-        title="Intent Breakdown",
-        title_font=dict(color="#f7c3dc", family="Inter", size=16),
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, max(values) + 10] if values else [0, 100],
-                gridcolor='rgba(75, 85, 99, 0.3)',
-                tickfont=dict(color="#9CA3AF", family="Inter", size=10)
-            ),
-            angularaxis=dict(
-                gridcolor='rgba(75, 85, 99, 0.3)',
-                tickfont=dict(color="#9CA3AF", family="Inter", size=11)
-            )
-        ),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        showlegend=False,
-        height=350,
-        margin=dict(l=40, r=40, t=60, b=40)
-    )
-    
-    return fig
-
-def create_keyword_chart(primary_kw, secondary_kw):
-    if not primary_kw and not secondary_kw:
-        return None
-    
-    labels = primary_kw + secondary_kw
-    values = [90] * len(primary_kw) + [60] * len(secondary_kw)
-    colors = ['#f7c3dc'] * len(primary_kw) + ['#CD574C'] * len(secondary_kw)
-    
-    fig = go.Figure(data=[go.Pie(
-        labels=labels,
-        values=values,
-        hole=0.6,
-        marker=dict(colors=colors, line=dict(color='#272b39', width=2)),
-        textfont=dict(color="#ffffff", family="Inter", size=11),
-        textinfo='label+percent'
-    )])
-    
-    fig.update_layout(
-        title="Keyword Distribution",
-        title_font=dict(color="#f7c3dc", family="Inter", size=16),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color="#9CA3AF", family="Inter"),
-        showlegend=True,
-        legend=dict(
-            font=dict(color="#ffffff"),
-            orientation="h",
-            yanchor="bottom",
-            y=-0.2,
-            xanchor="center",
-            x=0.5
-        ),
-        height=400,
-        margin=dict(l=40, r=40, t=60, b=60)
-    )
-    
-    return fig
-
-# Performance calculation functions (keep your existing ones)
-def calculate_intent_accuracy(result):
-    intention = result.get('intention', {})
-    confidence = intention.get('confidence', 'low')
-    confidence_accuracy = {'high': 85, 'medium': 70, 'low': 50}
-    accuracy = confidence_accuracy.get(confidence, 85)
-    
-    intentionality = result.get('intentionality_breakdown', {})
-    if intentionality and any(val > 0 for val in intentionality.values()):
-        accuracy += 10
-    
-    return min(accuracy, 99)
-
-def calculate_intentionality_score(result):
-    intentionality = result.get('intentionality_breakdown', {})
-    intention = result.get('intention', {})
-    confidence = intention.get('confidence', 'medium')
-    
-    if not intentionality:
-        return 0
-    
-    intent_weights = {
-        'transactional': 95,
-        'commercial': 75,
-        'navigational': 45,
-        'informational': 15
-    }
-    
-    weighted_score = 0
-    for intent_type, percentage in intentionality.items():
-        weight = intent_weights.get(intent_type.lower(), 0)
-        weighted_score += (percentage / 100) * weight
-    
-    confidence_multipliers = {
-        'high': 1.0,
-        'medium': 0.85,
-        'low': 0.7
-    }
-    
-    confidence_multiplier = confidence_multipliers.get(confidence, 0.85)
-    final_score = weighted_score * confidence_multiplier
-    
-    return min(round(final_score), 100)
-
-def get_intentionality_grade(score):
-    if score >= 85:
-        return "A+", "Very High Action Intent"
-    elif score >= 75:
-        return "A", "High Action Intent"
-    elif score >= 65:
-        return "B+", "Good Action Intent"
-    elif score >= 55:
-        return "B", "Moderate Action Intent"
-    elif score >= 45:
-        return "C+", "Some Action Intent"
-    elif score >= 35:
-        return "C", "Low Action Intent"
-    elif score >= 25:
-        return "D", "Very Low Action Intent"
-    else:
-        return "F", "Minimal Action Intent"
-
-def calculate_content_score(result):
-    score = 0
-    confidence = result.get('intention', {}).get('confidence', 'Low')
-    confidence_scores = {'High': 40, 'Medium': 30, 'Low': 20}
-    score += confidence_scores.get(confidence, 20)
-    
-    primary_kw = len(result.get('primary_keywords', []))
-    secondary_kw = len(result.get('secondary_keywords', []))
-    keyword_score = min((primary_kw * 3 + secondary_kw * 2), 20)
-    score += keyword_score
-    
-    tier2_categories = result.get('tier2_categories', [])
-    category_score = min(len(tier2_categories) * 5, 15)
-    score += category_score
-    
-    audience_types = result.get('audience_profile', {}).get('type', [])
-    interest_groups = result.get('audience_profile', {}).get('interest_groups', [])
-    audience_score = min((len(audience_types) * 3 + len(interest_groups) * 2), 15)
-    score += audience_score
-    
-    return min(score, 100)
+inject_legacy_styles("app_full_working")
 
 # Initialize session state
 if 'campaign_analysis' not in st.session_state:
@@ -742,6 +33,8 @@ if 'analysis_complete' not in st.session_state:
     st.session_state.analysis_complete = False
 if 'analysis_results' not in st.session_state:
     st.session_state.analysis_results = None
+if 'analysis_model' not in st.session_state:
+    st.session_state.analysis_model = None
 
 # SIDEBAR - Input Section (20% width)
 with st.sidebar:
@@ -830,8 +123,8 @@ with st.sidebar:
             with st.spinner(spinner_message):
                 try:
                     # API endpoints
-                    n8n_webhook_url_basic = "https://rajkpillai.app.n8n.cloud/webhook/contextual-engine-test"
-                    n8n_webhook_url_campaign = "https://rajkpillai.app.n8n.cloud/webhook/contextual-engine-test"
+                    n8n_webhook_url_basic = os.environ.get("LIZ_WEBHOOK_URL", "https://rajkpillai.app.n8n.cloud/webhook/contextual-engine-test")
+                    n8n_webhook_url_campaign = os.environ.get("LIZ_WEBHOOK_URL", "https://rajkpillai.app.n8n.cloud/webhook/contextual-engine-test")
                     
                     # Choose API endpoint and payload based on toggle
                     if st.session_state.campaign_analysis:
@@ -865,11 +158,18 @@ with st.sidebar:
                                     else:
                                         result = result_data
                                     
+                                    # Validate once; a malformed payload raises AnalysisError before it is stored
+                                    analysis = AnalysisResult.from_dict(result)
+
                                     # Store results in session state
                                     st.session_state.analysis_results = result
+                                    st.session_state.analysis_model = analysis
                                     st.session_state.analysis_complete = True
                                     st.rerun()
                                     
+                            except AnalysisError as e:
+                                st.error(f"⚠️ {e.message}")
+                                st.caption(e.technical_details)
                             except Exception as e:
                                 st.error(f"Error parsing response: {e}")
                         else:
@@ -903,11 +203,18 @@ with st.sidebar:
                                     else:
                                         result = result_data
                                     
+                                    # Validate once; a malformed payload raises AnalysisError before it is stored
+                                    analysis = AnalysisResult.from_dict(result)
+
                                     # Store results in session state
                                     st.session_state.analysis_results = result
+                                    st.session_state.analysis_model = analysis
                                     st.session_state.analysis_complete = True
                                     st.rerun()
                                     
+                            except AnalysisError as e:
+                                st.error(f"⚠️ {e.message}")
+                                st.caption(e.technical_details)
                             except Exception as e:
                                 st.error(f"Error parsing response: {e}")
                         else:
@@ -946,6 +253,7 @@ if not st.session_state.analysis_complete or st.session_state.analysis_results i
 else:
     # Display results
     result = st.session_state.analysis_results
+    analysis = st.session_state.analysis_model
     
     # 📊 CONTENT INTELLIGENCE (Always shown)
     st.markdown('<h2 class="section-header">📊 Content Intelligence</h2>', unsafe_allow_html=True)
@@ -997,7 +305,7 @@ else:
     
     with col5:
         # Intentionality Score
-        intentionality_score = calculate_intentionality_score(result)
+        intentionality_score = calculate_intentionality_score(analysis)
         grade, grade_desc = get_intentionality_grade(intentionality_score)
         
         if intentionality_score >= 75:
@@ -1023,12 +331,12 @@ else:
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        age_chart = create_age_chart(demographics)
+        age_chart = create_age_chart(demographics.get('age_distribution', {}))
         if age_chart:
             st.plotly_chart(age_chart, use_container_width=True)
     
     with col2:
-        gender_chart = create_gender_chart(demographics)
+        gender_chart = create_gender_chart(demographics.get('gender_distribution', {}))
         if gender_chart:
             st.plotly_chart(gender_chart, use_container_width=True)
     
@@ -1262,7 +570,7 @@ else:
     st.markdown('<h2 class="section-header">📊 Performance Metrics</h2>', unsafe_allow_html=True)
 
     analysis_metadata = result.get("analysis_metadata", {})
-    intentionality_score = calculate_intentionality_score(result)
+    intentionality_score = calculate_intentionality_score(analysis)
     keyword_count = len(result.get("primary_keywords", [])) + len(result.get("secondary_keywords", []))
     audience_complexity = len(result.get("audience_profile", {}).get("type", []))
     campaign_score = campaign_relevancy.get('overall_relevancy_score', 0) if st.session_state.campaign_analysis and campaign_relevancy else None
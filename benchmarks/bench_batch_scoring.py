@@ -0,0 +1,111 @@
+## Parity check and benchmark: vectorized batch scoring vs the scalar scorers
+#
+#     python benchmarks/bench_batch_scoring.py --rows 50000
+#
+# Exits non-zero if any vectorized score or grade differs from scoring.score_result.
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from liz_analyzer.batch_scoring import ScoreColumns, score_columns  # noqa: E402
+from liz_analyzer.models import AnalysisResult  # noqa: E402
+from liz_analyzer.scoring import score_result  # noqa: E402
+
+
+INTENT_KEYS = ['transactional', 'commercial', 'navigational', 'informational', 'Commercial', 'other']
+CONFIDENCES = ['high', 'medium', 'low', 'High', 'unknown', None]
+
+
+def random_result(rng):
+    """Synthetic result covering the edge cases the scalar scorers special-case"""
+    keys = rng.sample(INTENT_KEYS[:4], rng.randint(0, 4))
+    if rng.random() < 0.1:
+        keys.append(rng.choice(INTENT_KEYS[4:]))
+    breakdown = {key: rng.choice([0, rng.randint(0, 100), round(rng.uniform(0, 100), 1)]) for key in keys}
+
+    result = {
+        'intentionality_breakdown': breakdown,
+        'primary_keywords': ['kw'] * rng.randint(0, 8),
+        'secondary_keywords': ['kw'] * rng.randint(0, 8),
+        'tier2_categories': ['cat'] * rng.randint(0, 4),
+        'audience_profile': {
+            'type': ['t'] * rng.randint(0, 5),
+            'interest_groups': ['g'] * rng.randint(0, 6),
+        },
+    }
+
+    result['intention'] = {'primary': 'informational'}
+    confidence = rng.choice(CONFIDENCES)
+    if confidence is not None:
+        result['intention']['confidence'] = confidence
+
+    if rng.random() < 0.7:
+        result['campaign_relevancy'] = {'overall_relevancy_score': rng.randint(0, 100)} if rng.random() < 0.9 else {}
+    return AnalysisResult.from_dict(result)
+
+
+def check_parity(results, campaign_enabled, vectorized):
+    mismatches = 0
+    for i, result in enumerate(results):
+        expected = score_result(result, campaign_enabled)
+        for field, value in expected.items():
+            actual = vectorized[field][i]
+            if value is None:
+                same = math.isnan(actual)
+            else:
+                same = actual == value
+            if not same:
+                mismatches += 1
+                if mismatches <= 10:
+                    print(f"MISMATCH row {i} {field}: scalar={value!r} vectorized={actual!r}")
+    return mismatches
+
+
+def best_of(repeats, fn):
+    timings = []
+    value = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        value = fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings), value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = [random_result(rng) for _ in range(args.rows)]
+
+    total_mismatches = 0
+    for campaign_enabled in (False, True):
+        scalar_time, _ = best_of(args.repeats, lambda: [score_result(r, campaign_enabled) for r in results])
+        build_time, columns = best_of(args.repeats, lambda: ScoreColumns.from_results(results, campaign_enabled))
+        vector_time, vectorized = best_of(args.repeats, lambda: score_columns(columns))
+
+        mismatches = check_parity(results, campaign_enabled, vectorized)
+        total_mismatches += mismatches
+
+        label = "campaign" if campaign_enabled else "action only"
+        print(f"[{label}] {args.rows} rows")
+        print(f"  scalar score_result      {scalar_time * 1000:9.1f} ms  ({scalar_time / args.rows * 1e6:.2f} us/row)")
+        print(f"  ScoreColumns.from_results{build_time * 1000:9.1f} ms")
+        print(f"  score_columns            {vector_time * 1000:9.1f} ms  ({vector_time / args.rows * 1e6:.3f} us/row)")
+        print(f"  speedup (scoring only)   {scalar_time / vector_time:9.1f}x")
+        print(f"  parity                   {'OK' if mismatches == 0 else f'{mismatches} mismatches'}")
+
+    sys.exit(1 if total_mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
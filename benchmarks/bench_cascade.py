@@ -0,0 +1,112 @@
+## How far the confidence-gated cascade cuts LLM calls and end-to-end time
+#
+#     python benchmarks/bench_cascade.py
+#     python benchmarks/bench_cascade.py --urls 80 --webhook-ms 2000 --thresholds 0.5 0.6 0.7 0.8
+#
+# Runs AnalysisEngine against the in-process stub server over the fixture
+# article pages (fixtures/*.html, served under distinct URLs so every
+# analysis is a cache miss), once without a cascade and once per threshold,
+# then prints the LLM call rate, local/webhook split and timings of each run,
+# and the precision of the local answers: the share whose primary intent
+# matches the page's hand label in PAGE_INTENTS.
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from liz_analyzer.cache import AnalysisCache  # noqa: E402
+from liz_analyzer.cascade import Cascade, analysis_path  # noqa: E402
+from liz_analyzer.categories import default_classifier  # noqa: E402
+from liz_analyzer.client import WebhookClient  # noqa: E402
+from liz_analyzer.engine import AnalysisEngine  # noqa: E402
+from liz_analyzer.extract import ArticleExtractor  # noqa: E402
+from liz_analyzer.fixtures import page_names  # noqa: E402
+from liz_analyzer.stub_server import LatencyModel, StubWebhookServer  # noqa: E402
+
+
+# Primary intent of each fixture page, labelled by hand
+PAGE_INTENTS = {
+    "article_page": "commercial",
+    "explainer_page": "informational",
+    "product_page": "transactional",
+    "store_locator_page": "navigational",
+}
+
+
+def run(server, urls, extractor, cascade):
+    """Stats for analyzing `urls`, (page name, URL) pairs, with one engine"""
+    engine = AnalysisEngine(
+        client=WebhookClient(webhook_url=server.url),
+        cache=AnalysisCache(":memory:"),
+        extractor=extractor,
+        send_content=False,
+        cascade=cascade,
+    )
+    requests_before = server.stats()["requests"]
+    totals = []
+    paths = []
+    local_correct = 0
+    started = time.perf_counter()
+    try:
+        for page, url in urls:
+            url_started = time.perf_counter()
+            result = engine.fetch(url)
+            totals.append(time.perf_counter() - url_started)
+            paths.append(analysis_path(result))
+            if paths[-1] == "local" and result.intention.primary == PAGE_INTENTS.get(page):
+                local_correct += 1
+    finally:
+        engine.client.close()
+    elapsed = time.perf_counter() - started
+    webhook_calls = server.stats()["requests"] - requests_before
+    return {
+        "llm_call_rate": webhook_calls / len(urls),
+        "local": paths.count("local"),
+        "local_precision": local_correct / paths.count("local") if "local" in paths else None,
+        "median_ms": statistics.median(totals) * 1000,
+        "total_s": elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM call rate and latency with and without the cascade")
+    parser.add_argument("--urls", type=int, default=40)
+    parser.add_argument("--page-ms", type=float, default=50, help="simulated article site latency")
+    parser.add_argument("--webhook-ms", type=float, default=800, help="simulated workflow median latency")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.5, 0.6, 0.7, 0.8])
+    args = parser.parse_args()
+
+    server = StubWebhookServer(
+        latency=LatencyModel("lognormal", args.webhook_ms, sigma=0.3),
+        page_latency=LatencyModel("fixed", args.page_ms),
+        seed=1,
+    ).start()
+    # The stub server listens on loopback
+    extractor = ArticleExtractor(allow_private=True)
+    pages = page_names()
+    try:
+        modes = [("no cascade", None)]
+        modes += [(f"threshold {t:.2f}", Cascade(threshold=t, categorizer=default_classifier())) for t in args.thresholds]
+        runs = []
+        for label, cascade in modes:
+            names = [pages[n % len(pages)] for n in range(args.urls)]
+            urls = [(name, server.article_url(name, f"run={len(runs)}&n={n}")) for n, name in enumerate(names)]
+            runs.append((label, run(server, urls, extractor, cascade)))
+    finally:
+        extractor.close()
+        server.stop()
+
+    print(f"{len(pages)} fixture pages: {', '.join(pages)}")
+    print(f"\n{'mode':16} {'LLM calls':>10} {'local':>6} {'precision':>10} {'median ms':>10} {'total s':>8}")
+    for label, stats in runs:
+        precision = f"{stats['local_precision']:.0%}" if stats['local_precision'] is not None else "-"
+        print(f"{label:16} {stats['llm_call_rate']:10.0%} {stats['local']:6} {precision:>10} "
+              f"{stats['median_ms']:10.1f} {stats['total_s']:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
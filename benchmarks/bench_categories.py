@@ -0,0 +1,73 @@
+## Local IAB category classifier throughput and fixture checks
+#
+#     python benchmarks/bench_categories.py
+#     python benchmarks/bench_categories.py --articles 20000
+#
+# Classifies the extracted text of the fixture article pages over and over on
+# one core and prints articles per second, then checks that every fixture
+# page gets its expected tier 1 category and that the term dictionary only
+# uses names from IAB_TIER1_CATEGORIES; exits non-zero when a check fails.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from liz_analyzer.categories import default_classifier  # noqa: E402
+from liz_analyzer.engine import IAB_TIER1_CATEGORIES  # noqa: E402
+from liz_analyzer.extract import extract_main_text  # noqa: E402
+from liz_analyzer.fixtures import load_page_text, page_names  # noqa: E402
+
+
+EXPECTED_TIER1 = {
+    "article_page": "Sports",
+    "explainer_page": "Science",
+    "product_page": "Technology & Computing",
+    "store_locator_page": "Shopping",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local category classifier throughput")
+    parser.add_argument("--articles", type=int, default=5000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    classifier = default_classifier()
+    print(f"dictionary: {len(classifier.phrases)} terms in {len(classifier.tier1_categories)} tier 1 categories, "
+          f"loaded in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    documents = {name: extract_main_text(load_page_text(name))[:2] for name in page_names()}
+    ok = True
+    for name, (title, text) in documents.items():
+        prediction = classifier.classify(text, title)
+        tier1 = prediction.tier1_category if prediction else ""
+        tier2 = "; ".join(prediction.tier2_categories) if prediction else ""
+        confidence = prediction.confidence if prediction else 0
+        print(f"{name:20} {len(text.split()):5} words  {tier1} > {tier2} ({confidence:.2f})")
+        expected = EXPECTED_TIER1.get(name)
+        if expected and tier1 != expected:
+            print(f"WRONG category for {name}: expected {expected!r}")
+            ok = False
+
+    unknown = [name for name in classifier.tier1_categories if name not in IAB_TIER1_CATEGORIES]
+    for name in unknown:
+        print(f"UNKNOWN tier 1 category in the dictionary: {name!r}")
+
+    pages = list(documents.values())
+    started = time.perf_counter()
+    for n in range(args.articles):
+        title, text = pages[n % len(pages)]
+        classifier.classify(text, title)
+    elapsed = time.perf_counter() - started
+    words = sum(len(text.split()) for _, text in pages) / len(pages)
+    print(f"\n{args.articles} articles (~{words:.0f} words each): {args.articles / elapsed:,.0f} articles/s, "
+          f"{elapsed / args.articles * 1e6:.0f} us each")
+
+    sys.exit(0 if ok and not unknown else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+## Where end-to-end analysis time goes: article fetch and extraction versus the webhook
+#
+#     python benchmarks/bench_extract.py
+#     python benchmarks/bench_extract.py --urls 40 --page-ms 300 --webhook-ms 2000 --max-tokens 1500
+#
+# Runs AnalysisEngine against the in-process stub server, which serves both the
+# article page (fixtures/article_page.html) and the analysis webhook, once with
+# local extraction and once sending the URL alone, then prints the per-stage
+# split (the local keyword, intent and category models run on the extracted text). Also checks that the extracted fixture text keeps the article and drops
+# the page chrome; exits non-zero when it does not.
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from liz_analyzer.cache import AnalysisCache  # noqa: E402
+from liz_analyzer.client import WebhookClient  # noqa: E402
+from liz_analyzer.engine import AnalysisEngine  # noqa: E402
+from liz_analyzer.extract import ArticleExtractor, estimate_tokens, extract_main_text  # noqa: E402
+from liz_analyzer.fixtures import load_page_text  # noqa: E402
+from liz_analyzer.stub_server import LatencyModel, StubWebhookServer  # noqa: E402
+
+
+PAGE_FIXTURE = "article_page"
+# Sentences that must survive extraction, and chrome that must not
+EXPECTED_TEXT = (
+    "Marathon Super-Shoes and Race-Day Fueling",
+    "Why carbon plates changed marathon training",
+    "Glycogen stores run low",
+    "Arrive at the start line with nothing new",
+)
+BOILERPLATE_TEXT = (
+    "We use cookies", "Training Plans", "Share on Facebook", "Advertisement", "Get the weekly training email",
+    "Related stories", "32 comments", "Most popular", "Sponsored", "You may also like", "All rights reserved",
+)
+
+
+def check_extraction(max_tokens):
+    html = load_page_text(PAGE_FIXTURE)
+    title, text, truncated = extract_main_text(html, max_tokens)
+    # A small budget legitimately cuts the article short; its headline must still lead
+    expected = EXPECTED_TEXT[:1] if truncated else EXPECTED_TEXT
+    missing = [snippet for snippet in expected if snippet not in text]
+    leaked = [snippet for snippet in BOILERPLATE_TEXT if snippet in text]
+    print(f"fixture page: {len(html.encode('utf-8')) / 1024:.1f} KiB HTML -> {len(text)} chars "
+          f"(~{estimate_tokens(text)} tokens{', truncated' if truncated else ''}), title {title!r}")
+    for snippet in missing:
+        print(f"MISSING article text: {snippet!r}")
+    for snippet in leaked:
+        print(f"LEAKED boilerplate: {snippet!r}")
+    return not missing and not leaked
+
+
+def run(server, urls, extractor):
+    engine = AnalysisEngine(
+        client=WebhookClient(webhook_url=server.url),
+        cache=AnalysisCache(":memory:"),
+        extractor=extractor,
+    )
+    totals = []
+    try:
+        for url in urls:
+            started = time.perf_counter()
+            engine.fetch(url)
+            totals.append(time.perf_counter() - started)
+    finally:
+        engine.client.close()
+    return statistics.median(totals), engine.timings.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch + extraction vs webhook latency split")
+    parser.add_argument("--urls", type=int, default=20)
+    parser.add_argument("--page-ms", type=float, default=150, help="simulated article site latency")
+    parser.add_argument("--webhook-ms", type=float, default=800, help="simulated workflow median latency")
+    parser.add_argument("--max-tokens", type=int, default=3000)
+    args = parser.parse_args()
+
+    ok = check_extraction(args.max_tokens)
+
+    server = StubWebhookServer(
+        latency=LatencyModel("lognormal", args.webhook_ms, sigma=0.3),
+        page_latency=LatencyModel("fixed", args.page_ms),
+        seed=1,
+    ).start()
+    # The stub server listens on loopback
+    extractor = ArticleExtractor(max_tokens=args.max_tokens, allow_private=True)
+    try:
+        # Distinct query strings keep every analysis a cache miss
+        urls = [server.article_url(PAGE_FIXTURE, f"n={n}") for n in range(args.urls)]
+        runs = [("url only", *run(server, urls, None)), ("with extraction", *run(server, urls, extractor))]
+    finally:
+        extractor.close()
+        server.stop()
+
+    print(f"\n{'mode':18} {'stage':9} {'count':>6} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'share':>7}")
+    for mode, median_total, summary in runs:
+        for stage in ("fetch", "extract", "keywords", "intent", "category", "webhook"):
+            if stage in summary:
+                stats = summary[stage]
+                print(f"{mode:18} {stage:9} {stats['count']:6} {stats['mean_ms']:9.1f} {stats['p50_ms']:9.1f} "
+                      f"{stats['p95_ms']:9.1f} {stats['share']:7.1%}")
+        print(f"{mode:18} {'total':9} {len(urls):6} {'':9} {median_total * 1000:9.1f}")
+    print(f"\nstub: {server.stats()}")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+## Per-call latency and allocation for the hot paths run on every analysis rerun
+#
+#     python benchmarks/bench_hotpaths.py                      # charts, scoring, parsing
+#     python benchmarks/bench_hotpaths.py --e2e                # + full client round trip to a local stub
+#     python benchmarks/bench_hotpaths.py --save baseline.json
+#     python benchmarks/bench_hotpaths.py --compare baseline.json --tolerance 1.25
+#
+# Everything runs offline against the recorded payloads in liz_analyzer/fixtures.
+# With --compare the script exits non-zero when any median is slower than the
+# baseline by more than the tolerance factor.
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from liz_analyzer.charts import (  # noqa: E402
+    create_age_chart, create_gender_chart, create_intentionality_chart, create_keyword_chart
+)
+from liz_analyzer.client import AnalysisError, WebhookClient, parse_analysis_response, parse_analysis_stream  # noqa: E402
+from liz_analyzer.extract import extract_main_text  # noqa: E402
+from liz_analyzer.fixtures import load_fixture, load_fixture_text, load_page_text  # noqa: E402
+from liz_analyzer.categories import classify_category  # noqa: E402
+from liz_analyzer.intent_model import predict_intent  # noqa: E402
+from liz_analyzer.keywords import extract_keywords  # noqa: E402
+from liz_analyzer.models import AnalysisResult  # noqa: E402
+from liz_analyzer.scoring import (  # noqa: E402
+    calculate_content_score, calculate_final_intention_score, calculate_intent_accuracy,
+    calculate_intentionality_score, score_result
+)
+from liz_analyzer.stub_server import StubWebhookServer  # noqa: E402
+from liz_analyzer.urls import canonicalize_url  # noqa: E402
+
+
+def measure(fn, iterations, warmup=3):
+    """Median/p95 wall time and per-call allocation of fn()"""
+    for _ in range(warmup):
+        fn()
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+
+    # Allocation is measured in a separate pass so tracing overhead does not skew the timings
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    fn()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "median_us": statistics.median(timings) * 1e6,
+        "p95_us": timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1e6,
+        "peak_kib": (peak - before) / 1024,
+        "retained_kib": (after - before) / 1024,
+    }
+
+
+def expect_error(fn):
+    def run():
+        try:
+            fn()
+        except AnalysisError:
+            return
+        raise AssertionError("expected AnalysisError")
+    return run
+
+
+def hotpath_cases():
+    document = load_fixture("campaign_article")[0]
+    result = AnalysisResult.from_dict(document)
+    demographics = result.audience_profile.demographics
+    campaign_relevancy = result.campaign_relevancy
+    success_body = load_fixture_text("campaign_article")
+    error_body = load_fixture_text("error_fetch_failed")
+    stream_lines = [json.dumps({name: value}) for name, value in document.items()]
+    tracked_url = "WWW.Example.com/News/Marathon-Guide/?utm_source=newsletter&utm_medium=email&id=42&fbclid=abc#comments"
+    page = load_page_text("article_page")
+    page_title, page_text, _ = extract_main_text(page)
+
+    return [
+        # Chart builders are memoized; time both a fresh build and a rerun with unchanged inputs
+        ("charts.create_age_chart", lambda: create_age_chart.uncached(demographics.age_distribution)),
+        ("charts.create_gender_chart", lambda: create_gender_chart.uncached(demographics.gender_distribution)),
+        ("charts.create_intentionality_chart", lambda: create_intentionality_chart.uncached(result.intentionality_breakdown)),
+        ("charts.create_keyword_chart", lambda: create_keyword_chart.uncached(result.primary_keywords, result.secondary_keywords)),
+        ("charts.create_age_chart (memoized)", lambda: create_age_chart(demographics.age_distribution)),
+        ("charts.create_keyword_chart (memoized)", lambda: create_keyword_chart(result.primary_keywords, result.secondary_keywords)),
+        ("scoring.calculate_intentionality_score", lambda: calculate_intentionality_score(result)),
+        ("scoring.calculate_final_intention_score", lambda: calculate_final_intention_score(result, campaign_relevancy)),
+        ("scoring.calculate_intent_accuracy", lambda: calculate_intent_accuracy(result)),
+        ("scoring.calculate_content_score", lambda: calculate_content_score(result)),
+        ("scoring.score_result", lambda: score_result(result, campaign_enabled=True)),
+        ("parse.success", lambda: parse_analysis_response(200, success_body, lambda: json.loads(success_body))),
+        ("parse.error_shape", expect_error(lambda: parse_analysis_response(200, error_body, lambda: json.loads(error_body)))),
+        ("parse.stream", lambda: parse_analysis_stream(stream_lines)),
+        ("models.AnalysisResult.from_dict", lambda: AnalysisResult.from_dict(document)),
+        ("urls.canonicalize_url", lambda: canonicalize_url(tracked_url)),
+        ("extract.extract_main_text", lambda: extract_main_text(page)),
+        ("keywords.extract_keywords", lambda: extract_keywords(page_text, page_title)),
+        ("intent_model.predict_intent", lambda: predict_intent(page_text, page_title)),
+        ("categories.classify_category", lambda: classify_category(page_text, page_title)),
+        ("parse.invalid_json", expect_error(lambda: parse_analysis_response(200, "<html>", lambda: json.loads("<html>")))),
+    ]
+
+
+def e2e_case():
+    """Full WebhookClient round trip (pooled connection, parse) against the local stub webhook"""
+    server = StubWebhookServer().start()
+    client = WebhookClient(webhook_url=server.url)
+    params = {"url": "https://example.com/marathon-guide", "campaign_definition": "Running shoes launch"}
+
+    def close():
+        client.close()
+        server.stop()
+
+    return ("client.analyze (local stub)", lambda: client.analyze(params)), close
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hot-path latency and allocation benchmarks")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--e2e", action="store_true", help="also time a full client round trip to a local stub webhook")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--save", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON written by --save")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="allowed median slowdown factor with --compare")
+    args = parser.parse_args()
+
+    cases = hotpath_cases()
+    cleanup = None
+    if args.e2e:
+        case, cleanup = e2e_case()
+        cases.append(case)
+    cases = [(name, fn) for name, fn in cases if args.filter in name]
+
+    results = {}
+    try:
+        print(f"{'case':42} {'median us':>11} {'p95 us':>11} {'peak KiB':>10} {'kept KiB':>10}")
+        for name, fn in cases:
+            stats = measure(fn, args.iterations)
+            results[name] = stats
+            print(f"{name:42} {stats['median_us']:11.1f} {stats['p95_us']:11.1f} "
+                  f"{stats['peak_kib']:10.1f} {stats['retained_kib']:10.1f}")
+    finally:
+        if cleanup:
+            cleanup()
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = []
+        for name, stats in results.items():
+            if name in baseline and stats["median_us"] > baseline[name]["median_us"] * args.tolerance:
+                regressions.append(name)
+                print(f"REGRESSION {name}: {baseline[name]['median_us']:.1f} us -> {stats['median_us']:.1f} us")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
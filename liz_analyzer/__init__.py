@@ -0,0 +1,11 @@
+## Liz contextual analysis engine
+#
+# Shared, Streamlit-independent building blocks for the analyzer pages:
+#   engine   - URL validation and the cached webhook analysis pipeline
+#   pipeline - local stages around the webhook call, shared with the JSON API
+#   client   - pooled, retrying n8n webhook client
+#   cache    - persistent analysis result cache
+#   scoring  - intent / campaign / content scores and grades
+#   charts   - Plotly figure builders
+#   batch    - bounded concurrent bulk analysis
+#   ui       - Streamlit helpers (the only module that imports Streamlit)
@@ -0,0 +1,293 @@
+## Headless JSON API exposing the Liz scoring pipeline
+#
+# A dependency-free ASGI application; serve it with any ASGI server, e.g.
+#
+#     uvicorn liz_analyzer.api:app --host 0.0.0.0 --port 8000 --workers 4
+#
+# Endpoints:
+#     GET  /healthz
+#     GET  /analyze?url=...&campaign_definition=...&vertical=...[&full=1][&full_analysis=1]
+#     POST /analyze   {"url": ..., "campaign_definition": ..., "vertical": ..., "full": false, "full_analysis": false}
+#
+# `full` adds the whole result document to the response; `full_analysis`
+# skips the cascade's local answers and always goes to the workflow.
+# /healthz reports this worker's cascade statistics and per-stage timings.
+
+import asyncio
+import json
+import time
+from urllib.parse import parse_qsl, urlencode
+
+from .async_client import AsyncWebhookClient
+from .cache import AnalysisCache, make_cache_key
+from .circuit import OPEN, CircuitBreaker, CircuitOpenError, is_upstream_failure
+from .cascade import Cascade, analysis_path, cascade_enabled
+from .client import AnalysisError
+from .engine import build_analysis_params, is_valid_url
+from .extract import ArticleExtractor, extraction_enabled
+from .keywords import local_keywords_enabled
+from .pipeline import AnalysisPipeline, result_from_cache
+from .scoring import score_result
+from .singleflight import AsyncSingleFlight
+from .timings import StageTimings
+
+
+MAX_BODY_BYTES = 64 * 1024
+
+# Request fields that must be strings when present
+TEXT_FIELDS = ("url", "campaign_definition", "vertical")
+
+# Upstream failures map to 502 (503 while the circuit is open), everything the caller got wrong to 400
+CLIENT_ERROR_TYPES = frozenset({"invalid_url", "invalid_request"})
+
+
+def build_api_response(processed_url, result, campaign_enabled, cached, full=False, stale_age=None):
+    """Compact JSON document returned for one analysis"""
+    document = {
+        'url': processed_url,
+        'cached': cached,
+        'stale': stale_age is not None,
+        'analysis_path': analysis_path(result),
+        'tier1_category': result.tier1_category,
+        'tier2_categories': list(result.tier2_categories),
+        'intent': {
+            'primary': result.intention.primary,
+            'confidence': result.intention.confidence,
+        },
+        'intentionality_breakdown': result.intentionality_breakdown,
+        'primary_keywords': list(result.primary_keywords),
+        'secondary_keywords': list(result.secondary_keywords),
+        'scores': score_result(result, campaign_enabled),
+    }
+    if stale_age is not None:
+        document['stale_age_seconds'] = round(stale_age)
+    if full:
+        document['result'] = result.to_dict()
+    return document
+
+
+def _error_document(error):
+    return {
+        'error': True,
+        'error_type': error.error_type,
+        'message': error.message,
+        'suggestions': error.suggestions,
+    }
+
+
+def _text_fields(request, names):
+    """The request's string fields in order, "" when absent or null; AnalysisError for any other type"""
+    values = []
+    for name in names:
+        value = request.get(name)
+        if value is None:
+            value = ""
+        elif not isinstance(value, str):
+            raise AnalysisError("invalid_request", f"'{name}' must be a string")
+        values.append(value)
+    return values
+
+
+def _is_truthy(value):
+    return str(value).lower() in ("1", "true", "yes")
+
+
+class AnalysisAPI:
+    """ASGI application; the async webhook client and result cache are created once per worker.
+
+    Local article extraction (LIZ_EXTRACT_CONTENT), keyword extraction
+    (LIZ_LOCAL_KEYWORDS) and the cascade (LIZ_CASCADE) are the same
+    AnalysisPipeline AnalysisEngine uses, run in worker threads around the
+    async webhook call.
+    """
+
+    def __init__(self, client=None, cache=None, breaker=None, extractor=None, send_content=None, keywords=None,
+                 intent_model=None, cascade=None, categorizer=None):
+        self.client = client
+        self.cache = cache
+        self.breaker = breaker
+        self.extractor = extractor
+        self.send_content = send_content
+        self.keywords = keywords
+        self.intent_model = intent_model
+        self.cascade = cascade
+        self.categorizer = categorizer
+        self.pipeline = None
+        self.inflight = AsyncSingleFlight()
+        self.timings = StageTimings()
+
+    def _ensure_resources(self):
+        if self.client is None:
+            self.client = AsyncWebhookClient.from_env()
+        if self.cache is None:
+            self.cache = AnalysisCache.from_env()
+        if self.breaker is None:
+            self.breaker = CircuitBreaker.from_env()
+        if self.send_content is None:
+            # An extractor passed in sends its text; from the environment only LIZ_EXTRACT_CONTENT does
+            self.send_content = self.extractor is not None or extraction_enabled()
+        if self.cascade is None and cascade_enabled():
+            self.cascade = Cascade.from_env(categorizer=self.categorizer)
+        if self.extractor is None and (extraction_enabled() or local_keywords_enabled() or self.cascade is not None):
+            self.extractor = ArticleExtractor.from_env()
+        if self.pipeline is None:
+            self.pipeline = AnalysisPipeline(
+                self.cache, extractor=self.extractor, send_content=self.send_content, keywords=self.keywords,
+                intent_model=self.intent_model, categorizer=self.categorizer, cascade=self.cascade,
+                timings=self.timings
+            )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._ensure_resources()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self.client is not None:
+                    await self.client.aclose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send):
+        path = scope["path"].rstrip("/") or "/"
+        method = scope["method"]
+
+        if path == "/healthz" and method in ("GET", "HEAD"):
+            health = {"status": "ok"}
+            if self.cascade is not None:
+                health["cascade"] = self.cascade.stats.summary()
+            timings = self.timings.summary()
+            if timings:
+                health["timings"] = timings
+            await self._respond(send, 200, health)
+            return
+
+        if path != "/analyze":
+            await self._respond(send, 404, {"error": True, "error_type": "not_found", "message": "Not found"})
+            return
+
+        if method == "GET":
+            request = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        elif method == "POST":
+            try:
+                request = await self._read_json(receive)
+            except AnalysisError as e:
+                await self._respond(send, 400, _error_document(e))
+                return
+        else:
+            await self._respond(send, 405, {"error": True, "error_type": "method_not_allowed", "message": "Use GET or POST"})
+            return
+
+        try:
+            url, campaign_definition, vertical = _text_fields(request, TEXT_FIELDS)
+            document = await self.analyze(
+                url, campaign_definition, vertical,
+                full=_is_truthy(request.get("full", False)),
+                full_analysis=_is_truthy(request.get("full_analysis", False)),
+            )
+        except AnalysisError as e:
+            if e.error_type in CLIENT_ERROR_TYPES:
+                status = 400
+            elif isinstance(e, CircuitOpenError):
+                status = 503
+            else:
+                status = 502
+            await self._respond(send, status, _error_document(e))
+            return
+
+        await self._respond(send, 200, document)
+
+    async def analyze(self, raw_url, campaign_definition="", vertical="", full=False, full_analysis=False):
+        """Validate, analyze (through the shared cache) and score one URL; `full_analysis` bypasses local answers"""
+        self._ensure_resources()
+
+        is_valid, processed_url = is_valid_url(raw_url)
+        if not is_valid:
+            raise AnalysisError("invalid_url", processed_url)
+
+        result = await asyncio.to_thread(self.pipeline.cached, processed_url, campaign_definition, vertical, full_analysis)
+        cached = result is not None
+        stale_age = None
+        if not cached:
+            params = build_analysis_params(processed_url, campaign_definition, vertical)
+            try:
+                result = await self.inflight.do(
+                    urlencode(dict(params, full_analysis=int(full_analysis))), self._fetch,
+                    params, processed_url, campaign_definition, vertical, full_analysis
+                )
+            except AnalysisError as e:
+                # Webhook down: degrade to an expired cached result when there is one
+                if not (isinstance(e, CircuitOpenError) or is_upstream_failure(e)):
+                    raise
+                stale = await asyncio.to_thread(
+                    self.cache.get_stale, make_cache_key(processed_url, campaign_definition, vertical)
+                )
+                result = result_from_cache(stale[0]) if stale is not None else None
+                if result is None:
+                    raise
+                stale_age = stale[1]
+                cached = True
+
+        return build_api_response(processed_url, result, bool(campaign_definition), cached, full, stale_age)
+
+    async def _fetch(self, params, processed_url, campaign_definition, vertical, full_analysis):
+        local = await asyncio.to_thread(
+            self.pipeline.prepare, processed_url, campaign_definition, vertical, None, self.breaker.state == OPEN,
+            full_analysis
+        )
+        if local.result is not None:
+            return local.result
+        self.breaker.before_call()
+        started = time.perf_counter()
+        try:
+            document = await self.client.analyze(params, local.content)
+        except Exception as e:
+            self.breaker.record_outcome(e)
+            raise
+        except BaseException:
+            # Cancelled: says nothing about the webhook
+            self.breaker.release()
+            raise
+        self.breaker.record_outcome()
+        self.timings.record("webhook", time.perf_counter() - started)
+        return await asyncio.to_thread(self.pipeline.finish, local, document, processed_url, campaign_definition, vertical)
+
+    async def _read_json(self, receive):
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if len(body) > MAX_BODY_BYTES:
+                raise AnalysisError("invalid_request", "Request body too large")
+
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError as e:
+            raise AnalysisError("invalid_request", f"Request body is not valid JSON: {e}")
+        if not isinstance(request, dict):
+            raise AnalysisError("invalid_request", "Request body must be a JSON object")
+        return request
+
+    async def _respond(self, send, status, document):
+        body = json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json; charset=utf-8"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+app = AnalysisAPI()
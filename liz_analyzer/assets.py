@@ -0,0 +1,81 @@
+## Waiting-state video, poster and web fonts, from their public hosts or self-hosted
+#
+# By default the landing video comes from lizos.seedtag.com and the Inter font
+# from fonts.googleapis.com. With LIZ_SELF_HOSTED_ASSETS=1 both are served from
+# ./static through Streamlit's static file serving instead; fetch them once with
+#
+#     python scripts/fetch_static_assets.py
+#
+# Static URLs carry a content-hash ?v= so Streamlit sends them with a
+# long-lived Cache-Control header. Missing fonts fall back to the system
+# sans-serif rather than being fetched remotely.
+#
+# Streamlit 1.28 serves every static file that is not a raster image as
+# text/plain with X-Content-Type-Options: nosniff, and Firefox refuses to play
+# a video served that way. The self-hosted video is therefore only offered
+# while server.enableStaticServing is on, and always ahead of the remote one,
+# which the browser falls back to when it rejects the local copy (or it has
+# not been fetched).
+
+import functools
+import hashlib
+import os
+
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+STATIC_URL_PREFIX = "app/static/"
+
+REMOTE_VIDEO_URL = "https://lizos.seedtag.com/assets/videos/loop_videos/red_network/red_network_loop.webm"
+REMOTE_FONT_CSS_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap"
+
+VIDEO_FILE = "video/red_network_loop.webm"
+POSTER_FILE = "waiting_poster.png"
+FONT_DIR = "fonts"
+FONT_CSS_FILE = "fonts/inter.css"
+
+
+def self_hosted_assets():
+    return os.environ.get("LIZ_SELF_HOSTED_ASSETS", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def static_path(name):
+    return os.path.join(STATIC_DIR, *name.split("/"))
+
+
+@functools.lru_cache(maxsize=None)
+def file_version(path):
+    """Short content hash of a static file, used as its cache-busting ?v="""
+    digest = hashlib.blake2b(digest_size=8)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def static_url(name):
+    """Browser URL of a file under ./static, or None if it is not there"""
+    path = static_path(name)
+    if not os.path.isfile(path):
+        return None
+    return f"{STATIC_URL_PREFIX}{name}?v={file_version(path)}"
+
+
+def waiting_video_sources(static_serving):
+    """Video URLs for the waiting state, most preferred first; the remote video is always the last"""
+    local = static_url(VIDEO_FILE) if self_hosted_assets() and static_serving else None
+    return [local, REMOTE_VIDEO_URL] if local else [REMOTE_VIDEO_URL]
+
+
+def poster_url():
+    return static_url(POSTER_FILE)
+
+
+def font_css():
+    """CSS that makes Inter available: the Google Fonts import, or the self-hosted @font-face rules"""
+    if not self_hosted_assets():
+        return f"@import url('{REMOTE_FONT_CSS_URL}');"
+    path = static_path(FONT_CSS_FILE)
+    if not os.path.isfile(path):
+        return ""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
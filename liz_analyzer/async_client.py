@@ -0,0 +1,65 @@
+## Async n8n webhook client for the headless API
+
+import asyncio
+import os
+
+import httpx
+
+from .client import (
+    DEFAULT_CONNECT_TIMEOUT, DEFAULT_MAX_RETRIES, DEFAULT_POOL_SIZE, DEFAULT_READ_TIMEOUT, DEFAULT_WEBHOOK_URL,
+    CallAttempts, RetryPolicy, _retry_after_seconds, parse_analysis_response
+)
+from .endpoints import EndpointRegistry
+
+
+class AsyncWebhookClient:
+    """Async counterpart of WebhookClient over a pooled `httpx.AsyncClient`.
+
+    The attempt loop is driven by the same CallAttempts as the synchronous
+    client (endpoint routing, failover, retries and error values), and
+    responses go through the same parser.
+    """
+
+    def __init__(self, webhook_url=DEFAULT_WEBHOOK_URL, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout=DEFAULT_READ_TIMEOUT, retry_policy=None, pool_size=DEFAULT_POOL_SIZE, endpoints=None):
+        self.endpoints = endpoints or EndpointRegistry([webhook_url])
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.http = httpx.AsyncClient(
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            headers={"Accept": "application/json"},
+        )
+
+    @classmethod
+    def from_env(cls):
+        """Create a client configured from LIZ_WEBHOOK_* / LIZ_ENDPOINT_* environment variables"""
+        return cls(
+            connect_timeout=float(os.environ.get("LIZ_WEBHOOK_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)),
+            read_timeout=float(os.environ.get("LIZ_WEBHOOK_READ_TIMEOUT", DEFAULT_READ_TIMEOUT)),
+            retry_policy=RetryPolicy(max_retries=int(os.environ.get("LIZ_WEBHOOK_MAX_RETRIES", DEFAULT_MAX_RETRIES))),
+            pool_size=int(os.environ.get("LIZ_API_POOL_SIZE", DEFAULT_POOL_SIZE)),
+            endpoints=EndpointRegistry.from_env(DEFAULT_WEBHOOK_URL),
+        )
+
+    async def analyze(self, params, content=None):
+        """Run the analysis workflow for `params` (POSTing extracted `content` when given) and return the result dict"""
+        attempts = CallAttempts(self.endpoints, self.retry_policy)
+        for endpoint in attempts:
+            try:
+                if content is None:
+                    response = await self.http.get(endpoint.url, params=params)
+                else:
+                    response = await self.http.post(endpoint.url, params=params, json=content)
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                delay = attempts.unreachable(endpoint, e)
+            else:
+                if attempts.responded(endpoint, response.status_code):
+                    return parse_analysis_response(response.status_code, response.text, response.json)
+                delay = attempts.rejected(response.status_code, response.text, _retry_after_seconds(response))
+            if delay:
+                await asyncio.sleep(delay)
+
+        raise attempts.error
+
+    async def aclose(self):
+        await self.http.aclose()
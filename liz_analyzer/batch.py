@@ -0,0 +1,177 @@
+## Bulk URL analysis with a bounded worker pool and per-host concurrency limits
+
+import csv
+import io
+import re
+import time
+from collections import Counter, OrderedDict, deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+
+from .cascade import analysis_path
+from .scoring import score_result
+from .urls import canonicalize_url
+
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 2
+MAX_BATCH_URLS = 1000
+
+_URL_SPLIT_PATTERN = re.compile(r"\s+")
+
+# One finished URL; exactly one of result / error is set
+BatchOutcome = namedtuple("BatchOutcome", ["index", "url", "result", "error", "elapsed"])
+
+
+def _looks_like_url(value):
+    value = value.strip().lower()
+    return value.startswith(("http://", "https://")) or ("." in value and " " not in value)
+
+
+def parse_url_list(text="", csv_file=None, limit=MAX_BATCH_URLS):
+    """Collect URLs from pasted text and/or an uploaded CSV, de-duplicated in first-seen order.
+
+    Spellings of the same article (tracking parameters, fragments, host case...)
+    count as duplicates; invalid entries are kept so they show up as failed rows.
+    """
+    candidates = []
+
+    if text:
+        candidates.extend(part for part in _URL_SPLIT_PATTERN.split(text) if part)
+
+    if csv_file is not None:
+        raw = csv_file.read() if hasattr(csv_file, "read") else csv_file
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8-sig", errors="replace")
+        rows = [row for row in csv.reader(io.StringIO(raw)) if row]
+        if rows:
+            header = [cell.strip().lower() for cell in rows[0]]
+            column = header.index("url") if "url" in header else 0
+            if "url" in header or not _looks_like_url(rows[0][column]):
+                rows = rows[1:]
+            candidates.extend(row[column].strip() for row in rows if len(row) > column and row[column].strip())
+
+    seen = set()
+    urls = []
+    for candidate in candidates:
+        key = canonicalize_url(candidate) or candidate
+        if key in seen:
+            continue
+        seen.add(key)
+        urls.append(candidate)
+        if len(urls) >= limit:
+            break
+    return urls
+
+
+def _host(url):
+    return (urlparse(url if "://" in url else f"https://{url}").hostname or "").lower()
+
+
+class HostScheduler:
+    """Per-host queues of (index, url) that only release a URL while its host has a free slot.
+
+    URLs are handed out round-robin across hosts, so a batch dominated by one
+    publisher still keeps the rest of the pool busy with the other hosts.
+    Not thread-safe: run_batch drives it from the consuming thread.
+    """
+
+    def __init__(self, urls, per_host_limit=DEFAULT_PER_HOST_LIMIT):
+        self.per_host_limit = max(1, int(per_host_limit))
+        self._queues = OrderedDict()
+        for index, url in enumerate(urls):
+            self._queues.setdefault(_host(url), deque()).append((index, url))
+        self._running = Counter()
+
+    def next_ready(self):
+        """(index, url) of the next URL allowed to start, or None if every queued host is at its limit"""
+        for host, queue in self._queues.items():
+            if self._running[host] < self.per_host_limit:
+                self._running[host] += 1
+                item = queue.popleft()
+                if queue:
+                    self._queues.move_to_end(host)
+                else:
+                    del self._queues[host]
+                return item
+        return None
+
+    def release(self, url):
+        self._running[_host(url)] -= 1
+
+
+def run_batch(urls, analyze, max_workers=DEFAULT_MAX_WORKERS, per_host_limit=DEFAULT_PER_HOST_LIMIT):
+    """Run `analyze(url)` over urls concurrently and yield a BatchOutcome as each one completes.
+
+    A URL is only submitted once a worker and a slot for its host are both
+    free, so at most `per_host_limit` calls hit one host at a time without
+    idling workers that could serve other hosts. Exceptions raised by
+    `analyze` are captured on the outcome rather than aborting the batch.
+    Closing the generator early cancels URLs that have not started yet.
+    """
+    max_workers = max(1, int(max_workers))
+    scheduler = HostScheduler(urls, per_host_limit)
+
+    def run_one(index, url):
+        started = time.perf_counter()
+        try:
+            result = analyze(url)
+            return BatchOutcome(index, url, result, None, time.perf_counter() - started)
+        except Exception as e:
+            return BatchOutcome(index, url, None, e, time.perf_counter() - started)
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="liz-batch")
+    running = set()
+
+    def fill():
+        while len(running) < max_workers:
+            item = scheduler.next_ready()
+            if item is None:
+                return
+            running.add(pool.submit(run_one, *item))
+
+    try:
+        fill()
+        while running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            outcomes = []
+            for future in finished:
+                running.discard(future)
+                outcome = future.result()
+                scheduler.release(outcome.url)
+                outcomes.append(outcome)
+            # Top the pool up before handing results to the (possibly slow) consumer
+            fill()
+            yield from outcomes
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Flatten one batch outcome into a results table row
+def build_batch_row(outcome, campaign_enabled):
+    row = {"URL": outcome.url, "Status": "✅ Done", "Category": "", "Intent": "",
+           "Intention Score": None, "Grade": "", "Content Score": None,
+           "Path": "", "Seconds": round(outcome.elapsed, 1), "Error": ""}
+
+    if outcome.error is not None:
+        row["Status"] = "❌ Failed"
+        row["Error"] = getattr(outcome.error, "message", str(outcome.error))
+        return row
+
+    result = outcome.result
+    scores = score_result(result, campaign_enabled)
+
+    row["Category"] = result.tier1_category or 'Unknown'
+    row["Intent"] = (result.intention.primary or 'Unknown').title()
+    row["Intention Score"] = scores['final_intention_score']
+    row["Grade"] = scores['final_intention_grade']
+    row["Content Score"] = scores['content_score']
+    row["Path"] = analysis_path(result)
+    return row
+
+def batch_rows_to_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
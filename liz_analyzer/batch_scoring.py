@@ -0,0 +1,201 @@
+## Vectorized scoring for bulk re-scoring of stored analysis results
+#
+# Computes the same numbers as the scalar functions in scoring.py over a
+# columnar (NumPy) representation, so tens of thousands of stored results can
+# be re-scored in one pass when weights change.
+
+import numpy as np
+
+from .scoring import (
+    ACTION_INTENT_WEIGHT, CAMPAIGN_FIT_WEIGHT, CONFIDENCE_ACCURACY, CONFIDENCE_CONTENT_SCORES,
+    CONFIDENCE_MULTIPLIERS, FINAL_INTENTION_GRADES, INTENT_WEIGHTS, INTENTIONALITY_GRADES
+)
+
+
+INTENT_TYPES = ('transactional', 'commercial', 'navigational', 'informational')
+UNKNOWN_INTENT = len(INTENT_TYPES)
+
+# Confidence codes. MISSING and OTHER are kept apart because the scalar
+# scorers fall back to different defaults when `confidence` is absent.
+CONFIDENCE_HIGH = 0
+CONFIDENCE_MEDIUM = 1
+CONFIDENCE_LOW = 2
+CONFIDENCE_MISSING = 3
+CONFIDENCE_OTHER = 4
+
+_CONFIDENCE_CODES = {'high': CONFIDENCE_HIGH, 'medium': CONFIDENCE_MEDIUM, 'low': CONFIDENCE_LOW}
+_INTENT_CODES = {intent: code for code, intent in enumerate(INTENT_TYPES)}
+
+
+def _confidence_table(mapping, missing_default, other_value):
+    """Per-code lookup table mirroring `mapping.get(confidence, other_value)` in the scalar code"""
+    return np.array([
+        mapping['high'],
+        mapping['medium'],
+        mapping['low'],
+        mapping.get(missing_default, other_value),
+        other_value,
+    ])
+
+ACCURACY_BY_CONFIDENCE = _confidence_table(CONFIDENCE_ACCURACY, 'low', 85)
+MULTIPLIER_BY_CONFIDENCE = _confidence_table(CONFIDENCE_MULTIPLIERS, 'medium', 0.85)
+CONTENT_POINTS_BY_CONFIDENCE = _confidence_table(CONFIDENCE_CONTENT_SCORES, 'Low', 20)
+
+
+class ScoreColumns:
+    """Columnar inputs for n results.
+
+    Intent percentages are kept in each result's own key order (padded with
+    zeros) so the weighted sum adds terms in exactly the order the scalar loop
+    does, which keeps the rounding identical.
+
+    intent_codes        (n, k) int     index into INTENT_TYPES, UNKNOWN_INTENT for other keys
+    intent_percentages  (n, k) float   breakdown percentages
+    has_positive_intent (n,)   bool    any breakdown value > 0
+    confidence_codes    (n,)   int     CONFIDENCE_* code
+    primary_keyword_counts, secondary_keyword_counts, tier2_counts,
+    audience_type_counts, interest_group_counts   (n,) int
+    has_campaign        (n,)   bool    campaign analysis enabled and campaign_relevancy non-empty
+    campaign_fit_scores (n,)   float   overall_relevancy_score (0 where absent)
+    """
+
+    __slots__ = (
+        'intent_codes', 'intent_percentages', 'has_positive_intent', 'confidence_codes',
+        'primary_keyword_counts', 'secondary_keyword_counts', 'tier2_counts',
+        'audience_type_counts', 'interest_group_counts', 'has_campaign', 'campaign_fit_scores',
+    )
+
+    def __init__(self, intent_codes, intent_percentages, has_positive_intent, confidence_codes,
+                 primary_keyword_counts, secondary_keyword_counts, tier2_counts,
+                 audience_type_counts, interest_group_counts, has_campaign, campaign_fit_scores):
+        self.intent_codes = np.asarray(intent_codes, dtype=np.int64)
+        self.intent_percentages = np.asarray(intent_percentages, dtype=np.float64)
+        self.has_positive_intent = np.asarray(has_positive_intent, dtype=bool)
+        self.confidence_codes = np.asarray(confidence_codes, dtype=np.int64)
+        self.primary_keyword_counts = np.asarray(primary_keyword_counts, dtype=np.int64)
+        self.secondary_keyword_counts = np.asarray(secondary_keyword_counts, dtype=np.int64)
+        self.tier2_counts = np.asarray(tier2_counts, dtype=np.int64)
+        self.audience_type_counts = np.asarray(audience_type_counts, dtype=np.int64)
+        self.interest_group_counts = np.asarray(interest_group_counts, dtype=np.int64)
+        self.has_campaign = np.asarray(has_campaign, dtype=bool)
+        self.campaign_fit_scores = np.asarray(campaign_fit_scores, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.confidence_codes)
+
+    @classmethod
+    def from_results(cls, results, campaign_enabled=False):
+        """Build columns from AnalysisResult models"""
+        results = list(results)
+        n = len(results)
+        width = max((len(r.intentionality_breakdown) for r in results), default=0) or 1
+
+        intent_codes = np.full((n, width), UNKNOWN_INTENT, dtype=np.int64)
+        intent_percentages = np.zeros((n, width), dtype=np.float64)
+        has_positive_intent = np.zeros(n, dtype=bool)
+        confidence_codes = np.empty(n, dtype=np.int64)
+        counts = np.zeros((5, n), dtype=np.int64)
+        has_campaign = np.zeros(n, dtype=bool)
+        campaign_fit_scores = np.zeros(n, dtype=np.float64)
+
+        for i, result in enumerate(results):
+            breakdown = result.intentionality_breakdown
+            for j, (intent_type, percentage) in enumerate(breakdown.items()):
+                intent_codes[i, j] = _INTENT_CODES.get(intent_type.lower(), UNKNOWN_INTENT)
+                intent_percentages[i, j] = percentage
+            has_positive_intent[i] = bool(breakdown) and any(val > 0 for val in breakdown.values())
+
+            confidence = result.intention.confidence
+            if confidence is None:
+                confidence_codes[i] = CONFIDENCE_MISSING
+            else:
+                confidence_codes[i] = _CONFIDENCE_CODES.get(confidence, CONFIDENCE_OTHER)
+
+            audience_profile = result.audience_profile
+            counts[0, i] = len(result.primary_keywords)
+            counts[1, i] = len(result.secondary_keywords)
+            counts[2, i] = len(result.tier2_categories)
+            counts[3, i] = len(audience_profile.type)
+            counts[4, i] = len(audience_profile.interest_groups)
+
+            campaign_relevancy = result.campaign_relevancy if campaign_enabled else None
+            if campaign_relevancy is not None:
+                has_campaign[i] = True
+                campaign_fit_scores[i] = campaign_relevancy.overall_relevancy_score
+
+        return cls(intent_codes, intent_percentages, has_positive_intent, confidence_codes,
+                   counts[0], counts[1], counts[2], counts[3], counts[4], has_campaign, campaign_fit_scores)
+
+
+class _GradeTable:
+    """Threshold lookup equivalent to the scalar if/elif grade ladders"""
+
+    def __init__(self, grade_table, default_grade, default_description):
+        ascending = sorted(grade_table)
+        self.thresholds = np.array([threshold for threshold, _, _ in ascending])
+        self.grades = np.array([default_grade] + [grade for _, grade, _ in ascending])
+        self.descriptions = np.array([default_description] + [description for _, _, description in ascending], dtype=object)
+
+    def index(self, scores):
+        # Number of thresholds the score reaches; 0 means the default grade
+        return np.searchsorted(self.thresholds, scores, side='right')
+
+_INTENTIONALITY_GRADES = _GradeTable(INTENTIONALITY_GRADES, "F", "Minimal Action Intent")
+_FINAL_INTENTION_GRADES = _GradeTable(FINAL_INTENTION_GRADES, "F", "Very Poor")
+
+
+def intentionality_scores(columns, intent_weights=None):
+    """Vectorized calculate_intentionality_score"""
+    weights = intent_weights or INTENT_WEIGHTS
+    weight_table = np.array([weights.get(intent, 0) for intent in INTENT_TYPES] + [0], dtype=np.float64)
+    terms = (columns.intent_percentages / 100) * weight_table[columns.intent_codes]
+
+    # Add term by term, left to right, exactly like the scalar loop
+    weighted = np.zeros(len(columns), dtype=np.float64)
+    for j in range(terms.shape[1]):
+        weighted = weighted + terms[:, j]
+
+    final = weighted * MULTIPLIER_BY_CONFIDENCE[columns.confidence_codes]
+    return np.minimum(np.rint(final), 100).astype(np.int64)
+
+
+def score_columns(columns, intent_weights=None):
+    """Every score and grade from scoring.score_result, as arrays of length n"""
+    intentionality = intentionality_scores(columns, intent_weights)
+    intentionality_grade = _INTENTIONALITY_GRADES.grades[_INTENTIONALITY_GRADES.index(intentionality)]
+
+    combined = (columns.campaign_fit_scores * CAMPAIGN_FIT_WEIGHT) + (intentionality * ACTION_INTENT_WEIGHT)
+    final = np.where(columns.has_campaign, np.rint(combined), intentionality).astype(np.int64)
+    final_index = _FINAL_INTENTION_GRADES.index(final)
+    final_description = _FINAL_INTENTION_GRADES.descriptions[final_index]
+    prefix = np.where(columns.has_campaign, "Overall Intent: ", "Action Intent: ").astype(object)
+
+    keyword_points = np.minimum(columns.primary_keyword_counts * 3 + columns.secondary_keyword_counts * 2, 20)
+    category_points = np.minimum(columns.tier2_counts * 5, 15)
+    audience_points = np.minimum(columns.audience_type_counts * 3 + columns.interest_group_counts * 2, 15)
+    content = np.minimum(
+        CONTENT_POINTS_BY_CONFIDENCE[columns.confidence_codes] + keyword_points + category_points + audience_points,
+        100
+    ).astype(np.int64)
+
+    accuracy = np.minimum(
+        ACCURACY_BY_CONFIDENCE[columns.confidence_codes] + np.where(columns.has_positive_intent, 10, 0),
+        99
+    ).astype(np.int64)
+
+    return {
+        'intentionality_score': intentionality,
+        'intentionality_grade': intentionality_grade,
+        'final_intention_score': final,
+        'final_intention_grade': _FINAL_INTENTION_GRADES.grades[final_index],
+        'final_intention_description': prefix + final_description,
+        'score_type': np.where(columns.has_campaign, "combined", "action_only"),
+        'campaign_fit_score': np.where(columns.has_campaign, columns.campaign_fit_scores, np.nan),
+        'content_score': content,
+        'intent_accuracy': accuracy,
+    }
+
+
+def score_results(results, campaign_enabled=False, intent_weights=None):
+    """Convenience wrapper: build columns from AnalysisResult models and score them"""
+    return score_columns(ScoreColumns.from_results(results, campaign_enabled), intent_weights)
@@ -0,0 +1,192 @@
+## Persistent analysis result cache shared by every Streamlit session
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+DEFAULT_CACHE_PATH = os.path.join(".liz_cache", "analysis_cache.sqlite3")
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 2000
+# Expired results are kept this much longer so they can be served while the webhook is down
+DEFAULT_STALE_SECONDS = 7 * 24 * 60 * 60
+
+
+def make_cache_key(url, campaign_definition="", vertical="", variant=""):
+    """Build a stable cache key from the validated URL and campaign parameters.
+
+    `variant` keeps other kinds of result for the same analysis (the
+    cascade's local answers) apart from the workflow's.
+    """
+    key_parts = [url or "", (campaign_definition or "").strip(), (vertical or "").strip()]
+    if variant:
+        key_parts.append(variant)
+    payload = json.dumps(key_parts, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    """SQLite backed result store with TTL expiry and LRU size eviction.
+
+    One instance is meant to be shared by the whole process (see
+    ``st.cache_resource`` in app.py); the hit/miss/eviction counters are
+    process-wide so they can be used to size ``max_entries`` and ``ttl_seconds``.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_seconds=DEFAULT_TTL_SECONDS, max_entries=DEFAULT_MAX_ENTRIES,
+                 stale_seconds=DEFAULT_STALE_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stale_seconds = stale_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        if path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_analysis_cache_last_access ON analysis_cache (last_access)"
+        )
+
+    @classmethod
+    def from_env(cls):
+        """Create a cache configured from LIZ_CACHE_* environment variables"""
+        return cls(
+            path=os.environ.get("LIZ_CACHE_PATH", DEFAULT_CACHE_PATH),
+            ttl_seconds=float(os.environ.get("LIZ_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+            max_entries=int(os.environ.get("LIZ_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            stale_seconds=float(os.environ.get("LIZ_CACHE_STALE_SECONDS", DEFAULT_STALE_SECONDS)),
+        )
+
+    def _is_expired(self, created_at, now):
+        return bool(self.ttl_seconds) and now - created_at > self.ttl_seconds
+
+    def _is_past_stale_window(self, created_at, now):
+        return bool(self.ttl_seconds) and now - created_at > self.ttl_seconds + self.stale_seconds
+
+    def get(self, key):
+        """Return the cached result for key, or None on a miss or expired entry"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM analysis_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            payload, created_at = row
+            if self._is_expired(created_at, now):
+                # Keep it around for get_stale until the stale window has passed too;
+                # an expiration is counted once, when the row is deleted
+                if self._is_past_stale_window(created_at, now):
+                    self._conn.execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+                    self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE analysis_cache SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+
+        return json.loads(payload)
+
+    def get_stale(self, key):
+        """Return (result, age_seconds) ignoring the TTL, for degraded mode; None if absent.
+
+        Does not count towards hits and misses.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM analysis_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        payload, created_at = row
+        if self._is_past_stale_window(created_at, now):
+            return None
+        return json.loads(payload), now - created_at
+
+    def set(self, key, result, url=""):
+        """Store a parsed analysis result and evict least recently used entries"""
+        now = time.time()
+        payload = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, url, payload, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, url, payload, now, now),
+            )
+            self._evict_overflow()
+
+    def _evict_overflow(self):
+        if not self.max_entries:
+            return
+
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+
+        self._conn.execute(
+            "DELETE FROM analysis_cache WHERE key IN "
+            "(SELECT key FROM analysis_cache ORDER BY last_access ASC LIMIT ?)",
+            (overflow,),
+        )
+        self.evictions += overflow
+
+    def purge_expired(self):
+        """Drop every entry past the TTL and stale window and return how many were removed"""
+        if not self.ttl_seconds:
+            return 0
+
+        cutoff = time.time() - self.ttl_seconds - self.stale_seconds
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM analysis_cache WHERE created_at < ?", (cutoff,)
+            ).rowcount
+            self.expirations += removed
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM analysis_cache")
+
+    def stats(self):
+        """Counters used to size the cache"""
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
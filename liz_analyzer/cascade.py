@@ -0,0 +1,158 @@
+## Confidence-gated cascade: answer from the local models, call the workflow only when needed
+#
+# With LIZ_CASCADE=1 every analysis first runs the local models on the
+# extracted article text: keywords (keywords.py), the intent classifier
+# (intent_model.py) and the category classifier (categories.py). If
+# their confidence reaches LIZ_CASCADE_THRESHOLD the result is built locally
+# and the webhook is never called. Campaign analyses, pages whose text could
+# not be extracted and low-confidence predictions go to the workflow as usual.
+#
+# Local answers are cached under their own key (LOCAL_CACHE_VARIANT), never in
+# place of a workflow result, and a caller can ask for a full analysis to skip
+# them and go to the workflow.
+#
+# Each result records the path it took in `analysis_metadata`
+# ('analysis_path' and 'cascade_reason'), and CascadeStats counts paths so
+# the drop in LLM calls can be reported.
+#
+# The default threshold sits where precision starts to drop. On the fixture
+# pages (benchmarks/bench_cascade.py) 0.5 keeps every page local but gets a
+# buyer's guide wrong (75% precision); 0.6 and 0.7 send half the pages to the
+# workflow and get every local answer right; 0.8 sends them all. On the
+# held-out intent set (scripts/evaluate_intent_model.py) the intent model
+# alone is 98% precise on the 43% of examples it scores at 0.6 or more, and
+# 100% precise on the 23% at 0.7. The category confidence also has to clear it.
+
+import dataclasses
+import os
+import threading
+from collections import Counter
+
+from .categories import default_classifier
+from .models import AnalysisResult
+
+
+DEFAULT_CONFIDENCE_THRESHOLD = 0.6
+
+# make_cache_key variant local answers are stored under
+LOCAL_CACHE_VARIANT = "local"
+
+PATH_LOCAL = "local"
+PATH_WEBHOOK = "webhook"
+
+# Why a result took its path
+REASON_CONFIDENT = "confident"
+REASON_LOW_CONFIDENCE = "low_confidence"
+REASON_CAMPAIGN = "campaign"
+REASON_NO_CONTENT = "no_content"
+REASON_FULL_REQUESTED = "full_requested"
+
+REASON_PATHS = {
+    REASON_CONFIDENT: PATH_LOCAL,
+    REASON_LOW_CONFIDENCE: PATH_WEBHOOK,
+    REASON_CAMPAIGN: PATH_WEBHOOK,
+    REASON_NO_CONTENT: PATH_WEBHOOK,
+    REASON_FULL_REQUESTED: PATH_WEBHOOK,
+}
+
+
+def cascade_enabled():
+    return os.environ.get("LIZ_CASCADE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def analysis_path(result):
+    """'local' or 'webhook'; results from before the cascade (or without it) came from the webhook"""
+    return (result.analysis_metadata or {}).get('analysis_path', PATH_WEBHOOK)
+
+
+class CascadeStats:
+    """Thread-safe counts of cascade decisions by reason"""
+
+    def __init__(self):
+        self.reasons = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, reason):
+        with self._lock:
+            self.reasons[reason] += 1
+
+    def summary(self):
+        """{'analyses', 'local', 'webhook', 'llm_call_rate', 'reasons'}; without a cascade every analysis is an LLM call"""
+        with self._lock:
+            reasons = dict(self.reasons)
+        analyses = sum(reasons.values())
+        local = sum(count for reason, count in reasons.items() if REASON_PATHS[reason] == PATH_LOCAL)
+        return {
+            'analyses': analyses,
+            'local': local,
+            'webhook': analyses - local,
+            'llm_call_rate': (analyses - local) / analyses if analyses else 1.0,
+            'reasons': reasons,
+        }
+
+
+class Cascade:
+    """Routing rules for the local fast path.
+
+    `categorizer(text, title)` is the category hook: it returns None or an
+    object with `tier1_category`, `tier2_categories` (names) and `confidence`
+    (0-1), like categories.CategoryClassifier. With one configured, a page it
+    cannot categorize confidently is escalated too; without one, routing goes
+    by intent alone. AnalysisPipeline runs this same categorizer for the
+    categories it reports, so the gate and the result share one prediction.
+    """
+
+    def __init__(self, threshold=DEFAULT_CONFIDENCE_THRESHOLD, categorizer=None):
+        self.threshold = threshold
+        self.categorizer = categorizer
+        self.stats = CascadeStats()
+
+    @classmethod
+    def from_env(cls, categorizer=None):
+        """Gates on the bundled category classifier unless another categorizer is given"""
+        return cls(
+            threshold=float(os.environ.get("LIZ_CASCADE_THRESHOLD", DEFAULT_CONFIDENCE_THRESHOLD)),
+            categorizer=categorizer or default_classifier(),
+        )
+
+    def confidence(self, prediction, category):
+        """Local confidence: the intent probability, capped by the category's when a categorizer is configured"""
+        if self.categorizer is None:
+            return prediction.probability
+        return min(prediction.probability, category.confidence) if category is not None else 0.0
+
+    def route(self, article, prediction, category, campaign_definition="", full_analysis=False):
+        """The cascade reason for one analysis; only REASON_CONFIDENT stays local"""
+        if full_analysis:
+            return REASON_FULL_REQUESTED
+        if campaign_definition:
+            return REASON_CAMPAIGN
+        if article is None or prediction is None:
+            return REASON_NO_CONTENT
+        if self.confidence(prediction, category) < self.threshold:
+            return REASON_LOW_CONFIDENCE
+        return REASON_CONFIDENT
+
+    def local_result(self, keywords, prediction, category):
+        """AnalysisResult built from the local models alone"""
+        result = AnalysisResult.from_dict({
+            'intention': {'primary': prediction.primary, 'confidence': prediction.confidence},
+            'intentionality_breakdown': dict(prediction.breakdown),
+            'tier1_category': category.tier1_category if category is not None else "",
+            'tier2_categories': list(category.tier2_categories) if category is not None else [],
+            'primary_keywords': list(keywords.primary) if keywords is not None else [],
+            'secondary_keywords': list(keywords.secondary) if keywords is not None else [],
+            'analysis_metadata': {
+                'keywords_source': 'local',
+                'local_confidence': round(self.confidence(prediction, category), 3),
+            },
+        })
+        return with_analysis_path(result, REASON_CONFIDENT)
+
+
+def with_analysis_path(result, reason):
+    """`result` with the cascade path and reason recorded in its analysis_metadata"""
+    metadata = dict(result.analysis_metadata or {})
+    metadata['analysis_path'] = REASON_PATHS[reason]
+    metadata['cascade_reason'] = reason
+    return dataclasses.replace(result, analysis_metadata=metadata)
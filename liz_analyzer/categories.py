@@ -0,0 +1,229 @@
+## Local IAB category classifier: tier 1 and tier 2 categories from an indexed term dictionary
+#
+#     python -m liz_analyzer.categories article.html notes.txt
+#     curl -s https://example.com/article | python -m liz_analyzer.categories -
+#
+# data/iab_category_terms.tsv lists terms for each (tier 1, tier 2) category.
+# At load it becomes an inverted index (term -> the categories it belongs to,
+# weighted down for terms shared between categories) and a word-level
+# Aho-Corasick automaton, so an article is scanned for every term in one pass
+# over its words. Overlapping matches keep the leftmost-longest term ("in
+# stock", not "stock"). Repeated terms are damped, title matches count extra,
+# and the tier 1 with the most evidence wins. Measured throughput is about
+# 4,000 articles/s (~240 µs each) for ~245-word pages in bench_categories.py,
+# and about 0.5 ms for the longer article in bench_hotpaths.py; expect
+# 2-7k articles/s depending on length.
+#
+# The engine reports the result as a preview, fills in a category the workflow
+# left empty, and gives it to the cascade (cascade.py) as its categorizer.
+
+import argparse
+import functools
+import math
+import os
+import re
+import sys
+from collections import defaultdict, deque, namedtuple
+
+from .keywords import fold
+
+
+TERMS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "iab_category_terms.tsv")
+
+# Each match in the title counts this many times
+TITLE_WEIGHT = 2.0
+# Tier 1 score at which a clear winner is fully confident; thinner evidence scales confidence down
+EVIDENCE_SATURATION = 6.0
+# Tier 2 candidates need this share of their tier 1's score
+TIER2_MIN_SHARE = 0.15
+MAX_TIER2 = 3
+MAX_TIER1_CANDIDATES = 3
+
+# Partial-result section the engine reports the local prediction under while the workflow runs
+LOCAL_CATEGORY_SECTION = "local_category"
+
+# tier1_scores / tier2_scores are (name, score) pairs, best first
+CategoryPrediction = namedtuple(
+    "CategoryPrediction", ["tier1_category", "tier2_categories", "confidence", "tier1_scores", "tier2_scores"]
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*")
+# Folding dominates scanning time otherwise; an article's vocabulary repeats across articles
+_cached_fold = functools.lru_cache(maxsize=1 << 16)(fold)
+
+
+def words(text):
+    """Folded lowercase words of `text`, as terms are matched"""
+    return [_cached_fold(word) for word in _TOKEN_PATTERN.findall(text.lower().replace("’", "'"))]
+
+
+class TermMatcher:
+    """Word-level Aho-Corasick automaton over phrases (tuples of words)"""
+
+    def __init__(self, phrases):
+        self.lengths = [len(phrase) for phrase in phrases]
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for phrase_id, phrase in enumerate(phrases):
+            state = 0
+            for word in phrase:
+                following = self._goto[state].get(word)
+                if following is None:
+                    following = len(self._goto)
+                    self._goto[state][word] = following
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = following
+            self._output[state].append(phrase_id)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, following in self._goto[state].items():
+                queue.append(following)
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[following] = self._goto[fallback].get(word, 0)
+                self._output[following] = self._output[following] + self._output[self._fail[following]]
+
+    def matches(self, tokens):
+        """(start, end, phrase_id) for every occurrence, overlapping ones included"""
+        goto, fail, output, lengths = self._goto, self._fail, self._output, self.lengths
+        state = 0
+        for end, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for phrase_id in output[state]:
+                yield end - lengths[phrase_id] + 1, end, phrase_id
+
+    def longest_matches(self, tokens):
+        """Phrase ids of non-overlapping matches, preferring the leftmost, then the longest"""
+        found = sorted(self.matches(tokens), key=lambda match: (match[0], match[0] - match[1]))
+        taken = []
+        covered_to = -1
+        for start, end, phrase_id in found:
+            if start > covered_to:
+                taken.append(phrase_id)
+                covered_to = end
+        return taken
+
+
+class CategoryClassifier:
+    """Scores IAB tier 1 and tier 2 categories by dictionary terms found in an article; safe to share between threads"""
+
+    def __init__(self, entries):
+        """`entries`: (tier1, tier2, term) triples"""
+        postings = defaultdict(list)
+        for tier1, tier2, term in entries:
+            phrase = tuple(words(term))
+            if phrase and (tier1, tier2) not in postings[phrase]:
+                postings[phrase].append((tier1, tier2))
+        self.phrases = list(postings)
+        # Inverted index: phrase id -> ((tier1, tier2), weight) postings; shared terms split their weight
+        self.postings = [
+            tuple((category, 1 / len(postings[phrase])) for category in postings[phrase]) for phrase in self.phrases
+        ]
+        self.tier1_categories = sorted({tier1 for tier1, _, _ in entries})
+        self.matcher = TermMatcher(self.phrases)
+
+    @classmethod
+    def load(cls, path=TERMS_PATH):
+        entries = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("#") or not line.strip():
+                    continue
+                tier1, tier2, terms = line.rstrip("\n").split("\t")
+                entries.extend((tier1, tier2, term.strip()) for term in terms.split(",") if term.strip())
+        return cls(entries)
+
+    def classify(self, text, title=""):
+        """CategoryPrediction for an article, or None when no dictionary term occurs in it"""
+        counts = defaultdict(float)
+        for phrase_id in self.matcher.longest_matches(words(text)):
+            counts[phrase_id] += 1
+        if title:
+            for phrase_id in self.matcher.longest_matches(words(title)):
+                counts[phrase_id] += TITLE_WEIGHT
+        if not counts:
+            return None
+
+        tier2_scores = defaultdict(float)
+        for phrase_id, count in counts.items():
+            damped = 1 + math.log(count) if count >= 1 else count
+            for category, weight in self.postings[phrase_id]:
+                tier2_scores[category] += weight * damped
+        tier1_scores = defaultdict(float)
+        for (tier1, _), score in tier2_scores.items():
+            tier1_scores[tier1] += score
+
+        ranked = sorted(tier1_scores.items(), key=lambda item: (-item[1], item[0]))
+        tier1, top = ranked[0]
+        confidence = top / sum(tier1_scores.values()) * min(1.0, top / EVIDENCE_SATURATION)
+        tier2 = sorted(
+            ((name, score) for (parent, name), score in tier2_scores.items()
+             if parent == tier1 and score >= TIER2_MIN_SHARE * top),
+            key=lambda item: (-item[1], item[0])
+        )[:MAX_TIER2]
+        return CategoryPrediction(
+            tier1_category=tier1,
+            tier2_categories=tuple(name for name, _ in tier2),
+            confidence=confidence,
+            tier1_scores=tuple((name, round(score, 2)) for name, score in ranked[:MAX_TIER1_CANDIDATES]),
+            tier2_scores=tuple((name, round(score, 2)) for name, score in tier2),
+        )
+
+    __call__ = classify
+
+
+def category_section(prediction):
+    """LOCAL_CATEGORY_SECTION payload in the workflow's field names, plus the candidate scores"""
+    return {
+        'tier1_category': prediction.tier1_category,
+        'tier2_categories': list(prediction.tier2_categories),
+        'confidence': round(prediction.confidence, 3),
+        'tier1_scores': [list(pair) for pair in prediction.tier1_scores],
+        'tier2_scores': [list(pair) for pair in prediction.tier2_scores],
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def default_classifier():
+    return CategoryClassifier.load()
+
+
+def classify_category(text, title=""):
+    """Categories for `text` using the bundled term dictionary"""
+    return default_classifier().classify(text, title)
+
+
+def main():
+    from .extract import extract_main_text
+
+    parser = argparse.ArgumentParser(description="Classify articles into IAB categories offline")
+    parser.add_argument("paths", nargs="+", help="HTML or text files; - reads stdin")
+    args = parser.parse_args()
+
+    print("path\ttier1_category\ttier2_categories\tconfidence")
+    for path in args.paths:
+        if path == "-":
+            document = sys.stdin.read()
+        else:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                document = f.read()
+        title = ""
+        if path.lower().endswith((".html", ".htm")) or (path == "-" and document.lstrip().startswith("<")):
+            title, document, _ = extract_main_text(document, max_tokens=1_000_000)
+        prediction = classify_category(document, title)
+        if prediction is None:
+            print(f"{path}\t\t\t0")
+        else:
+            print(f"{path}\t{prediction.tier1_category}\t{'; '.join(prediction.tier2_categories)}\t{prediction.confidence:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+## Plotly chart builders for the Liz dashboard
+#
+# Figures are memoized on their inputs, so reruns with an unchanged result
+# (tab switches, toggles, polling) reuse the already built figure. Cached
+# figures are shared between sessions: treat them as read-only.
+
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+
+
+# Vibrant color palette for age groups
+AGE_COLORS = ['#f7c3dc', '#CD574C', '#8B5CF6', '#10B981', '#F59E0B', '#EF4444', '#06B6D4', '#84CC16']
+
+# Figures kept per chart type
+CHART_CACHE_SIZE = 256
+
+# Dark theme layout every chart starts from; validated once at import
+BASE_LAYOUT = go.Layout(
+    title_font=dict(color="#f7c3dc", family="Inter", size=16),
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(color="#9CA3AF", family="Inter"),
+    height=350,
+    margin=dict(l=40, r=40, t=60, b=40)
+)
+
+
+def _inputs_key(args):
+    # Key order matters (it decides bar and slice order), so no sort_keys
+    payload = json.dumps(args, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def memoize_figure(maxsize=CHART_CACHE_SIZE):
+    """LRU cache for chart builders keyed on a hash of their JSON-serialized inputs.
+
+    The undecorated builder stays available as `.uncached`.
+    """
+    def decorator(build):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        counters = {"hits": 0, "misses": 0}
+
+        @functools.wraps(build)
+        def wrapper(*args):
+            key = _inputs_key(args)
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    counters["hits"] += 1
+                    return cache[key]
+                counters["misses"] += 1
+
+            fig = build(*args)
+            with lock:
+                cache[key] = fig
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return fig
+
+        def cache_info():
+            with lock:
+                return dict(counters, size=len(cache), maxsize=maxsize)
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                counters.update(hits=0, misses=0)
+
+        wrapper.uncached = build
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+@memoize_figure()
+def create_age_chart(age_distribution):
+    if not age_distribution:
+        return None
+
+    # Filter out zero values
+    filtered_age_dist = {k: v for k, v in age_distribution.items() if v > 0}
+    if not filtered_age_dist:
+        return None
+
+    age_groups = list(filtered_age_dist.keys())
+    percentages = list(filtered_age_dist.values())
+
+    colors = AGE_COLORS[:len(age_groups)]
+
+    fig = go.Figure(layout=BASE_LAYOUT)
+    fig.add_trace(go.Bar(
+        x=age_groups,
+        y=percentages,
+        marker=dict(
+            color=colors,
+            line=dict(color='rgba(255,255,255,0.2)', width=1)
+        ),
+        text=[f"{p}%" for p in percentages],
+        textposition='auto',
+        textfont=dict(color="#FFFFFF", size=12, family="Inter")
+    ))
+
+    fig.update_layout(
+        title_text="Real-Time Age Distribution",
+        xaxis=dict(
+            gridcolor='rgba(75, 85, 99, 0.3)',
+            tickfont=dict(color="#9CA3AF", family="Inter")
+        ),
+        yaxis=dict(
+            gridcolor='rgba(75, 85, 99, 0.3)',
+            tickfont=dict(color="#9CA3AF", family="Inter")
+        ),
+        showlegend=False
+    )
+
+    return fig
+
+@memoize_figure()
+def create_gender_chart(gender_distribution):
+    if not gender_distribution:
+        return None
+
+    genders = list(gender_distribution.keys())
+    values = list(gender_distribution.values())
+    display_labels = [gender.capitalize() for gender in genders]
+
+    fig = go.Figure(layout=BASE_LAYOUT)
+    fig.add_trace(go.Pie(
+        labels=display_labels,
+        values=values,
+        hole=0.6,
+        marker=dict(
+            colors=['#f7c3dc', '#CD574C'],
+            line=dict(color='#272b39', width=2)
+        ),
+        textfont=dict(color="#FFFFFF", family="Inter", size=12),
+        textinfo='label+percent'
+    ))
+
+    fig.update_layout(
+        title_text="Real-Time Gender Distribution",
+        showlegend=False
+    )
+
+    return fig
+
+@memoize_figure()
+def create_intentionality_chart(intentionality_data):
+    if not intentionality_data:
+        return None
+
+    # Filter out zero values
+    filtered_data = {k: v for k, v in intentionality_data.items() if v > 0}
+    if not filtered_data:
+        return None
+
+    intent_types = [k.capitalize() for k in filtered_data.keys()]
+    values = list(filtered_data.values())
+
+    fig = go.Figure(layout=BASE_LAYOUT)
+    fig.add_trace(go.Scatterpolar(
+        r=values,
+        theta=intent_types,
+        fill='toself',
+        marker=dict(color='#f7c3dc', size=6),
+        line=dict(color='#CD574C', width=2),
+        fillcolor='rgba(247, 195, 220, 0.2)',
+        name='Intent Distribution'
+    ))
+
+    fig.update_layout(
+        title_text="Intent Breakdown",
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, max(values) + 10] if values else [0, 100],
+                gridcolor='rgba(75, 85, 99, 0.3)',
+                tickfont=dict(color="#9CA3AF", family="Inter", size=10)
+            ),
+            angularaxis=dict(
+                gridcolor='rgba(75, 85, 99, 0.3)',
+                tickfont=dict(color="#9CA3AF", family="Inter", size=11)
+            )
+        ),
+        showlegend=False
+    )
+
+    return fig
+
+@memoize_figure()
+def create_keyword_chart(primary_kw, secondary_kw):
+    if not primary_kw and not secondary_kw:
+        return None
+
+    labels = primary_kw + secondary_kw
+    values = [90] * len(primary_kw) + [60] * len(secondary_kw)
+    colors = ['#f7c3dc'] * len(primary_kw) + ['#CD574C'] * len(secondary_kw)
+
+    fig = go.Figure(layout=BASE_LAYOUT, data=[go.Pie(
+        labels=labels,
+        values=values,
+        hole=0.6,
+        marker=dict(colors=colors, line=dict(color='#272b39', width=2)),
+        textfont=dict(color="#ffffff", family="Inter", size=11),
+        textinfo='label+percent'
+    )])
+
+    fig.update_layout(
+        title_text="Keyword Distribution",
+        showlegend=True,
+        legend=dict(
+            font=dict(color="#ffffff"),
+            orientation="h",
+            yanchor="bottom",
+            y=-0.2,
+            xanchor="center",
+            x=0.5
+        ),
+        height=400,
+        margin=dict(l=40, r=40, t=60, b=60)
+    )
+
+    return fig
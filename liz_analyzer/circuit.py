@@ -0,0 +1,159 @@
+## Circuit breaker so a dead analysis webhook fails fast instead of timing out every click
+
+import os
+import threading
+import time
+
+from .client import AnalysisError
+
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_TIMEOUT = 30
+DEFAULT_HALF_OPEN_MAX_CALLS = 1
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+CIRCUIT_OPEN_SUGGESTIONS = [
+    "The analysis service is not responding right now",
+    "Try again in a minute",
+    "Previously analyzed articles are still available"
+]
+
+
+class CircuitOpenError(AnalysisError):
+    """Raised instead of calling the webhook while the circuit is open"""
+
+    def __init__(self, retry_in):
+        super().__init__(
+            "service_unavailable",
+            f"The analysis service is temporarily unavailable. Retrying automatically in {retry_in:.0f}s.",
+            suggestions=CIRCUIT_OPEN_SUGGESTIONS
+        )
+        self.retry_in = retry_in
+
+
+def is_upstream_failure(error):
+    """True for failures that say the webhook itself is unhealthy.
+
+    Workflow errors such as an unreachable article come back in a valid
+    response, so they do not count against the circuit.
+    """
+    return isinstance(error, AnalysisError) and error.error_type == "api_request_failed"
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker around the analysis webhook.
+
+    After `failure_threshold` consecutive upstream failures the circuit opens
+    and calls are rejected for `reset_timeout` seconds. It then half-opens and
+    lets `half_open_max_calls` probe calls through: one success closes it, a
+    failure opens it again for another timeout.
+    """
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT,
+                 half_open_max_calls=DEFAULT_HALF_OPEN_MAX_CALLS):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+
+        self.rejected = 0
+        self.times_opened = 0
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            failure_threshold=int(os.environ.get("LIZ_CIRCUIT_FAILURE_THRESHOLD", DEFAULT_FAILURE_THRESHOLD)),
+            reset_timeout=float(os.environ.get("LIZ_CIRCUIT_RESET_TIMEOUT", DEFAULT_RESET_TIMEOUT)),
+        )
+
+    def _current_state(self, now):
+        if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+        return self._state
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state(time.time())
+
+    def retry_in(self):
+        """Seconds until the circuit half-opens (0 unless open)"""
+        with self._lock:
+            if self._current_state(time.time()) != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.time() - self._opened_at))
+
+    def before_call(self):
+        """Reserve a call, raising CircuitOpenError if the circuit rejects it"""
+        now = time.time()
+        with self._lock:
+            state = self._current_state(now)
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                return
+            self.rejected += 1
+            retry_in = self.reset_timeout - (now - self._opened_at) if state == OPEN else 0.0
+        raise CircuitOpenError(max(retry_in, 0.0))
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._consecutive_failures = 0
+            self._probes_in_flight = 0
+
+    def record_failure(self):
+        now = time.time()
+        with self._lock:
+            state = self._current_state(now)
+            self._consecutive_failures += 1
+            if state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if state != OPEN:
+                    self.times_opened += 1
+                self._state = OPEN
+                self._opened_at = now
+                self._probes_in_flight = 0
+
+    def release(self):
+        """Give back a reserved call whose outcome says nothing about upstream health"""
+        with self._lock:
+            if self._probes_in_flight:
+                self._probes_in_flight -= 1
+
+    def record_outcome(self, error=None):
+        """Record a finished call: no error or a workflow-level error means the webhook answered"""
+        if error is None or (isinstance(error, AnalysisError) and not is_upstream_failure(error)):
+            self.record_success()
+        elif is_upstream_failure(error):
+            self.record_failure()
+        else:
+            self.release()
+
+    def call(self, fn, *args, **kwargs):
+        """Run fn through the breaker; only upstream failures count against it"""
+        self.before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self.record_outcome(e)
+            raise
+        self.record_outcome()
+        return result
+
+    def stats(self):
+        return {
+            "state": self.state,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+            "retry_in": self.retry_in(),
+        }
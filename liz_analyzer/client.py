@@ -0,0 +1,358 @@
+## n8n webhook client with pooled keep-alive connections and retry/backoff
+
+import json
+import os
+import random
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .endpoints import EndpointRegistry
+
+
+DEFAULT_WEBHOOK_URL = "https://rajkpillai.app.n8n.cloud/webhook/contextual-engine-test"
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 90
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_POOL_SIZE = 32
+
+# Status codes worth retrying: the workflow or its proxy is briefly unavailable
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Client errors other than these say the request was wrong, not the endpoint
+ENDPOINT_FAILURE_STATUS_CODES = frozenset({408, 429})
+
+REQUEST_FAILED_SUGGESTIONS = [
+    "Check your internet connection",
+    "Try again in a few moments",
+    "Verify the URL is accessible"
+]
+PARSE_FAILED_SUGGESTIONS = ["Try analyzing the article again", "Check if the URL is accessible"]
+
+# Streamed responses: one JSON object per line, each holding one or more result sections
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+STREAM_ACCEPT = f"{NDJSON_CONTENT_TYPE}, application/json;q=0.9"
+
+
+class AnalysisError(Exception):
+    """Analysis failure carrying the fields display_error expects"""
+
+    def __init__(self, error_type, message, suggestions=None, technical_details=None):
+        super().__init__(message)
+        self.error_type = error_type
+        self.message = message
+        self.suggestions = suggestions or []
+        self.technical_details = technical_details
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter between webhook attempts"""
+
+    def __init__(self, max_retries=DEFAULT_MAX_RETRIES, backoff_base=0.5, backoff_max=8.0):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def delay(self, attempt, retry_after=None):
+        """Seconds to wait before retry number `attempt` (0-based)"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+
+def _retry_after_seconds(response):
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def is_endpoint_failure(status_code):
+    """True for statuses that count against the endpoint's health: 5xx, timeouts and rate limiting"""
+    return status_code >= 500 or status_code in ENDPOINT_FAILURE_STATUS_CODES
+
+
+class CallAttempts:
+    """Endpoint plan, health accounting and retry decisions for one webhook call.
+
+    Shared by WebhookClient and AsyncWebhookClient so both route, fail over,
+    back off and report errors the same way; they differ only in how they
+    send a request and wait. Iterate it for the endpoint of each attempt and
+    report the outcome through unreachable() or responded() / rejected(); if
+    the loop runs out, `error` is what to raise.
+    """
+
+    def __init__(self, endpoints, retry_policy):
+        self.endpoints = endpoints
+        self.retry_policy = retry_policy
+        self.plan = endpoints.plan(retry_policy.max_retries + 1)
+        self.error = None
+        self.started = None
+        self._attempt = -1
+
+    def __iter__(self):
+        for attempt, endpoint in enumerate(self.plan):
+            self._attempt = attempt
+            self.started = time.perf_counter()
+            yield endpoint
+
+    def elapsed(self):
+        """Seconds since the current attempt was sent"""
+        return time.perf_counter() - self.started
+
+    def unreachable(self, endpoint, error):
+        """Record a connection error or timeout; returns seconds to wait before the next attempt"""
+        self.endpoints.record_failure(endpoint)
+        self.error = AnalysisError(
+            "api_request_failed",
+            "Could not reach the analysis service",
+            suggestions=REQUEST_FAILED_SUGGESTIONS,
+            technical_details=f"{type(error).__name__}: {str(error)}"
+        )
+        return self._backoff()
+
+    def responded(self, endpoint, status_code, record_success=True):
+        """Record an HTTP response; True when it is the one to hand back to the caller.
+
+        Pass `record_success=False` for a 200 whose body is still to be
+        streamed, and record it once the stream has been read.
+        """
+        if status_code == 200:
+            if record_success:
+                self.endpoints.record_success(endpoint, self.elapsed())
+            return True
+        endpoint_failed = is_endpoint_failure(status_code)
+        if endpoint_failed:
+            self.endpoints.record_failure(endpoint)
+        retryable = status_code in RETRYABLE_STATUS_CODES and self._has_next()
+        # A client error goes straight back to the caller: another endpoint would reject it too
+        return not (retryable or (endpoint_failed and self._fresh_endpoint_next()))
+
+    def rejected(self, status_code, text, retry_after=None):
+        """Remember a response that will be retried; returns seconds to wait before the next attempt"""
+        self.error = AnalysisError(
+            "api_request_failed",
+            f"API request failed with status code {status_code}",
+            suggestions=REQUEST_FAILED_SUGGESTIONS,
+            technical_details=f"Response: {text[:500]}"
+        )
+        return self._backoff(retry_after)
+
+    def _has_next(self):
+        return self._attempt + 1 < len(self.plan)
+
+    def _fresh_endpoint_next(self):
+        return self._has_next() and self.plan[self._attempt + 1] not in self.plan[:self._attempt + 1]
+
+    def _backoff(self, retry_after=None):
+        # Only back off before going back to an endpoint that has already failed
+        if self._has_next() and not self._fresh_endpoint_next():
+            return self.retry_policy.delay(self._attempt, retry_after)
+        return 0.0
+
+
+def parse_analysis_response(status_code, text, payload_loader):
+    """Turn a webhook response into a result dict, raising AnalysisError on any failure"""
+    if status_code != 200:
+        raise AnalysisError(
+            "api_request_failed",
+            f"API request failed with status code {status_code}",
+            suggestions=REQUEST_FAILED_SUGGESTIONS,
+            technical_details=f"Response: {text[:500]}"
+        )
+
+    try:
+        result_data = payload_loader()
+    except ValueError as e:
+        raise AnalysisError(
+            "parse_error",
+            "Failed to process the analysis results",
+            suggestions=PARSE_FAILED_SUGGESTIONS,
+            technical_details=f"Parse error: {str(e)}"
+        )
+
+    # The workflow reports failures as [{"error": ..., "error_type": ..., "message": ...}]
+    if isinstance(result_data, list) and len(result_data) > 0 and "error" in result_data[0]:
+        raise _workflow_error(result_data[0])
+
+    result = result_data[0] if isinstance(result_data, list) else result_data
+    if not isinstance(result, dict):
+        raise AnalysisError(
+            "parse_error",
+            "Failed to process the analysis results",
+            suggestions=PARSE_FAILED_SUGGESTIONS,
+            technical_details=f"Unexpected payload type: {type(result).__name__}"
+        )
+    return result
+
+
+def _workflow_error(error):
+    return AnalysisError(
+        error.get("error_type", "api_error"),
+        error.get("message", "An error occurred during analysis."),
+        suggestions=error.get("suggestions", [])
+    )
+
+
+def is_ndjson_response(content_type):
+    return (content_type or "").split(";")[0].strip().lower() == NDJSON_CONTENT_TYPE
+
+
+def parse_analysis_stream(lines, on_section=None):
+    """Assemble a result dict from NDJSON lines as the workflow streams its sections.
+
+    Each non-empty line is a JSON object whose keys are result sections
+    (`{"intention": {...}}`, `{"tier1_category": "Sports"}`, ...); later lines
+    override earlier ones. `on_section(name, value)` is called as each section
+    arrives. A line shaped like the workflow error (`{"error": ...}`, bare or
+    wrapped in a list) raises AnalysisError.
+    """
+    result = {}
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line.strip():
+            continue
+        try:
+            sections = json.loads(line)
+        except ValueError as e:
+            raise AnalysisError(
+                "parse_error",
+                "Failed to process the analysis results",
+                suggestions=PARSE_FAILED_SUGGESTIONS,
+                technical_details=f"Parse error in streamed line: {str(e)}"
+            )
+        if isinstance(sections, list) and sections:
+            sections = sections[0]
+        if not isinstance(sections, dict):
+            raise AnalysisError(
+                "parse_error",
+                "Failed to process the analysis results",
+                suggestions=PARSE_FAILED_SUGGESTIONS,
+                technical_details=f"Unexpected streamed payload type: {type(sections).__name__}"
+            )
+        if "error" in sections:
+            raise _workflow_error(sections)
+
+        for name, value in sections.items():
+            result[name] = value
+            if on_section is not None:
+                on_section(name, value)
+
+    if not result:
+        raise AnalysisError(
+            "parse_error",
+            "Failed to process the analysis results",
+            suggestions=PARSE_FAILED_SUGGESTIONS,
+            technical_details="Streamed response contained no sections"
+        )
+    return result
+
+
+class WebhookClient:
+    """Calls the n8n analysis workflow over a pooled keep-alive `requests.Session`.
+
+    Each call goes to the fastest healthy endpoint in `endpoints` (a registry
+    of the single `webhook_url` by default) and fails over to the next one on
+    connection errors, timeouts, 5xx and 429 responses; other 4xx responses
+    are returned as they are and do not count against the endpoint. Transient
+    failures are retried according to `retry_policy`; everything else raises
+    AnalysisError straight away. Calls carrying locally extracted article
+    `content` are sent as a POST with that content as the JSON body; the
+    parameters stay in the query string either way.
+    """
+
+    def __init__(self, webhook_url=DEFAULT_WEBHOOK_URL, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout=DEFAULT_READ_TIMEOUT, retry_policy=None, pool_size=DEFAULT_POOL_SIZE, endpoints=None):
+        self.endpoints = endpoints or EndpointRegistry([webhook_url])
+        self.timeout = (connect_timeout, read_timeout)
+        self.retry_policy = retry_policy or RetryPolicy()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+
+    @classmethod
+    def from_env(cls):
+        """Create a client configured from LIZ_WEBHOOK_* / LIZ_ENDPOINT_* environment variables"""
+        return cls(
+            connect_timeout=float(os.environ.get("LIZ_WEBHOOK_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)),
+            read_timeout=float(os.environ.get("LIZ_WEBHOOK_READ_TIMEOUT", DEFAULT_READ_TIMEOUT)),
+            retry_policy=RetryPolicy(max_retries=int(os.environ.get("LIZ_WEBHOOK_MAX_RETRIES", DEFAULT_MAX_RETRIES))),
+            endpoints=EndpointRegistry.from_env(DEFAULT_WEBHOOK_URL),
+        )
+
+    def _send(self, params, stream=False, headers=None, content=None):
+        """Call the workflow with endpoint failover and retries.
+
+        Returns (response, endpoint, started). A streamed 200 is not yet
+        recorded as a success: the caller does that once the body has been
+        read, so the endpoint's latency covers the whole stream.
+        """
+        attempts = CallAttempts(self.endpoints, self.retry_policy)
+        for endpoint in attempts:
+            try:
+                if content is None:
+                    response = self.session.get(endpoint.url, params=params, timeout=self.timeout,
+                                                stream=stream, headers=headers)
+                else:
+                    response = self.session.post(endpoint.url, params=params, json=content, timeout=self.timeout,
+                                                 stream=stream, headers=headers)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = attempts.unreachable(endpoint, e)
+            else:
+                if attempts.responded(endpoint, response.status_code, record_success=not stream):
+                    return response, endpoint, attempts.started
+                delay = attempts.rejected(response.status_code, response.text, _retry_after_seconds(response))
+                response.close()
+            if delay:
+                time.sleep(delay)
+
+        raise attempts.error
+
+    def analyze(self, params, content=None):
+        """Run the analysis workflow for `params` and return the parsed result dict"""
+        response, _, _ = self._send(params, content=content)
+        return parse_analysis_response(response.status_code, response.text, response.json)
+
+    def analyze_stream(self, params, on_section=None, content=None):
+        """Like analyze(), but asks for an NDJSON stream and reports sections as they arrive.
+
+        Falls back to the regular single-document parse (reporting every
+        section at the end) when the workflow answers with plain JSON.
+        """
+        response, endpoint, started = self._send(params, stream=True, headers={"Accept": STREAM_ACCEPT}, content=content)
+        with response:
+            if response.status_code != 200 or not is_ndjson_response(response.headers.get("Content-Type")):
+                text = response.text
+                if response.status_code == 200:
+                    self.endpoints.record_success(endpoint, time.perf_counter() - started)
+                result = parse_analysis_response(response.status_code, text, response.json)
+                if on_section is not None:
+                    for name, value in result.items():
+                        on_section(name, value)
+                return result
+
+            try:
+                result = parse_analysis_stream(response.iter_lines(), on_section)
+            except requests.RequestException as e:
+                self.endpoints.record_failure(endpoint)
+                raise AnalysisError(
+                    "api_request_failed",
+                    "The analysis stream was interrupted",
+                    suggestions=REQUEST_FAILED_SUGGESTIONS,
+                    technical_details=f"{type(e).__name__}: {str(e)}"
+                )
+            except AnalysisError:
+                # The workflow answered, with an error or a malformed line; the endpoint itself is fine
+                self.endpoints.record_success(endpoint, time.perf_counter() - started)
+                raise
+            self.endpoints.record_success(endpoint, time.perf_counter() - started)
+            return result
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,130 @@
+## Upstream analysis endpoints with rolling health, fastest-healthy routing and failover
+
+import os
+import random
+import statistics
+import threading
+import time
+from collections import deque
+
+
+DEFAULT_WINDOW = 50
+DEFAULT_MIN_SAMPLES = 5
+DEFAULT_MAX_ERROR_RATE = 0.5
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_COOLDOWN_SECONDS = 30
+DEFAULT_EXPLORE_RATE = 0.05
+
+
+class Endpoint:
+    """One webhook URL and its recent outcomes"""
+
+    def __init__(self, url, window=DEFAULT_WINDOW):
+        self.url = url
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self.requests = 0
+        self.failures = 0
+
+    @property
+    def latency(self):
+        """Median of the recent successful call durations, None until measured"""
+        return statistics.median(self.latencies) if self.latencies else None
+
+    @property
+    def error_rate(self):
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def is_healthy(self, now):
+        return now >= self.unhealthy_until
+
+
+class EndpointRegistry:
+    """Routes each analysis to the fastest healthy endpoint.
+
+    An endpoint is taken out of rotation for `cooldown_seconds` after
+    `failure_threshold` consecutive failures, or when its error rate over the
+    last `window` calls exceeds `max_error_rate`. Once the cooldown passes it
+    is tried again; one more failure puts it straight back. Unmeasured
+    endpoints are tried first, and `explore_rate` of calls go to a random
+    healthy endpoint so a recovered one can win traffic back.
+    """
+
+    def __init__(self, urls, window=DEFAULT_WINDOW, min_samples=DEFAULT_MIN_SAMPLES,
+                 max_error_rate=DEFAULT_MAX_ERROR_RATE, failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+                 cooldown_seconds=DEFAULT_COOLDOWN_SECONDS, explore_rate=DEFAULT_EXPLORE_RATE):
+        urls = [url for url in dict.fromkeys(urls) if url]
+        if not urls:
+            raise ValueError("EndpointRegistry needs at least one endpoint URL")
+        self.endpoints = [Endpoint(url, window) for url in urls]
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.explore_rate = explore_rate
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, default_url):
+        """Endpoints from LIZ_WEBHOOK_URLS (comma separated), else LIZ_WEBHOOK_URL, else `default_url`"""
+        urls = [url.strip() for url in os.environ.get("LIZ_WEBHOOK_URLS", "").split(",") if url.strip()]
+        if not urls:
+            urls = [os.environ.get("LIZ_WEBHOOK_URL", default_url)]
+        return cls(
+            urls,
+            max_error_rate=float(os.environ.get("LIZ_ENDPOINT_MAX_ERROR_RATE", DEFAULT_MAX_ERROR_RATE)),
+            cooldown_seconds=float(os.environ.get("LIZ_ENDPOINT_COOLDOWN_SECONDS", DEFAULT_COOLDOWN_SECONDS)),
+        )
+
+    def ranked(self):
+        """Endpoints in the order they should be tried for the next call"""
+        now = time.time()
+        with self._lock:
+            healthy = [e for e in self.endpoints if e.is_healthy(now)]
+            unhealthy = [e for e in self.endpoints if not e.is_healthy(now)]
+            # Unmeasured endpoints go first, shuffled so a cold burst spreads over all of them
+            unmeasured = [e for e in healthy if e.latency is None]
+            random.shuffle(unmeasured)
+            healthy = unmeasured + sorted((e for e in healthy if e.latency is not None), key=lambda e: e.latency)
+            # Out-of-rotation endpoints stay available as a last resort, soonest to recover first
+            unhealthy.sort(key=lambda e: e.unhealthy_until)
+
+        if len(healthy) > 1 and random.random() < self.explore_rate:
+            healthy.insert(0, healthy.pop(random.randrange(1, len(healthy))))
+        return healthy + unhealthy
+
+    def plan(self, attempts):
+        """Endpoint for each of `attempts` tries, covering every endpoint at least once"""
+        ranked = self.ranked()
+        return [ranked[i % len(ranked)] for i in range(max(attempts, len(ranked)))]
+
+    def record_success(self, endpoint, latency):
+        with self._lock:
+            endpoint.requests += 1
+            endpoint.latencies.append(latency)
+            endpoint.outcomes.append(True)
+            endpoint.consecutive_failures = 0
+
+    def record_failure(self, endpoint):
+        with self._lock:
+            endpoint.requests += 1
+            endpoint.failures += 1
+            endpoint.outcomes.append(False)
+            endpoint.consecutive_failures += 1
+            too_many_errors = len(endpoint.outcomes) >= self.min_samples and endpoint.error_rate > self.max_error_rate
+            if endpoint.consecutive_failures >= self.failure_threshold or too_many_errors:
+                endpoint.unhealthy_until = time.time() + self.cooldown_seconds
+
+    def stats(self):
+        now = time.time()
+        with self._lock:
+            return [{
+                "url": e.url,
+                "healthy": e.is_healthy(now),
+                "latency": e.latency,
+                "error_rate": e.error_rate,
+                "requests": e.requests,
+                "failures": e.failures,
+            } for e in self.endpoints]
@@ -0,0 +1,161 @@
+## Analysis engine: URL validation and the cached webhook analysis pipeline
+#
+# Importable without Streamlit so batch and headless callers can reuse it.
+
+import time
+from urllib.parse import urlencode
+
+from .cache import AnalysisCache, make_cache_key
+from .cascade import Cascade, cascade_enabled
+from .circuit import OPEN, CircuitBreaker, CircuitOpenError, is_upstream_failure
+from .client import AnalysisError, WebhookClient
+from .extract import ArticleExtractor, extraction_enabled
+from .keywords import local_keywords_enabled
+from .pipeline import AnalysisPipeline, result_from_cache
+from .singleflight import SingleFlight
+from .urls import is_valid_url
+
+
+# IAB Tier 1 Categories
+IAB_TIER1_CATEGORIES = [
+    "Arts & Entertainment",
+    "Automotive",
+    "Business",
+    "Careers",
+    "Education",
+    "Family & Parenting",
+    "Health & Fitness",
+    "Food & Drink",
+    "Hobbies & Interests",
+    "Home & Garden",
+    "Law, Government & Politics",
+    "News",
+    "Personal Finance",
+    "Society",
+    "Science",
+    "Pets",
+    "Sports",
+    "Style & Fashion",
+    "Technology & Computing",
+    "Travel",
+    "Real Estate",
+    "Shopping",
+    "Religion & Spirituality",
+    "Non-Standard Content"
+]
+
+def build_analysis_params(processed_url, campaign_definition="", vertical=""):
+    """Webhook query parameters; campaign fields are only sent when a campaign is defined"""
+    params = {'url': processed_url}
+    if campaign_definition:
+        params.update({'campaign_definition': campaign_definition, 'vertical': vertical})
+    return params
+
+
+class AnalysisEngine:
+    """Runs analyses through the shared result cache and the webhook client.
+
+    Webhook calls go through a circuit breaker: while the webhook is failing,
+    calls fail fast and an expired cached result is served when one exists.
+    Results are returned as validated AnalysisResult models; the cache keeps
+    their payload form.
+
+    The local stages around the webhook call (article extraction, local
+    keywords, intent and categories, the cascade) are an AnalysisPipeline
+    shared with the JSON API; see pipeline.py. With a `cascade` (see
+    cascade.py) a confident local prediction is returned without calling the
+    webhook at all. `timings` records how long each local stage and each
+    successful webhook call takes.
+    """
+
+    def __init__(self, client=None, cache=None, breaker=None, extractor=None, send_content=True, keywords=None,
+                 intent_model=None, cascade=None, categorizer=None):
+        self.client = client or WebhookClient()
+        self.cache = cache or AnalysisCache()
+        self.breaker = breaker or CircuitBreaker()
+        self.cascade = cascade
+        self.pipeline = AnalysisPipeline(
+            self.cache, extractor=extractor, send_content=send_content, keywords=keywords,
+            intent_model=intent_model, categorizer=categorizer, cascade=cascade
+        )
+        self.timings = self.pipeline.timings
+        self.inflight = SingleFlight()
+
+    @classmethod
+    def from_env(cls):
+        """LIZ_EXTRACT_CONTENT fetches articles locally and sends their text; LIZ_LOCAL_KEYWORDS and LIZ_CASCADE fetch them for the local models only"""
+        fetch_articles = extraction_enabled() or local_keywords_enabled() or cascade_enabled()
+        return cls(
+            client=WebhookClient.from_env(),
+            cache=AnalysisCache.from_env(),
+            breaker=CircuitBreaker.from_env(),
+            extractor=ArticleExtractor.from_env() if fetch_articles else None,
+            send_content=extraction_enabled(),
+            cascade=Cascade.from_env() if cascade_enabled() else None,
+        )
+
+    def cached(self, processed_url, campaign_definition="", vertical="", full_analysis=False):
+        """Return the cached analysis for a validated URL, or None; `full_analysis` ignores cached local answers"""
+        return self.pipeline.cached(processed_url, campaign_definition, vertical, full_analysis)
+
+    def fetch(self, processed_url, campaign_definition="", vertical="", on_section=None, full_analysis=False):
+        """Call the webhook for a validated URL and store the fresh result in the cache.
+
+        With a cascade, confident local predictions are stored and returned
+        instead unless `full_analysis` is set. Concurrent fetches with
+        identical parameters share one call; `on_section(name, value)` is
+        called as streamed sections arrive (only for the caller that actually
+        makes the call).
+        """
+        params = build_analysis_params(processed_url, campaign_definition, vertical)
+
+        def call_webhook():
+            local = self.pipeline.prepare(
+                processed_url, campaign_definition, vertical, on_section, self.fails_fast(), full_analysis
+            )
+            if local.result is not None:
+                return local.result
+            started = time.perf_counter()
+            document = self.breaker.call(self.client.analyze_stream, params, on_section, local.content)
+            self.timings.record("webhook", time.perf_counter() - started)
+            return self.pipeline.finish(local, document, processed_url, campaign_definition, vertical)
+
+        return self.inflight.do(urlencode(dict(params, full_analysis=int(full_analysis))), call_webhook)
+
+    def fetch_or_stale(self, processed_url, campaign_definition="", vertical="", on_section=None, full_analysis=False):
+        """fetch(), falling back to an expired cached result when the webhook is down.
+
+        Returns (result, stale_age_seconds); the age is None for a fresh result.
+        """
+        try:
+            return self.fetch(processed_url, campaign_definition, vertical, on_section, full_analysis), None
+        except AnalysisError as e:
+            if not (isinstance(e, CircuitOpenError) or is_upstream_failure(e)):
+                raise
+            stale = self.cache.get_stale(make_cache_key(processed_url, campaign_definition, vertical))
+            result = result_from_cache(stale[0]) if stale is not None else None
+            if result is None:
+                raise
+            return result, stale[1]
+
+    def fails_fast(self):
+        """True while the circuit is open, i.e. fetch() would return or raise immediately"""
+        return self.breaker.state == OPEN
+
+    def analyze(self, processed_url, campaign_definition="", vertical="", full_analysis=False):
+        """Return the analysis for an already validated URL, serving repeats from the cache.
+
+        `full_analysis` bypasses the cascade's local answers, cached or new.
+        """
+        cached_result = self.cached(processed_url, campaign_definition, vertical, full_analysis)
+        if cached_result is not None:
+            return cached_result
+        result, _ = self.fetch_or_stale(processed_url, campaign_definition, vertical, full_analysis=full_analysis)
+        return result
+
+    def analyze_url(self, raw_url, campaign_definition="", vertical="", full_analysis=False):
+        """Validate a raw user supplied URL and analyze it, raising AnalysisError on failure"""
+        is_valid, processed_url = is_valid_url(raw_url)
+        if not is_valid:
+            raise AnalysisError("invalid_url", processed_url)
+        return self.analyze(processed_url, campaign_definition, vertical, full_analysis)
@@ -0,0 +1,466 @@
+## Local article fetch and main-content extraction, run ahead of the webhook
+#
+# With LIZ_EXTRACT_CONTENT=1 the engine downloads the article itself, drops
+# navigation, ads, comments and other page chrome while the HTML streams in,
+# and sends the workflow the remaining text, cut to a token budget, along with
+# the URL, so the workflow can skip its own fetch and cleanup. When the page
+# cannot be fetched or has no usable text the URL is sent on its own, as before.
+#
+# URLs come from users, so before every request (each redirect hop included)
+# the host is resolved and refused unless all of its addresses are public:
+# loopback, private, link-local (cloud metadata), shared and reserved ranges
+# are never fetched. The connection itself resolves the host again, so the
+# address it actually reaches is checked too before anything is sent; a DNS
+# answer that changes between the two lookups (rebinding) cannot slip through.
+# LIZ_EXTRACT_ALLOW_PRIVATE=1 lifts both checks for local testing.
+
+import codecs
+import ipaddress
+import os
+import re
+import socket
+import time
+from collections import namedtuple
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+from .client import AnalysisError
+
+
+DEFAULT_MAX_TOKENS = 3000
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 15
+DEFAULT_POOL_SIZE = 32
+CHUNK_SIZE = 16 * 1024
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+# Rough size of a model token in characters of English prose
+CHARS_PER_TOKEN = 4
+# An <article>/<main> region with fewer words than this is ignored in favour of the whole page
+MIN_MAIN_WORDS = 80
+# Shorter non-heading blocks are bylines, buttons and captions rather than prose
+MIN_BLOCK_WORDS = 4
+# Blocks with more of their text inside links than this are navigation
+MAX_LINK_DENSITY = 0.5
+
+USER_AGENT = "Mozilla/5.0 (compatible; LizArticleAnalyzer/1.0)"
+
+FETCH_FAILED_SUGGESTIONS = [
+    "Check that the URL is publicly accessible",
+    "Try again in a few minutes"
+]
+
+# Subtrees that never hold article text
+SKIP_TAGS = frozenset({
+    "script", "style", "noscript", "template", "svg", "canvas", "iframe", "object", "embed",
+    "nav", "aside", "form", "button", "select", "textarea", "dialog", "menu",
+})
+# Page header and footer; an article's own header and footer are kept
+CHROME_TAGS = frozenset({"header", "footer"})
+MAIN_TAGS = frozenset({"article", "main"})
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+# Elements that end the current text block when they open or close
+BLOCK_TAGS = frozenset({
+    "p", "div", "section", "article", "main", "header", "footer", "li", "ul", "ol", "dl", "dt", "dd",
+    "blockquote", "pre", "table", "tr", "td", "th", "figure", "figcaption", "title",
+}) | HEADING_TAGS
+VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr",
+})
+SKIP_ROLES = frozenset({"navigation", "banner", "contentinfo", "complementary", "search", "menu", "menubar", "dialog"})
+
+# Leading word of a class or id token marking chrome, ads or comments ("ad-slot", "comment-list", ...);
+# ignored when the element also looks like the content itself ("article-body ad-free")
+BOILERPLATE_PATTERN = re.compile(
+    r"(?:^|\s)(?:ads?|advert\w*|sponsor\w*|promo\w*|banner|comments?|disqus|share|sharing|social|related|"
+    r"recommend\w*|newsletter|subscribe|cookies?|consent|gdpr|popup|modal|breadcrumbs?|sidebar|nav\w*|"
+    r"menu|footer|masthead|outbrain|taboola|paywall)(?:[-_]\S*)?(?=\s|$)",
+    re.IGNORECASE
+)
+CONTENT_PATTERN = re.compile(
+    r"(?:^|\s)(?:article|body|content|entry|main|post|story|text)\w*(?:[-_]\S*)?(?=\s|$)", re.IGNORECASE
+)
+CHARSET_PATTERN = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+ExtractedArticle = namedtuple(
+    "ExtractedArticle", ["url", "title", "text", "tokens", "truncated", "bytes", "fetch_seconds", "extract_seconds"]
+)
+
+
+def extraction_enabled():
+    return os.environ.get("LIZ_EXTRACT_CONTENT", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def private_hosts_allowed():
+    return os.environ.get("LIZ_EXTRACT_ALLOW_PRIVATE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def estimate_tokens(text):
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def webhook_payload(article):
+    """Request body fields that hand the extracted text to the workflow"""
+    return {
+        'content': article.text,
+        'title': article.title,
+        'content_tokens': article.tokens,
+        'content_truncated': article.truncated,
+    }
+
+
+class _MainContentParser(HTMLParser):
+    """Collects the text blocks of a page as it is fed, skipping boilerplate subtrees.
+
+    Blocks inside <article>/<main> are kept apart from the rest of the page.
+    `done` turns true once that main region alone fills `budget_chars`, at
+    which point the caller can stop downloading.
+    """
+
+    def __init__(self, budget_chars):
+        super().__init__(convert_charrefs=True)
+        self.budget_chars = budget_chars
+        self.done = False
+        self.title = ""
+        self.meta_title = ""
+
+        self._stack = []
+        # Stack depths where the current skipped subtree, main region and link start
+        self._skip_depth = None
+        self._main_depth = None
+        self._link_depth = None
+
+        self._text = []
+        self._text_chars = 0
+        self._link_chars = 0
+        self._heading = False
+
+        self.main_blocks = []
+        self.main_chars = 0
+        self.main_words = 0
+        self.page_blocks = []
+        self.page_chars = 0
+
+    def _is_boilerplate(self, tag, attrs):
+        if tag in ("html", "body"):
+            return False
+        if tag in SKIP_TAGS or (tag in CHROME_TAGS and self._main_depth is None):
+            return True
+        attrs = dict(attrs)
+        if "hidden" in attrs or attrs.get("aria-hidden") == "true" or attrs.get("role") in SKIP_ROLES:
+            return True
+        marker = f"{attrs.get('class') or ''} {attrs.get('id') or ''}"
+        return BOILERPLATE_PATTERN.search(marker) is not None and CONTENT_PATTERN.search(marker) is None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "meta":
+            attrs = dict(attrs)
+            if attrs.get("property") == "og:title" and attrs.get("content"):
+                self.meta_title = attrs["content"]
+            return
+        if tag in VOID_TAGS:
+            if tag == "br":
+                self.handle_data(" ")
+            return
+
+        if tag in BLOCK_TAGS:
+            self._flush()
+        depth = len(self._stack)
+        self._stack.append(tag)
+        if self._skip_depth is None and tag != "title" and self._is_boilerplate(tag, attrs):
+            self._skip_depth = depth
+        if tag in MAIN_TAGS and self._main_depth is None and self._skip_depth is None:
+            self._main_depth = depth
+        if tag == "a" and self._link_depth is None:
+            self._link_depth = depth
+        if tag in HEADING_TAGS:
+            self._heading = True
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS or tag not in self._stack:
+            return
+        if tag in BLOCK_TAGS:
+            self._flush()
+        # Close the element along with anything left open inside it
+        depth = len(self._stack) - 1 - self._stack[::-1].index(tag)
+        del self._stack[depth:]
+        if self._skip_depth is not None and self._skip_depth >= depth:
+            self._skip_depth = None
+        if self._main_depth is not None and self._main_depth >= depth:
+            self._main_depth = None
+        if self._link_depth is not None and self._link_depth >= depth:
+            self._link_depth = None
+
+    def handle_data(self, data):
+        if self._stack and self._stack[-1] == "title":
+            self.title += data
+            return
+        if self._skip_depth is not None or self.done:
+            return
+        self._text.append(data)
+        self._text_chars += len(data)
+        if self._link_depth is not None:
+            self._link_chars += len(data)
+
+    def _flush(self):
+        if not self._text:
+            self._heading = False
+            return
+        text = " ".join("".join(self._text).split())
+        link_density = self._link_chars / self._text_chars if self._text_chars else 0.0
+        heading = self._heading
+        self._text = []
+        self._text_chars = 0
+        self._link_chars = 0
+        self._heading = False
+
+        if not text or link_density > MAX_LINK_DENSITY:
+            return
+        words = text.count(" ") + 1
+        if words < MIN_BLOCK_WORDS and not heading:
+            return
+
+        if self.page_chars < self.budget_chars and (not self.page_blocks or self.page_blocks[-1] != text):
+            self.page_blocks.append(text)
+            self.page_chars += len(text)
+        if self._main_depth is not None and (not self.main_blocks or self.main_blocks[-1] != text):
+            self.main_blocks.append(text)
+            self.main_chars += len(text)
+            self.main_words += words
+            if self.main_chars >= self.budget_chars:
+                self.done = True
+
+    def finish(self):
+        """(title, text, truncated) for everything fed so far"""
+        self.close()
+        self._flush()
+        blocks = self.main_blocks if self.main_words >= MIN_MAIN_WORDS else self.page_blocks
+        text, truncated = _truncate(blocks, self.budget_chars)
+        title = " ".join((self.meta_title or self.title).split())
+        return title, text, truncated or self.done
+
+
+def _truncate(blocks, budget_chars):
+    parts = []
+    used = 0
+    for block in blocks:
+        separator = 2 if parts else 0
+        if used + separator + len(block) > budget_chars:
+            room = budget_chars - used - separator
+            cut = block[:room + 1].rsplit(" ", 1)[0] if room > 0 else ""
+            if cut:
+                parts.append(cut)
+            return "\n\n".join(parts), True
+        parts.append(block)
+        used += separator + len(block)
+    return "\n\n".join(parts), False
+
+
+def extract_main_text(html, max_tokens=DEFAULT_MAX_TOKENS):
+    """(title, text, truncated) for an HTML string or an iterable of HTML chunks"""
+    parser = _MainContentParser(max_tokens * CHARS_PER_TOKEN)
+    for chunk in ([html] if isinstance(html, str) else html):
+        parser.feed(chunk)
+        if parser.done:
+            break
+    return parser.finish()
+
+
+def _response_encoding(response):
+    """Charset from the Content-Type header; UTF-8 when it has none (requests would assume Latin-1)"""
+    match = CHARSET_PATTERN.search(response.headers.get("Content-Type", ""))
+    if match:
+        try:
+            return codecs.lookup(match.group(1)).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def _fetch_error(details):
+    return AnalysisError(
+        "content_fetch_failed",
+        "Could not retrieve the article content.",
+        suggestions=FETCH_FAILED_SUGGESTIONS,
+        technical_details=details
+    )
+
+
+def is_public_address(address):
+    """True for globally routable unicast addresses; IPv4-mapped IPv6 is judged as IPv4"""
+    address = ipaddress.ip_address(address)
+    if address.version == 6 and address.ipv4_mapped is not None:
+        address = address.ipv4_mapped
+    return address.is_global and not address.is_multicast
+
+
+def check_public_url(url):
+    """Raise AnalysisError unless `url` is http(s) and every address its host resolves to is public"""
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        raise _fetch_error(f"Invalid URL: {url}")
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise _fetch_error(f"Refusing to fetch {url}: not an http(s) URL")
+    try:
+        infos = socket.getaddrinfo(parts.hostname, port or (443 if parts.scheme == "https" else 80),
+                                   proto=socket.IPPROTO_TCP)
+    except (socket.gaierror, UnicodeError) as e:
+        raise _fetch_error(f"Could not resolve {parts.hostname}: {e}")
+    for info in infos:
+        # Scoped IPv6 addresses come back as "fe80::1%eth0"
+        address = info[4][0].split("%", 1)[0]
+        if not is_public_address(address):
+            raise _fetch_error(f"Refusing to fetch {parts.hostname}: it resolves to non-public address {address}")
+
+
+class _PublicPeerMixin:
+    """Closes a new socket unless the address it connected to is public, before the request or TLS handshake"""
+
+    def _new_conn(self):
+        sock = super()._new_conn()
+        address = sock.getpeername()[0].split("%", 1)[0]
+        if not is_public_address(address):
+            sock.close()
+            raise NewConnectionError(self, f"Refusing to connect to {self.host}: it resolved to non-public address {address}")
+        return sock
+
+
+class _PublicHTTPConnection(_PublicPeerMixin, HTTPConnection):
+    pass
+
+
+class _PublicHTTPSConnection(_PublicPeerMixin, HTTPSConnection):
+    pass
+
+
+class _PublicHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _PublicHTTPConnection
+
+
+class _PublicHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _PublicHTTPSConnection
+
+
+class _PublicOnlyAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections only ever reach public addresses, whatever DNS answers at connect time"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _PublicHTTPConnectionPool, "https": _PublicHTTPSConnectionPool}
+
+
+class ArticleExtractor:
+    """Downloads article pages over a pooled session and extracts their main text.
+
+    The body is parsed as it downloads; the download stops as soon as the
+    main content fills the `max_tokens` budget or `max_bytes` have been read.
+    extract() reports the download and parsing time separately. Redirects are
+    followed by hand, at most MAX_REDIRECTS of them, with the host of each
+    hop checked like the first, and every connection is refused unless the
+    peer it reached is public; `allow_private` turns both checks off.
+    """
+
+    def __init__(self, max_tokens=DEFAULT_MAX_TOKENS, max_bytes=DEFAULT_MAX_BYTES,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT, pool_size=DEFAULT_POOL_SIZE,
+                 allow_private=False):
+        self.max_tokens = max_tokens
+        self.max_bytes = max_bytes
+        self.timeout = (connect_timeout, read_timeout)
+        self.allow_private = allow_private
+
+        self.session = requests.Session()
+        adapter_class = HTTPAdapter if allow_private else _PublicOnlyAdapter
+        adapter = adapter_class(pool_connections=16, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.5",
+        })
+
+    @classmethod
+    def from_env(cls):
+        """Create an extractor configured from LIZ_EXTRACT_* environment variables"""
+        return cls(
+            max_tokens=int(os.environ.get("LIZ_EXTRACT_MAX_TOKENS", DEFAULT_MAX_TOKENS)),
+            max_bytes=int(os.environ.get("LIZ_EXTRACT_MAX_BYTES", DEFAULT_MAX_BYTES)),
+            read_timeout=float(os.environ.get("LIZ_EXTRACT_TIMEOUT", DEFAULT_READ_TIMEOUT)),
+            allow_private=private_hosts_allowed(),
+        )
+
+    def _get(self, url):
+        """Response for `url` after following redirects, each hop's host checked first"""
+        for _ in range(MAX_REDIRECTS + 1):
+            if not self.allow_private:
+                check_public_url(url)
+            try:
+                response = self.session.get(url, stream=True, timeout=self.timeout, allow_redirects=False)
+            except requests.RequestException as e:
+                raise _fetch_error(f"{type(e).__name__}: {str(e)}")
+            location = response.headers.get("Location")
+            if response.status_code not in REDIRECT_STATUSES or not location:
+                return response
+            response.close()
+            url = urljoin(url, location)
+        raise _fetch_error(f"More than {MAX_REDIRECTS} redirects")
+
+    def extract(self, url):
+        """Fetch `url` and return an ExtractedArticle, raising AnalysisError when there is no usable text"""
+        started = time.perf_counter()
+        parse_seconds = 0.0
+        received = 0
+        parser = _MainContentParser(self.max_tokens * CHARS_PER_TOKEN)
+
+        response = self._get(url)
+        with response:
+            if response.status_code != 200:
+                raise _fetch_error(f"Article request failed with status code {response.status_code}")
+            content_type = response.headers.get("Content-Type", "")
+            if "html" not in content_type.lower():
+                raise _fetch_error(f"Unsupported content type: {content_type or 'none'}")
+
+            decoder = codecs.getincrementaldecoder(_response_encoding(response))(errors="replace")
+            try:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    received += len(chunk)
+                    parse_started = time.perf_counter()
+                    parser.feed(decoder.decode(chunk))
+                    parse_seconds += time.perf_counter() - parse_started
+                    if parser.done or received >= self.max_bytes:
+                        break
+            except requests.RequestException as e:
+                raise _fetch_error(f"{type(e).__name__}: {str(e)}")
+
+        parse_started = time.perf_counter()
+        parser.feed(decoder.decode(b"", final=True))
+        title, text, truncated = parser.finish()
+        parse_seconds += time.perf_counter() - parse_started
+        # A download cut off at max_bytes leaves the rest of the page unread
+        truncated = truncated or received >= self.max_bytes
+        if not text:
+            raise _fetch_error("No article text found on the page")
+
+        return ExtractedArticle(
+            url=url,
+            title=title,
+            text=text,
+            tokens=estimate_tokens(text),
+            truncated=truncated,
+            bytes=received,
+            fetch_seconds=time.perf_counter() - started - parse_seconds,
+            extract_seconds=parse_seconds,
+        )
+
+    def close(self):
+        self.session.close()
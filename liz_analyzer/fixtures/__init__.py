@@ -0,0 +1,36 @@
+## Recorded webhook payloads shaped like the n8n response, and article pages, used by benchmarks and the stub server
+
+import json
+import os
+
+
+FIXTURES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def fixture_names():
+    return sorted(name[:-5] for name in os.listdir(FIXTURES_DIR) if name.endswith(".json"))
+
+
+def page_names():
+    """Names of the article page fixtures (fixtures/<name>.html)"""
+    return sorted(name[:-5] for name in os.listdir(FIXTURES_DIR) if name.endswith(".html"))
+
+
+def fixture_path(name):
+    return os.path.join(FIXTURES_DIR, f"{name}.json")
+
+
+def load_fixture_text(name):
+    """Raw response body exactly as the webhook would send it"""
+    with open(fixture_path(name), encoding="utf-8") as f:
+        return f.read()
+
+
+def load_fixture(name):
+    return json.loads(load_fixture_text(name))
+
+
+def load_page_text(name):
+    """Article page HTML (fixtures/<name>.html), as the stub server serves it under /articles/"""
+    with open(os.path.join(FIXTURES_DIR, f"{name}.html"), encoding="utf-8") as f:
+        return f.read()
@@ -0,0 +1,193 @@
+## Persistent history of past analyses, searchable by URL, keyword, category, intent and score
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from .models import AnalysisResult
+from .scoring import score_result
+
+
+DEFAULT_HISTORY_PATH = os.path.join(".liz_cache", "analysis_history.sqlite3")
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_SEARCH_LIMIT = 20
+
+_HISTORY_COLUMNS = (
+    "id", "url", "campaign_definition", "vertical", "analyzed_at", "tier1_category", "primary_intent",
+    "final_score", "final_grade", "score_type", "intentionality_score", "content_score", "keywords",
+)
+
+# One summary row per past analysis; `keywords` are the primary then secondary keywords
+HistoryEntry = namedtuple("HistoryEntry", _HISTORY_COLUMNS)
+
+
+def _like_pattern(text):
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class AnalysisHistory:
+    """SQLite store of analyses shown to users, shared by every session.
+
+    Re-analyzing a URL with the same campaign parameters updates its entry
+    instead of adding another one. Beyond `max_entries` the oldest entries are
+    dropped. Category, intent and score filters are served from indexes;
+    the free-text search scans URLs and keywords.
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+
+        if path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS analysis_history (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL,
+                campaign_definition TEXT NOT NULL,
+                vertical TEXT NOT NULL,
+                analyzed_at REAL NOT NULL,
+                tier1_category TEXT NOT NULL,
+                primary_intent TEXT NOT NULL,
+                final_score INTEGER NOT NULL,
+                final_grade TEXT NOT NULL,
+                score_type TEXT NOT NULL,
+                intentionality_score INTEGER NOT NULL,
+                content_score INTEGER NOT NULL,
+                keywords TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                UNIQUE (url, campaign_definition, vertical)
+            )
+        """)
+        for name, columns in (
+            ("analyzed_at", "analyzed_at"),
+            ("category", "tier1_category, analyzed_at"),
+            ("intent", "primary_intent, analyzed_at"),
+            ("score", "final_score, analyzed_at"),
+        ):
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_analysis_history_{name} ON analysis_history ({columns})")
+
+    @classmethod
+    def from_env(cls):
+        """Create a history store configured from LIZ_HISTORY_* environment variables"""
+        return cls(
+            path=os.environ.get("LIZ_HISTORY_PATH", DEFAULT_HISTORY_PATH),
+            max_entries=int(os.environ.get("LIZ_HISTORY_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+        )
+
+    def record(self, url, result, campaign_definition="", vertical=""):
+        """Add or refresh the entry for an analysis and return its id"""
+        campaign_definition = (campaign_definition or "").strip()
+        vertical = (vertical or "").strip()
+        scores = score_result(result, campaign_enabled=bool(campaign_definition))
+        keywords = "\n".join(result.primary_keywords + result.secondary_keywords)
+        payload = json.dumps(result.to_dict(), ensure_ascii=False)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO analysis_history (url, campaign_definition, vertical, analyzed_at, tier1_category, "
+                "primary_intent, final_score, final_grade, score_type, intentionality_score, content_score, "
+                "keywords, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (url, campaign_definition, vertical) DO UPDATE SET "
+                "analyzed_at = excluded.analyzed_at, tier1_category = excluded.tier1_category, "
+                "primary_intent = excluded.primary_intent, final_score = excluded.final_score, "
+                "final_grade = excluded.final_grade, score_type = excluded.score_type, "
+                "intentionality_score = excluded.intentionality_score, content_score = excluded.content_score, "
+                "keywords = excluded.keywords, payload = excluded.payload",
+                (url, campaign_definition, vertical, time.time(), result.tier1_category,
+                 result.intention.primary.lower(), scores['final_intention_score'], scores['final_intention_grade'],
+                 scores['score_type'], scores['intentionality_score'], scores['content_score'], keywords, payload),
+            )
+            (entry_id,) = self._conn.execute(
+                "SELECT id FROM analysis_history WHERE url = ? AND campaign_definition = ? AND vertical = ?",
+                (url, campaign_definition, vertical),
+            ).fetchone()
+            self._evict_overflow()
+        return entry_id
+
+    def _evict_overflow(self):
+        if not self.max_entries:
+            return
+        self._conn.execute(
+            "DELETE FROM analysis_history WHERE id IN "
+            "(SELECT id FROM analysis_history ORDER BY analyzed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def search(self, text="", category=None, intent=None, min_score=None, limit=DEFAULT_SEARCH_LIMIT):
+        """Most recent entries matching every given filter; `text` matches the URL or a keyword"""
+        clauses = []
+        params = []
+        if category:
+            clauses.append("tier1_category = ?")
+            params.append(category)
+        if intent:
+            clauses.append("primary_intent = ?")
+            params.append(intent.lower())
+        if min_score:
+            clauses.append("final_score >= ?")
+            params.append(min_score)
+        text = (text or "").strip()
+        if text:
+            clauses.append("(url LIKE ? ESCAPE '\\' OR keywords LIKE ? ESCAPE '\\')")
+            params.extend([_like_pattern(text)] * 2)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_HISTORY_COLUMNS)} FROM analysis_history {where} "
+                "ORDER BY analyzed_at DESC LIMIT ?",
+                params + [limit],
+            ).fetchall()
+        return [HistoryEntry(*row[:-1], tuple(row[-1].split("\n")) if row[-1] else ()) for row in rows]
+
+    def load(self, entry_id):
+        """(HistoryEntry, AnalysisResult) for an entry, or None if it is gone"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_HISTORY_COLUMNS)}, payload FROM analysis_history WHERE id = ?", (entry_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        *columns, payload = row
+        entry = HistoryEntry(*columns[:-1], tuple(columns[-1].split("\n")) if columns[-1] else ())
+        return entry, AnalysisResult.from_dict(json.loads(payload))
+
+    def categories(self):
+        """Distinct tier 1 categories, for filter options"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT tier1_category FROM analysis_history WHERE tier1_category != '' ORDER BY tier1_category"
+            ).fetchall()
+        return [category for (category,) in rows]
+
+    def intents(self):
+        """Distinct primary intents, for filter options"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT primary_intent FROM analysis_history WHERE primary_intent != '' ORDER BY primary_intent"
+            ).fetchall()
+        return [intent for (intent,) in rows]
+
+    def delete(self, entry_id):
+        with self._lock:
+            self._conn.execute("DELETE FROM analysis_history WHERE id = ?", (entry_id,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM analysis_history")
+
+    def __len__(self):
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM analysis_history").fetchone()
+        return count
@@ -0,0 +1,162 @@
+## Local intent classifier: the four-way intentionality breakdown without a network call
+#
+# A linear model over hashed word features. Each unigram and bigram of the
+# article (title included) is hashed with CRC-32 into one of 2**bits buckets,
+# counts are damped (1 + log tf) and L2-normalized, and a softmax over four
+# per-intent weight vectors gives the breakdown. The weights are a flat float32
+# array file (data/intent_model.f32) written by scripts/build_intent_model.py
+# and loaded once; scoring an article takes a millisecond or two.
+#
+# The breakdown uses the workflow's shape (integer percentages summing to 100)
+# so the regular scoring functions apply to it unchanged.
+
+import functools
+import math
+import os
+import re
+import sys
+import zlib
+from array import array
+from collections import Counter, namedtuple
+
+from .scoring import intentionality_score
+
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "intent_model.f32")
+
+# Label order of the model's weight columns
+INTENT_TYPES = ('transactional', 'commercial', 'navigational', 'informational')
+
+DEFAULT_FEATURE_BITS = 12
+# The title is counted this many times on top of its occurrence in the text
+TITLE_REPEATS = 2
+
+# Top-intent probability needed for each confidence level; below MEDIUM it is 'low'
+HIGH_CONFIDENCE = 0.6
+MEDIUM_CONFIDENCE = 0.4
+
+# Partial-result section the engine reports the local prediction under while the workflow runs
+LOCAL_INTENT_SECTION = "local_intent"
+
+IntentPrediction = namedtuple("IntentPrediction", ["breakdown", "primary", "confidence", "probability"])
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*")
+
+
+def tokenize(text):
+    return _TOKEN_PATTERN.findall(text.lower().replace("’", "'"))
+
+
+def hashed_features(text, bits=DEFAULT_FEATURE_BITS, title=""):
+    """{bucket: value} for `text`: damped, L2-normalized counts of hashed unigrams and bigrams"""
+    mask = (1 << bits) - 1
+    counts = Counter()
+    for part, repeats in ((text, 1), (title, TITLE_REPEATS)):
+        tokens = tokenize(part) if part else []
+        for _ in range(repeats):
+            for token in tokens:
+                counts[zlib.crc32(token.encode("utf-8")) & mask] += 1
+            for first, second in zip(tokens, tokens[1:]):
+                counts[zlib.crc32(f"{first} {second}".encode("utf-8")) & mask] += 1
+    features = {bucket: 1 + math.log(count) for bucket, count in counts.items()}
+    norm = math.sqrt(sum(value * value for value in features.values())) or 1.0
+    return {bucket: value / norm for bucket, value in features.items()}
+
+
+def percentages(probabilities):
+    """Integer percentages summing to 100 (largest remainder rounding)"""
+    raw = [p * 100 for p in probabilities]
+    values = [int(value) for value in raw]
+    by_remainder = sorted(range(len(raw)), key=lambda i: raw[i] - values[i], reverse=True)
+    for i in by_remainder[:100 - sum(values)]:
+        values[i] += 1
+    return values
+
+
+def confidence_level(probability):
+    if probability >= HIGH_CONFIDENCE:
+        return 'high'
+    if probability >= MEDIUM_CONFIDENCE:
+        return 'medium'
+    return 'low'
+
+
+class IntentModel:
+    """Softmax-linear intent classifier; safe to share between threads.
+
+    `weights` is a float32 array of (2**bits + 1) rows of len(INTENT_TYPES)
+    columns, the last row holding the biases.
+    """
+
+    def __init__(self, weights, bits=DEFAULT_FEATURE_BITS):
+        labels = len(INTENT_TYPES)
+        if len(weights) != ((1 << bits) + 1) * labels:
+            raise ValueError(f"Expected {((1 << bits) + 1) * labels} weights for {bits} feature bits, got {len(weights)}")
+        self.weights = weights
+        self.bits = bits
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        """Read a model file; the feature bits follow from its size"""
+        weights = array("f")
+        with open(path, "rb") as f:
+            weights.frombytes(f.read())
+        # Files are little-endian
+        if sys.byteorder == "big":
+            weights.byteswap()
+        rows = len(weights) // len(INTENT_TYPES) - 1
+        bits = rows.bit_length() - 1
+        if rows <= 0 or 1 << bits != rows:
+            raise ValueError(f"{path} is not an intent model file")
+        return cls(weights, bits)
+
+    def save(self, path=MODEL_PATH):
+        weights = array("f", self.weights)
+        if sys.byteorder == "big":
+            weights.byteswap()
+        with open(path, "wb") as f:
+            f.write(weights.tobytes())
+
+    def probabilities(self, text, title=""):
+        labels = len(INTENT_TYPES)
+        weights = self.weights
+        bias = (1 << self.bits) * labels
+        logits = list(weights[bias:bias + labels])
+        for bucket, value in hashed_features(text, self.bits, title).items():
+            row = bucket * labels
+            for label in range(labels):
+                logits[label] += weights[row + label] * value
+        top = max(logits)
+        exps = [math.exp(logit - top) for logit in logits]
+        total = sum(exps)
+        return [e / total for e in exps]
+
+    def predict(self, text, title=""):
+        """IntentPrediction with the breakdown in the workflow's shape ({intent: percent})"""
+        probabilities = self.probabilities(text, title)
+        best = max(range(len(INTENT_TYPES)), key=probabilities.__getitem__)
+        return IntentPrediction(
+            breakdown=dict(zip(INTENT_TYPES, percentages(probabilities))),
+            primary=INTENT_TYPES[best],
+            confidence=confidence_level(probabilities[best]),
+            probability=probabilities[best],
+        )
+
+
+def intent_section(prediction):
+    """LOCAL_INTENT_SECTION payload: the workflow's intention fields plus the resulting action intent score"""
+    return {
+        'intention': {'primary': prediction.primary, 'confidence': prediction.confidence},
+        'intentionality_breakdown': dict(prediction.breakdown),
+        'intentionality_score': intentionality_score(prediction.breakdown, prediction.confidence),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def default_model():
+    return IntentModel.load()
+
+
+def predict_intent(text, title=""):
+    """Intent breakdown for `text` using the bundled model"""
+    return default_model().predict(text, title)
@@ -0,0 +1,116 @@
+## Background analysis jobs so the Streamlit script thread never waits on the webhook
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+DEFAULT_JOB_WORKERS = 16
+DEFAULT_JOB_RETENTION_SECONDS = 60 * 60
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class Job:
+    """State of one submitted call; read by the page on every poll"""
+
+    def __init__(self, job_id):
+        self.id = job_id
+        self.status = PENDING
+        self.result = None
+        self.error = None
+        # Sections reported while the job runs, for progressive rendering
+        self.partial = {}
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def done(self):
+        return self.status in (DONE, FAILED)
+
+    @property
+    def elapsed(self):
+        return (self.finished_at or time.time()) - self.submitted_at
+
+    def report_section(self, name, value):
+        self.partial[name] = value
+
+
+class JobRunner:
+    """Runs callables on a shared thread pool and tracks them by job id.
+
+    Finished jobs are kept for `retention_seconds` so a session that polls late
+    still finds its result.
+    """
+
+    def __init__(self, max_workers=DEFAULT_JOB_WORKERS, retention_seconds=DEFAULT_JOB_RETENTION_SECONDS):
+        self.retention_seconds = retention_seconds
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="liz-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_workers=int(os.environ.get("LIZ_JOB_WORKERS", DEFAULT_JOB_WORKERS)),
+            retention_seconds=float(os.environ.get("LIZ_JOB_RETENTION_SECONDS", DEFAULT_JOB_RETENTION_SECONDS)),
+        )
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedule fn(*args, **kwargs) and return its job id"""
+        return self._start(self._new_job(), fn, args, kwargs)
+
+    def submit_streaming(self, fn, *args, **kwargs):
+        """Like submit(), also passing `on_section=` so fn can report partial results into Job.partial"""
+        job = self._new_job()
+        return self._start(job, fn, args, dict(kwargs, on_section=job.report_section))
+
+    def _new_job(self):
+        job = Job(uuid.uuid4().hex)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        return job
+
+    def _start(self, job, fn, args, kwargs):
+        def run():
+            job.started_at = time.time()
+            job.status = RUNNING
+            # finished_at is set before the terminal status, which is what _prune and pollers go by
+            try:
+                job.result = fn(*args, **kwargs)
+            except Exception as e:
+                job.error = e
+                job.finished_at = time.time()
+                job.status = FAILED
+            else:
+                job.finished_at = time.time()
+                job.status = DONE
+
+        self._pool.submit(run)
+        return job.id
+
+    def get(self, job_id):
+        """Return the Job for job_id, or None if it is unknown or has expired"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def discard(self, job_id):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def active_count(self):
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if not job.done)
+
+    def _prune(self):
+        cutoff = time.time() - self.retention_seconds
+        expired = [job_id for job_id, job in self._jobs.items() if job.done and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
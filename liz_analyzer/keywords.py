@@ -0,0 +1,201 @@
+## Local keyword extraction: a fast statistical stand-in for the workflow's keywords
+#
+# Candidates are RAKE-style runs of up to three content words between
+# stopwords and punctuation. Each is scored by how often it occurs in the
+# article, weighted by the inverse document frequency of its words in a
+# background table of general English (data/keyword_background.tsv), so
+# article-specific terms outrank words that are common everywhere. A
+# few-thousand-word article takes a few milliseconds.
+#
+# The engine runs this on locally extracted article text (see extract.py): the
+# result is shown while the workflow is still running, shown on its own when
+# the workflow fails, and fills in keyword lists the workflow left empty.
+
+import functools
+import math
+import os
+import re
+from collections import Counter, namedtuple
+
+
+BACKGROUND_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "keyword_background.tsv")
+
+DEFAULT_PRIMARY_COUNT = 4
+DEFAULT_SECONDARY_COUNT = 6
+MAX_PHRASE_WORDS = 3
+# Multi-word phrases seen fewer times than this are chance word pairings
+MIN_PHRASE_COUNT = 2
+# Extra weight per additional word in a phrase, and for phrases that appear in the title
+PHRASE_LENGTH_BONUS = 0.3
+TITLE_BONUS = 1.5
+
+STOPWORDS = frozenset("""
+a about above across after afterwards again against ago all almost along already also although always am among
+an and another any anyone anything anyway are around as at away back be became because become becomes been before
+beforehand behind being below beside besides between beyond both but by can cannot could did do does doing done
+down during each eg either else elsewhere enough etc even ever every everyone everything except far few for former
+formerly from further get gets getting got had has have having he hence her here hereby herein hers herself him
+himself his how however i ie if in indeed instead into is it its itself just last later latter least less let lets
+like likely made make makes many may me meanwhile might mine more moreover most mostly much must my myself namely
+neither never nevertheless next no nobody none nor not nothing now nowhere of off often on once one ones only onto
+or other others otherwise our ours ourselves out over own per perhaps please put quite rather re really said same
+say says see seem seemed seeming seems several shall she should since so some somehow someone something sometime
+sometimes somewhere still such than that the their theirs them themselves then thence there thereafter thereby
+therefore therein these they thing things this those though through throughout thru thus to together too toward
+towards under unless until up upon us use used uses using very via was way ways we well were what whatever when
+whence whenever where whereas whereby wherever whether which while who whoever whole whom whose why will with within
+without would yet you your yours yourself yourselves
+two three four five six seven eight nine ten eleven twelve twenty thirty forty fifty hundred thousand
+""".split())
+
+# Partial-result section the engine reports local keywords under while the workflow runs
+LOCAL_KEYWORDS_SECTION = "local_keywords"
+
+KeywordResult = namedtuple("KeywordResult", ["primary", "secondary"])
+
+# Phrase boundaries: sentence and clause punctuation, brackets, quotes and dashes between words
+_FRAGMENT_PATTERN = re.compile(r"[^.,;:!?()\[\]{}\"“”«»…|/\\\n\r\t—–]+")
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['-][a-z0-9]+)*")
+
+
+def local_keywords_enabled():
+    return os.environ.get("LIZ_LOCAL_KEYWORDS", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def fold(word):
+    """Grouping key for a lowercase word: possessives dropped and regular plurals singularized"""
+    if word.endswith("'s"):
+        word = word[:-2]
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def _is_content_word(word):
+    return (len(word) > 1 and word not in STOPWORDS and fold(word) not in STOPWORDS
+            and not word.replace("-", "").isdigit())
+
+
+def _runs(text):
+    """Lists of consecutive content words, split at stopwords, numbers and punctuation"""
+    text = text.lower().replace("’", "'")
+    for fragment in _FRAGMENT_PATTERN.findall(text):
+        run = []
+        for word in _TOKEN_PATTERN.findall(fragment):
+            if _is_content_word(word):
+                run.append(word)
+            elif run:
+                yield run
+                run = []
+        if run:
+            yield run
+
+
+def document_terms(text):
+    """Set of folded content words in `text`, as counted for the background table"""
+    return {fold(word) for run in _runs(text) for word in run}
+
+
+class BackgroundFrequencies:
+    """Document frequencies of folded words in a reference corpus of `documents` documents.
+
+    Words missing from the table count as rarer than every listed word.
+    """
+
+    def __init__(self, documents, frequencies):
+        self.documents = documents
+        self.frequencies = frequencies
+        unseen_df = min(frequencies.values()) / 2 if frequencies else 1
+        self.default_idf = math.log((documents + 1) / (unseen_df + 1))
+        self._idf = {term: math.log((documents + 1) / (df + 1)) for term, df in frequencies.items()}
+
+    @classmethod
+    def load(cls, path=BACKGROUND_PATH):
+        """Read a table written by scripts/build_keyword_background.py"""
+        documents = 0
+        frequencies = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("#"):
+                    fields = line[1:].split()
+                    if len(fields) == 2 and fields[0] == "documents":
+                        documents = int(fields[1])
+                    continue
+                term, _, df = line.rstrip("\n").partition("\t")
+                if term and df:
+                    frequencies[term] = int(df)
+        return cls(documents, frequencies)
+
+    def idf(self, term):
+        return self._idf.get(term, self.default_idf)
+
+
+class KeywordExtractor:
+    """Picks primary and secondary keywords from article text; safe to share between threads"""
+
+    def __init__(self, background=None, primary_count=DEFAULT_PRIMARY_COUNT, secondary_count=DEFAULT_SECONDARY_COUNT):
+        self.background = background or BackgroundFrequencies.load()
+        self.primary_count = primary_count
+        self.secondary_count = secondary_count
+
+    def extract(self, text, title=""):
+        """KeywordResult of lowercase keyword tuples, best first"""
+        counts = Counter()
+        surfaces = {}
+        first_seen = {}
+        for run in _runs(text):
+            folded = [fold(word) for word in run]
+            for size in range(1, MAX_PHRASE_WORDS + 1):
+                for start in range(len(run) - size + 1):
+                    key = tuple(folded[start:start + size])
+                    counts[key] += 1
+                    first_seen.setdefault(key, len(first_seen))
+                    surfaces.setdefault(key, Counter())[" ".join(run[start:start + size])] += 1
+
+        # Occurrences inside a recurring longer phrase are credited to that phrase
+        residual = dict(counts)
+        for key, count in counts.items():
+            if len(key) > 1 and count >= MIN_PHRASE_COUNT:
+                for sub in (key[:-1], key[1:]):
+                    residual[sub] = max(0, residual[sub] - count)
+
+        title_terms = document_terms(title) if title else set()
+        scored = []
+        for key, count in residual.items():
+            if not count or (len(key) > 1 and counts[key] < MIN_PHRASE_COUNT):
+                continue
+            score = count * sum(self.background.idf(term) for term in key) / len(key)
+            score *= 1 + PHRASE_LENGTH_BONUS * (len(key) - 1)
+            if title_terms and title_terms.issuperset(key):
+                score *= TITLE_BONUS
+            scored.append((-score, first_seen[key], key))
+        scored.sort()
+
+        chosen = []
+        wanted = self.primary_count + self.secondary_count
+        for _, _, key in scored:
+            if any(_contains(key, other) or _contains(other, key) for other in chosen):
+                continue
+            chosen.append(key)
+            if len(chosen) == wanted:
+                break
+
+        keywords = [surfaces[key].most_common(1)[0][0] for key in chosen]
+        return KeywordResult(tuple(keywords[:self.primary_count]), tuple(keywords[self.primary_count:]))
+
+
+def _contains(phrase, part):
+    size = len(part)
+    return any(phrase[start:start + size] == part for start in range(len(phrase) - size + 1))
+
+
+@functools.lru_cache(maxsize=1)
+def default_extractor():
+    return KeywordExtractor()
+
+
+def extract_keywords(text, title=""):
+    """Primary and secondary keywords for `text` using the bundled background table"""
+    return default_extractor().extract(text, title)
@@ -0,0 +1,273 @@
+## Typed analysis result, validated once per webhook response
+#
+# AnalysisResult.from_dict() checks the n8n payload and raises AnalysisError
+# on anything malformed, so the pages, scoring and batch code can use plain
+# attribute access. Instances are frozen slotted dataclasses with tuples for
+# the string lists, which keeps the many results held in sessions, batch runs
+# and history small. to_dict() gives back the payload shape for the cache and
+# the JSON API.
+
+from dataclasses import dataclass, field
+
+from .client import PARSE_FAILED_SUGGESTIONS, AnalysisError
+
+
+class _Invalid(Exception):
+    """Validation failure at `path`; turned into an AnalysisError by AnalysisResult.from_dict"""
+
+    def __init__(self, path, expected, value):
+        super().__init__(f"{path}: expected {expected}, got {type(value).__name__}")
+
+
+def _mapping(data, path, required=False):
+    if data is None and not required:
+        return {}
+    if not isinstance(data, dict):
+        raise _Invalid(path, "an object", data)
+    return data
+
+
+def _text(data, name, path, default=""):
+    value = data.get(name)
+    if value is None:
+        return default
+    if not isinstance(value, str):
+        raise _Invalid(f"{path}.{name}", "a string", value)
+    return value
+
+
+def _number(data, name, path, default=0):
+    value = data.get(name)
+    if value is None:
+        return default
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise _Invalid(f"{path}.{name}", "a number", value)
+    return value
+
+
+def _texts(data, name, path):
+    value = data.get(name)
+    if value is None:
+        return ()
+    if not isinstance(value, (list, tuple)):
+        raise _Invalid(f"{path}.{name}", "a list", value)
+    for i, item in enumerate(value):
+        if not isinstance(item, str):
+            raise _Invalid(f"{path}.{name}[{i}]", "a string", item)
+    return tuple(value)
+
+
+def _distribution(data, name, path, required=False):
+    """Label -> percentage mapping, key order preserved (it decides chart and scoring order)"""
+    value = _mapping(data.get(name), f"{path}.{name}", required)
+    for label, percentage in value.items():
+        if isinstance(percentage, bool) or not isinstance(percentage, (int, float)):
+            raise _Invalid(f"{path}.{name}.{label}", "a number", percentage)
+    return dict(value)
+
+
+@dataclass(frozen=True, slots=True)
+class Intention:
+    primary: str = ""
+    # None when the workflow left it out; the scorers each have their own fallback
+    confidence: str = None
+
+    @classmethod
+    def from_dict(cls, data, path="result.intention"):
+        data = _mapping(data, path, required=True)
+        return cls(primary=_text(data, "primary", path), confidence=_text(data, "confidence", path, None))
+
+    def to_dict(self):
+        document = {"primary": self.primary}
+        if self.confidence is not None:
+            document["confidence"] = self.confidence
+        return document
+
+
+@dataclass(frozen=True, slots=True)
+class Demographics:
+    age_range: str = ""
+    age_distribution: dict = field(default_factory=dict)
+    gender_distribution: dict = field(default_factory=dict)
+    gender: str = ""
+    region: tuple = ()
+    profession: str = ""
+    income_range: str = ""
+
+    @classmethod
+    def from_dict(cls, data, path="result.audience_profile.demographics"):
+        data = _mapping(data, path)
+        return cls(
+            age_range=_text(data, "age_range", path),
+            age_distribution=_distribution(data, "age_distribution", path),
+            gender_distribution=_distribution(data, "gender_distribution", path),
+            gender=_text(data, "gender", path),
+            region=_texts(data, "region", path),
+            profession=_text(data, "profession", path),
+            income_range=_text(data, "income_range", path),
+        )
+
+    def to_dict(self):
+        return {
+            "age_range": self.age_range,
+            "age_distribution": dict(self.age_distribution),
+            "gender_distribution": dict(self.gender_distribution),
+            "gender": self.gender,
+            "region": list(self.region),
+            "profession": self.profession,
+            "income_range": self.income_range,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class AudienceProfile:
+    type: tuple = ()
+    interest_groups: tuple = ()
+    intent_signal: str = ""
+    demographics: Demographics = field(default_factory=Demographics)
+
+    @classmethod
+    def from_dict(cls, data, path="result.audience_profile"):
+        data = _mapping(data, path)
+        return cls(
+            type=_texts(data, "type", path),
+            interest_groups=_texts(data, "interest_groups", path),
+            intent_signal=_text(data, "intent_signal", path),
+            demographics=Demographics.from_dict(data.get("demographics"), f"{path}.demographics"),
+        )
+
+    def to_dict(self):
+        return {
+            "type": list(self.type),
+            "interest_groups": list(self.interest_groups),
+            "intent_signal": self.intent_signal,
+            "demographics": self.demographics.to_dict(),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignRelevancy:
+    overall_relevancy_score: float = 0
+    relevancy_level: str = ""
+    recommendation: str = ""
+    intent_alignment_score: float = 0
+    vertical_alignment_score: float = 0
+    matching_keywords: tuple = ()
+    content_strengths_for_campaign: tuple = ()
+
+    @classmethod
+    def from_dict(cls, data, path="result.campaign_relevancy"):
+        data = _mapping(data, path)
+        return cls(
+            overall_relevancy_score=_number(data, "overall_relevancy_score", path),
+            relevancy_level=_text(data, "relevancy_level", path),
+            recommendation=_text(data, "recommendation", path),
+            intent_alignment_score=_number(data, "intent_alignment_score", path),
+            vertical_alignment_score=_number(data, "vertical_alignment_score", path),
+            matching_keywords=_texts(data, "matching_keywords", path),
+            content_strengths_for_campaign=_texts(data, "content_strengths_for_campaign", path),
+        )
+
+    def to_dict(self):
+        return {
+            "overall_relevancy_score": self.overall_relevancy_score,
+            "relevancy_level": self.relevancy_level,
+            "recommendation": self.recommendation,
+            "intent_alignment_score": self.intent_alignment_score,
+            "vertical_alignment_score": self.vertical_alignment_score,
+            "matching_keywords": list(self.matching_keywords),
+            "content_strengths_for_campaign": list(self.content_strengths_for_campaign),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class PerformanceSummary:
+    content_intent: str = ""
+    campaign_suitability: str = ""
+    overall_relevancy: str = ""
+    recommendation: str = ""
+
+    @classmethod
+    def from_dict(cls, data, path="result.performance_summary"):
+        data = _mapping(data, path)
+        return cls(**{name: _text(data, name, path) for name in cls.__slots__})
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisResult:
+    """One article analysis as returned by the workflow.
+
+    `campaign_relevancy` and `performance_summary` are None unless the
+    analysis ran with a campaign. Top-level fields this model does not know
+    are kept in `extras` so to_dict() loses nothing.
+    """
+    intention: Intention
+    intentionality_breakdown: dict
+    tier1_category: str = ""
+    tier2_categories: tuple = ()
+    primary_keywords: tuple = ()
+    secondary_keywords: tuple = ()
+    audience_profile: AudienceProfile = field(default_factory=AudienceProfile)
+    summary_rationale: str = ""
+    campaign_relevancy: CampaignRelevancy = None
+    performance_summary: PerformanceSummary = None
+    analysis_metadata: dict = None
+    extras: dict = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """Validate a workflow payload, raising AnalysisError if it is malformed"""
+        try:
+            data = _mapping(data, "result", required=True)
+            campaign_relevancy = data.get("campaign_relevancy")
+            performance_summary = data.get("performance_summary")
+            analysis_metadata = data.get("analysis_metadata")
+            extras = {name: value for name, value in data.items() if name not in _RESULT_FIELDS}
+            return cls(
+                intention=Intention.from_dict(data.get("intention")),
+                intentionality_breakdown=_distribution(data, "intentionality_breakdown", "result", required=True),
+                tier1_category=_text(data, "tier1_category", "result"),
+                tier2_categories=_texts(data, "tier2_categories", "result"),
+                primary_keywords=_texts(data, "primary_keywords", "result"),
+                secondary_keywords=_texts(data, "secondary_keywords", "result"),
+                audience_profile=AudienceProfile.from_dict(data.get("audience_profile")),
+                summary_rationale=_text(data, "summary_rationale", "result"),
+                campaign_relevancy=CampaignRelevancy.from_dict(campaign_relevancy) if campaign_relevancy else None,
+                performance_summary=PerformanceSummary.from_dict(performance_summary) if performance_summary else None,
+                analysis_metadata=dict(_mapping(analysis_metadata, "result.analysis_metadata")) or None,
+                extras=extras or None,
+            )
+        except _Invalid as e:
+            raise AnalysisError(
+                "parse_error",
+                "The analysis service returned an incomplete result",
+                suggestions=PARSE_FAILED_SUGGESTIONS,
+                technical_details=f"Invalid result: {e}"
+            )
+
+    def to_dict(self):
+        document = {
+            "tier1_category": self.tier1_category,
+            "tier2_categories": list(self.tier2_categories),
+            "intention": self.intention.to_dict(),
+            "intentionality_breakdown": dict(self.intentionality_breakdown),
+            "primary_keywords": list(self.primary_keywords),
+            "secondary_keywords": list(self.secondary_keywords),
+            "audience_profile": self.audience_profile.to_dict(),
+            "summary_rationale": self.summary_rationale,
+        }
+        if self.campaign_relevancy is not None:
+            document["campaign_relevancy"] = self.campaign_relevancy.to_dict()
+        if self.performance_summary is not None:
+            document["performance_summary"] = self.performance_summary.to_dict()
+        if self.analysis_metadata is not None:
+            document["analysis_metadata"] = dict(self.analysis_metadata)
+        if self.extras:
+            document.update(self.extras)
+        return document
+
+
+_RESULT_FIELDS = frozenset(AnalysisResult.__slots__) - {"extras"}
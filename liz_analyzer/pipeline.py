@@ -0,0 +1,182 @@
+## The local stages of one analysis, shared by AnalysisEngine and the JSON API
+#
+# Around the webhook call every analysis runs the same synchronous steps:
+# before it, fetch and extract the article, run the local keyword, intent and
+# category models and let the cascade decide whether the webhook is needed;
+# after it, validate the workflow's payload, fill in what it left empty, tag
+# the path taken and cache the result. The engine calls prepare() and finish()
+# directly; the async API runs them through asyncio.to_thread and only makes
+# the webhook call itself.
+
+import dataclasses
+import time
+from collections import namedtuple
+
+from .cache import make_cache_key
+from .cascade import LOCAL_CACHE_VARIANT, REASON_CONFIDENT, with_analysis_path
+from .categories import LOCAL_CATEGORY_SECTION, category_section, default_classifier
+from .client import AnalysisError
+from .extract import webhook_payload
+from .intent_model import LOCAL_INTENT_SECTION, default_model, intent_section
+from .keywords import LOCAL_KEYWORDS_SECTION, default_extractor
+from .models import AnalysisResult
+from .timings import StageTimings
+
+
+# What prepare() found out before the webhook call. `result` is set when the
+# cascade answered locally and the webhook must not be called; otherwise
+# `content` is the extracted text to send with the URL (None to send the URL alone).
+LocalAnalysis = namedtuple("LocalAnalysis", ["keywords", "prediction", "category", "reason", "result", "content"])
+
+
+def result_from_cache(document):
+    """AnalysisResult for a cached payload, or None if it no longer validates"""
+    try:
+        return AnalysisResult.from_dict(document)
+    except AnalysisError:
+        return None
+
+
+def with_local_keywords(result, keywords):
+    """`result` with locally extracted keywords in place of the workflow's empty keyword lists"""
+    metadata = dict(result.analysis_metadata or {})
+    metadata['keywords_source'] = 'local'
+    return dataclasses.replace(
+        result, primary_keywords=keywords.primary, secondary_keywords=keywords.secondary, analysis_metadata=metadata
+    )
+
+
+def with_local_category(result, category):
+    """`result` with the local classifier's categories in place of the workflow's empty ones"""
+    metadata = dict(result.analysis_metadata or {})
+    metadata['category_source'] = 'local'
+    return dataclasses.replace(
+        result, tier1_category=category.tier1_category, tier2_categories=category.tier2_categories,
+        analysis_metadata=metadata
+    )
+
+
+class AnalysisPipeline:
+    """Article extraction, local models, cascade routing and result caching; safe to share between threads.
+
+    With an `extractor` the article is fetched and reduced to its main text,
+    which is sent along with the URL unless `send_content` is off. Keywords,
+    an intent breakdown and IAB categories are computed from it and reported
+    as partial sections through `on_section`; local keywords and categories
+    replace ones the workflow leaves empty. `timings` records how long the
+    fetch, extraction, keyword, intent and category stages take.
+
+    A cascade with its own categorizer supplies the pipeline's, so the
+    categories in a result are the ones its confidence was gated on; passing
+    a different `categorizer` alongside it is a ValueError.
+    """
+
+    def __init__(self, cache, extractor=None, send_content=True, keywords=None, intent_model=None,
+                 categorizer=None, cascade=None, timings=None):
+        self.cache = cache
+        self.extractor = extractor
+        self.send_content = send_content
+        self.keywords = keywords or default_extractor()
+        self.intent_model = intent_model or default_model()
+        if cascade is not None and cascade.categorizer is not None:
+            if categorizer is not None and categorizer is not cascade.categorizer:
+                raise ValueError("The pipeline and its cascade were given different categorizers")
+            categorizer = cascade.categorizer
+        self.categorizer = categorizer or default_classifier()
+        self.cascade = cascade
+        self.timings = timings or StageTimings()
+
+    def cached(self, processed_url, campaign_definition="", vertical="", full_analysis=False):
+        """The cached workflow result for a validated URL, else (unless `full_analysis`) a cached local answer, or None"""
+        keys = [make_cache_key(processed_url, campaign_definition, vertical)]
+        if self.cascade is not None and not full_analysis:
+            keys.append(make_cache_key(processed_url, campaign_definition, vertical, LOCAL_CACHE_VARIANT))
+        for key in keys:
+            document = self.cache.get(key)
+            result = result_from_cache(document) if document is not None else None
+            if result is not None:
+                return result
+        return None
+
+    def prepare(self, processed_url, campaign_definition="", vertical="", on_section=None, skip_fetch=False,
+                full_analysis=False):
+        """LocalAnalysis for a validated URL.
+
+        `skip_fetch` (e.g. while the circuit is open) leaves the page to the
+        workflow; `full_analysis` sends it to the workflow even when the
+        cascade could answer locally.
+        """
+        article = None if skip_fetch else self.extract_article(processed_url)
+        keywords = self.local_keywords(article, on_section)
+        prediction = self.local_intent(article, on_section)
+        category = self.local_category(article, on_section)
+        reason = None
+        if self.cascade is not None:
+            reason = self.cascade.route(article, prediction, category, campaign_definition, full_analysis)
+            if reason == REASON_CONFIDENT:
+                result = self.cascade.local_result(keywords, prediction, category)
+                self.cascade.stats.record(reason)
+                # Kept apart from workflow results so it never stands in for a full analysis
+                key = make_cache_key(processed_url, campaign_definition, vertical, LOCAL_CACHE_VARIANT)
+                self.cache.set(key, result.to_dict(), processed_url)
+                return LocalAnalysis(keywords, prediction, category, reason, result, None)
+        content = webhook_payload(article) if article is not None and self.send_content else None
+        return LocalAnalysis(keywords, prediction, category, reason, None, content)
+
+    def finish(self, local, document, processed_url, campaign_definition="", vertical=""):
+        """Validated AnalysisResult for the workflow's `document`, with local fills and path, stored in the cache"""
+        result = AnalysisResult.from_dict(document)
+        if local.keywords is not None and not result.primary_keywords and not result.secondary_keywords:
+            result = with_local_keywords(result, local.keywords)
+        if local.category is not None and not result.tier1_category:
+            result = with_local_category(result, local.category)
+        if local.reason is not None:
+            result = with_analysis_path(result, local.reason)
+            self.cascade.stats.record(local.reason)
+        self.cache.set(make_cache_key(processed_url, campaign_definition, vertical), result.to_dict(), processed_url)
+        return result
+
+    def extract_article(self, processed_url):
+        """The article's extracted text, or None when there is no extractor or the page has no usable text"""
+        if self.extractor is None:
+            return None
+        try:
+            article = self.extractor.extract(processed_url)
+        except AnalysisError:
+            return None
+        self.timings.record("fetch", article.fetch_seconds)
+        self.timings.record("extract", article.extract_seconds)
+        return article
+
+    def local_keywords(self, article, on_section=None):
+        """KeywordResult for an extracted article (None without one), reported through `on_section`"""
+        if article is None:
+            return None
+        started = time.perf_counter()
+        keywords = self.keywords.extract(article.text, article.title)
+        self.timings.record("keywords", time.perf_counter() - started)
+        if on_section is not None and (keywords.primary or keywords.secondary):
+            on_section(LOCAL_KEYWORDS_SECTION, {'primary': list(keywords.primary), 'secondary': list(keywords.secondary)})
+        return keywords
+
+    def local_intent(self, article, on_section=None):
+        """IntentPrediction for an extracted article (None without one), reported through `on_section`"""
+        if article is None:
+            return None
+        started = time.perf_counter()
+        prediction = self.intent_model.predict(article.text, article.title)
+        self.timings.record("intent", time.perf_counter() - started)
+        if on_section is not None:
+            on_section(LOCAL_INTENT_SECTION, intent_section(prediction))
+        return prediction
+
+    def local_category(self, article, on_section=None):
+        """CategoryPrediction for an extracted article (None without one or without a match), reported through `on_section`"""
+        if article is None:
+            return None
+        started = time.perf_counter()
+        category = self.categorizer(article.text, article.title)
+        self.timings.record("category", time.perf_counter() - started)
+        if on_section is not None and category is not None:
+            on_section(LOCAL_CATEGORY_SECTION, category_section(category))
+        return category
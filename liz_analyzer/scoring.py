@@ -0,0 +1,164 @@
+## Intent, campaign and content scoring for Liz analysis results
+#
+# Pure functions over an AnalysisResult (see models.py), shared by the
+# Streamlit page, batch mode and any headless caller.
+
+# Confidence level -> intent accuracy percentage
+CONFIDENCE_ACCURACY = {'high': 85, 'medium': 70, 'low': 50}
+
+# Points per intent type used by the action intent score
+INTENT_WEIGHTS = {
+    'transactional': 95,
+    'commercial': 75,
+    'navigational': 45,
+    'informational': 15
+}
+
+CONFIDENCE_MULTIPLIERS = {
+    'high': 1.0,
+    'medium': 0.85,
+    'low': 0.7
+}
+
+CONFIDENCE_CONTENT_SCORES = {'high': 40, 'medium': 30, 'low': 20}
+
+# Final score weighting when campaign analysis is enabled
+CAMPAIGN_FIT_WEIGHT = 0.8
+ACTION_INTENT_WEIGHT = 0.2
+
+FINAL_INTENTION_GRADES = [
+    (90, "A+", "Exceptional"),
+    (80, "A", "Excellent"),
+    (70, "B+", "Very Good"),
+    (60, "B", "Good"),
+    (50, "C+", "Fair"),
+    (40, "C", "Below Average"),
+    (30, "D", "Poor"),
+]
+
+INTENTIONALITY_GRADES = [
+    (85, "A+", "Very High Action Intent"),
+    (75, "A", "High Action Intent"),
+    (65, "B+", "Good Action Intent"),
+    (55, "B", "Moderate Action Intent"),
+    (45, "C+", "Some Action Intent"),
+    (35, "C", "Low Action Intent"),
+    (25, "D", "Very Low Action Intent"),
+]
+
+
+def _confidence(result, default):
+    # Each scorer falls back differently when the workflow leaves confidence out
+    confidence = result.intention.confidence
+    return default if confidence is None else confidence
+
+def calculate_intent_accuracy(result):
+    confidence = _confidence(result, 'low')
+    accuracy = CONFIDENCE_ACCURACY.get(confidence, 85)
+
+    intentionality = result.intentionality_breakdown
+    if intentionality and any(val > 0 for val in intentionality.values()):
+        accuracy += 10
+
+    return min(accuracy, 99)
+
+def calculate_intentionality_score(result):
+    return intentionality_score(result.intentionality_breakdown, _confidence(result, 'medium'))
+
+def intentionality_score(intentionality, confidence):
+    """Action intent score for a bare breakdown, e.g. from the local intent model"""
+    if not intentionality:
+        return 0
+
+    weighted_score = 0
+    for intent_type, percentage in intentionality.items():
+        weight = INTENT_WEIGHTS.get(intent_type.lower(), 0)
+        weighted_score += (percentage / 100) * weight
+
+    confidence_multiplier = CONFIDENCE_MULTIPLIERS.get(confidence, 0.85)
+    final_score = weighted_score * confidence_multiplier
+
+    return min(round(final_score), 100)
+
+def calculate_final_intention_score(result, campaign_relevancy=None):
+    """
+    Calculate the final intention score based on:
+    - 80% Campaign Fit Score (if available)
+    - 20% Action Intent Score
+
+    If campaign analysis is disabled, returns only the Action Intent Score
+    """
+    # Get the action intent score (intentionality score)
+    action_intent_score = calculate_intentionality_score(result)
+
+    # If no campaign data, return just the action intent score
+    if not campaign_relevancy:
+        return action_intent_score, "action_only"
+
+    # Get campaign fit score
+    campaign_fit_score = campaign_relevancy.overall_relevancy_score
+
+    # Calculate weighted final score: 80% campaign fit + 20% action intent
+    final_score = (campaign_fit_score * CAMPAIGN_FIT_WEIGHT) + (action_intent_score * ACTION_INTENT_WEIGHT)
+
+    return round(final_score), "combined"
+
+def get_final_intention_grade(score, score_type="combined"):
+    """
+    Get grade and description for the final intention score
+    """
+    if score_type == "action_only":
+        prefix = "Action Intent: "
+    else:
+        prefix = "Overall Intent: "
+
+    for threshold, grade, description in FINAL_INTENTION_GRADES:
+        if score >= threshold:
+            return grade, f"{prefix}{description}"
+    return "F", f"{prefix}Very Poor"
+
+def get_intentionality_grade(score):
+    for threshold, grade, description in INTENTIONALITY_GRADES:
+        if score >= threshold:
+            return grade, description
+    return "F", "Minimal Action Intent"
+
+def calculate_content_score(result):
+    score = 0
+    confidence = _confidence(result, 'Low')
+    score += CONFIDENCE_CONTENT_SCORES.get(confidence, 20)
+
+    primary_kw = len(result.primary_keywords)
+    secondary_kw = len(result.secondary_keywords)
+    keyword_score = min((primary_kw * 3 + secondary_kw * 2), 20)
+    score += keyword_score
+
+    category_score = min(len(result.tier2_categories) * 5, 15)
+    score += category_score
+
+    audience_types = result.audience_profile.type
+    interest_groups = result.audience_profile.interest_groups
+    audience_score = min((len(audience_types) * 3 + len(interest_groups) * 2), 15)
+    score += audience_score
+
+    return min(score, 100)
+
+def score_result(result, campaign_enabled=False):
+    """All scores and grades for one result, as used by batch rows and the JSON API"""
+    campaign_relevancy = result.campaign_relevancy if campaign_enabled else None
+    intentionality_score = calculate_intentionality_score(result)
+    intentionality_grade, _ = get_intentionality_grade(intentionality_score)
+    final_score, score_type = calculate_final_intention_score(result, campaign_relevancy)
+    final_grade, final_grade_desc = get_final_intention_grade(final_score, score_type)
+
+    return {
+        'intentionality_score': intentionality_score,
+        'intentionality_grade': intentionality_grade,
+        'final_intention_score': final_score,
+        'final_intention_grade': final_grade,
+        'final_intention_description': final_grade_desc,
+        'score_type': score_type,
+        'campaign_fit_score': campaign_relevancy.overall_relevancy_score if campaign_relevancy else None,
+        'content_score': calculate_content_score(result),
+        'intent_accuracy': calculate_intent_accuracy(result),
+    }
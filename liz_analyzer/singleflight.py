@@ -0,0 +1,96 @@
+## In-flight request coalescing: concurrent identical calls share one upstream execution
+
+import asyncio
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Thread based single-flight group.
+
+    The first caller for a key runs the function; callers arriving with the
+    same key while it is still running block and receive the same result
+    object (or the same exception). Nothing is remembered once the call ends,
+    so later callers run the function again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self):
+        return {"executions": self.executions, "coalesced": self.coalesced, "in_flight": self.in_flight()}
+
+
+class AsyncSingleFlight:
+    """asyncio counterpart of SingleFlight for use inside one event loop"""
+
+    def __init__(self):
+        self._calls = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key, fn, *args, **kwargs):
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.executions += 1
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody else awaited is not logged as lost
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+            # The leader was cancelled: release the waiters instead of leaving them hanging
+            if not future.done():
+                future.cancel()
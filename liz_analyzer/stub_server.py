@@ -0,0 +1,292 @@
+## Local stand-in for the n8n analysis webhook, for offline load tests and benchmarks
+#
+#     python -m liz_analyzer.stub_server --port 8799 --latency lognormal --median-ms 800 \
+#         --failure-rate 0.02 --error-rate 0.05
+#     LIZ_WEBHOOK_URL=http://127.0.0.1:8799/webhook/contextual-engine-test streamlit run app.py
+#
+# Replays the recorded payloads in liz_analyzer/fixtures (or --fixture-dir):
+# requests carrying a campaign_definition get the campaign payload, others the
+# basic one. A share of requests can be answered with HTTP failures or with the
+# workflow's [{"error": ..., "error_type": ...}] shape. Clients that accept
+# application/x-ndjson get the result streamed one section per line, with the
+# simulated latency spread across the sections. GET /__stats returns request
+# counters.
+#
+# The server also stands in for article sites: GET /articles/<name> serves
+# fixtures/<name>.html (after --page-ms of simulated latency), so local content
+# extraction can be exercised offline. Requests that arrive with extracted
+# content (POSTed "content") are counted separately.
+
+import argparse
+import json
+import math
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+from .client import NDJSON_CONTENT_TYPE
+from .fixtures import FIXTURES_DIR
+
+
+LATENCY_MODES = ("fixed", "uniform", "lognormal")
+
+DEFAULT_BASIC_FIXTURE = "basic_article"
+DEFAULT_CAMPAIGN_FIXTURE = "campaign_article"
+DEFAULT_ERROR_FIXTURE = "error_fetch_failed"
+DEFAULT_FAILURE_STATUS = 503
+
+# Order the workflow's stages produce sections in when streaming
+STREAM_SECTION_ORDER = (
+    "intention", "tier1_category", "intentionality_breakdown", "tier2_categories", "audience_profile",
+    "primary_keywords", "secondary_keywords", "summary_rationale", "campaign_relevancy", "performance_summary",
+)
+
+
+class LatencyModel:
+    """Draws simulated processing time in seconds.
+
+    fixed:     always `median_ms`
+    uniform:   between `min_ms` and `max_ms`
+    lognormal: median `median_ms` with shape `sigma`, the long right tail real LLM workflows show
+    """
+
+    def __init__(self, mode="fixed", median_ms=0, min_ms=0, max_ms=0, sigma=0.5, rng=None):
+        if mode not in LATENCY_MODES:
+            raise ValueError(f"Unknown latency mode {mode!r}; expected one of {', '.join(LATENCY_MODES)}")
+        self.mode = mode
+        self.median_ms = median_ms
+        self.min_ms = min_ms
+        self.max_ms = max(max_ms, min_ms)
+        self.sigma = sigma
+        self.rng = rng or random.Random()
+
+    def sample(self):
+        if self.mode == "uniform":
+            ms = self.rng.uniform(self.min_ms, self.max_ms)
+        elif self.mode == "lognormal" and self.median_ms > 0:
+            ms = self.rng.lognormvariate(math.log(self.median_ms), self.sigma)
+        else:
+            ms = self.median_ms
+        return ms / 1000
+
+
+class StubWebhookServer:
+    """Threaded HTTP server answering like the analysis workflow.
+
+    Use it in-process (`start()` / `stop()`, `url`) or from the command line.
+    `failure_rate` is the share of requests answered with `failure_status`;
+    `error_rate` the share answered 200 with the workflow error payload.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, fixture_dir=FIXTURES_DIR, latency=None,
+                 failure_rate=0.0, failure_status=DEFAULT_FAILURE_STATUS, error_rate=0.0,
+                 basic_fixture=DEFAULT_BASIC_FIXTURE, campaign_fixture=DEFAULT_CAMPAIGN_FIXTURE,
+                 error_fixture=DEFAULT_ERROR_FIXTURE, stream=True, seed=None, page_latency=None):
+        self.rng = random.Random(seed)
+        self.stream = stream
+        self.fixture_dir = fixture_dir
+        self.latency = latency or LatencyModel(rng=self.rng)
+        self.page_latency = page_latency or LatencyModel(rng=self.rng)
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.error_rate = error_rate
+        self.bodies = {
+            "basic": self._read(fixture_dir, basic_fixture),
+            "campaign": self._read(fixture_dir, campaign_fixture),
+            "error": self._read(fixture_dir, error_fixture),
+        }
+        self.counts = {"requests": 0, "ok": 0, "failures": 0, "errors": 0, "with_content": 0, "pages": 0}
+        self._lock = threading.Lock()
+        self._thread = None
+
+        self.httpd = ThreadingHTTPServer((host, port), _StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.stub = self
+
+    @staticmethod
+    def _read(fixture_dir, name):
+        with open(os.path.join(fixture_dir, f"{name}.json"), "rb") as f:
+            return f.read()
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/webhook/contextual-engine-test"
+
+    def article_url(self, name, query=""):
+        """URL of fixtures/<name>.html as served by this server; `query` makes distinct URLs for the same page"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/articles/{name}" + (f"?{query}" if query else "")
+
+    def read_page(self, name):
+        """HTML of an article fixture, or None"""
+        if not name.replace("_", "").replace("-", "").isalnum():
+            return None
+        try:
+            with open(os.path.join(self.fixture_dir, f"{name}.html"), "rb") as f:
+                body = f.read()
+        except OSError:
+            return None
+        with self._lock:
+            self.counts["pages"] += 1
+        return body
+
+    def stream_chunks(self, body):
+        """Split a recorded payload into NDJSON lines, one result section per line"""
+        document = json.loads(body)
+        if isinstance(document, list):
+            document = document[0] if document else {}
+        if "error" in document:
+            return [json.dumps(document).encode("utf-8") + b"\n"]
+
+        names = [name for name in STREAM_SECTION_ORDER if name in document]
+        names += [name for name in document if name not in names]
+        return [json.dumps({name: document[name]}).encode("utf-8") + b"\n" for name in names]
+
+    def choose_response(self, params):
+        """Status code and body for one request, updating the counters"""
+        with self._lock:
+            self.counts["requests"] += 1
+            if params.get("content"):
+                self.counts["with_content"] += 1
+            roll = self.rng.random()
+            if roll < self.failure_rate:
+                self.counts["failures"] += 1
+                return self.failure_status, json.dumps({"message": "Stub webhook failure"}).encode("utf-8")
+            if roll < self.failure_rate + self.error_rate:
+                self.counts["errors"] += 1
+                return 200, self.bodies["error"]
+            self.counts["ok"] += 1
+        return 200, self.bodies["campaign" if params.get("campaign_definition") else "basic"]
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counts)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="liz-stub-webhook", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without this keep-alive
+    # clients stall ~40ms per request on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path == "/__stats":
+            self._send(200, json.dumps(self.server.stub.stats()).encode("utf-8"))
+            return
+        if parsed.path.startswith("/articles/"):
+            self._page(parsed.path[len("/articles/"):])
+            return
+        self._analyze(dict(parse_qsl(parsed.query)))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            payload = {}
+        # app_new.py posts {"query": {...}}; accept flat bodies too
+        params = payload.get("query", payload) if isinstance(payload, dict) else {}
+        params.update(parse_qsl(urlparse(self.path).query))
+        self._analyze(params)
+
+    def _analyze(self, params):
+        stub = self.server.stub
+        delay = stub.latency.sample()
+        status, body = stub.choose_response(params)
+        if status == 200 and stub.stream and NDJSON_CONTENT_TYPE in self.headers.get("Accept", ""):
+            self._stream(stub.stream_chunks(body), delay)
+            return
+        time.sleep(delay)
+        self._send(status, body)
+
+    def _page(self, name):
+        stub = self.server.stub
+        time.sleep(stub.page_latency.sample())
+        body = stub.read_page(name)
+        if body is None:
+            self._send(404, b"<html><body><p>Not found</p></body></html>", "text/html; charset=utf-8")
+            return
+        self._send(200, body, "text/html; charset=utf-8")
+
+    def _stream(self, lines, delay):
+        self.send_response(200)
+        self.send_header("Content-Type", f"{NDJSON_CONTENT_TYPE}; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for line in lines:
+            time.sleep(delay / len(lines))
+            self.wfile.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send(self, status, body, content_type="application/json; charset=utf-8"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub n8n analysis webhook replaying recorded payloads")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--fixture-dir", default=FIXTURES_DIR)
+    parser.add_argument("--latency", choices=LATENCY_MODES, default="fixed")
+    parser.add_argument("--median-ms", type=float, default=0, help="fixed latency, or lognormal median")
+    parser.add_argument("--min-ms", type=float, default=0, help="uniform lower bound")
+    parser.add_argument("--max-ms", type=float, default=0, help="uniform upper bound")
+    parser.add_argument("--sigma", type=float, default=0.5, help="lognormal shape; larger means a longer tail")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of requests answered with --failure-status")
+    parser.add_argument("--failure-status", type=int, default=DEFAULT_FAILURE_STATUS)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with the workflow error shape")
+    parser.add_argument("--page-ms", type=float, default=0, help="latency of the /articles/ fixture pages")
+    parser.add_argument("--no-stream", action="store_true", help="always answer with one JSON document, even to NDJSON clients")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    server = StubWebhookServer(
+        host=args.host,
+        port=args.port,
+        fixture_dir=args.fixture_dir,
+        latency=LatencyModel(args.latency, args.median_ms, args.min_ms, args.max_ms, args.sigma, rng=rng),
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        error_rate=args.error_rate,
+        stream=not args.no_stream,
+        seed=args.seed,
+        page_latency=LatencyModel("fixed", args.page_ms),
+    )
+    print(f"Stub webhook listening on {server.url}")
+    print(f"Point the app at it with LIZ_WEBHOOK_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(json.dumps(server.stats()))
+
+
+if __name__ == "__main__":
+    main()
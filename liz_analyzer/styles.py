@@ -0,0 +1,81 @@
+## Dark theme stylesheet for the Liz dashboard
+#
+# The rules live in static/liz_theme.css. With Streamlit's static file serving
+# on (see .streamlit/config.toml) the browser fetches that file once, cached
+# under a content-hash ?v= URL, and only the small STYLE_LOADER_HTML is sent
+# on each rerun. APP_CSS is the same sheet minified for inline injection when
+# static serving is off. The font rules (FONT_CSS) depend on whether assets are
+# self-hosted and always travel with the loader.
+#
+# The older app_* pages keep their own look; their sheets live in
+# static/legacy/ and are injected inline by legacy_css().
+
+import functools
+import json
+import re
+
+from .assets import file_version, font_css, static_path, static_url
+
+
+THEME_CSS_FILE = "liz_theme.css"
+LEGACY_CSS_DIR = "legacy"
+
+
+def minify_css(css):
+    """Drop comments and collapse whitespace; enough to shrink the inline fallback"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};])\s*", r"\1", css).strip()
+
+
+with open(static_path(THEME_CSS_FILE), encoding="utf-8") as f:
+    THEME_CSS = f.read()
+
+THEME_CSS_VERSION = file_version(static_path(THEME_CSS_FILE))
+THEME_CSS_URL = static_url(THEME_CSS_FILE)
+
+FONT_CSS = font_css()
+
+APP_CSS = f"<style>{minify_css(FONT_CSS + THEME_CSS)}</style>"
+
+
+@functools.lru_cache(maxsize=None)
+def legacy_css(page):
+    """Minified <style> block for an older page's stylesheet, e.g. legacy_css("app_new")"""
+    with open(static_path(f"{LEGACY_CSS_DIR}/{page}.css"), encoding="utf-8") as f:
+        return f"<style>{minify_css(f.read())}</style>"
+
+# Streamlit serves static .css as text/plain with nosniff, which browsers refuse
+# to apply through <link>. The loader fetches the text instead and adds it to the
+# app's <head> once per page load; later reruns find it already there.
+STYLE_LOADER_HTML = """
+<script>
+(function () {
+    const doc = window.parent.document;
+    const version = %(version)s;
+    const fontCss = %(fonts)s;
+    let fonts = doc.getElementById("liz-fonts");
+    if (!fonts) {
+        fonts = doc.createElement("style");
+        fonts.id = "liz-fonts";
+        doc.head.appendChild(fonts);
+    }
+    if (fonts.textContent !== fontCss) fonts.textContent = fontCss;
+    let style = doc.getElementById("liz-theme");
+    if (style && style.dataset.version === version) return;
+    if (!style) {
+        style = doc.createElement("style");
+        style.id = "liz-theme";
+        doc.head.appendChild(style);
+    }
+    style.dataset.version = version;
+    fetch(new URL(%(url)s, doc.baseURI))
+        .then((response) => response.ok ? response.text() : Promise.reject(response.status))
+        .then((css) => { style.textContent = css; })
+        .catch((error) => {
+            style.remove();
+            console.warn("Liz theme stylesheet failed to load", error);
+        });
+})();
+</script>
+""" % {"version": json.dumps(THEME_CSS_VERSION), "url": json.dumps(THEME_CSS_URL), "fonts": json.dumps(FONT_CSS)}
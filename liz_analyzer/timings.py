@@ -0,0 +1,50 @@
+## Rolling per-stage latency figures for the analysis pipeline
+
+import statistics
+import threading
+from collections import deque
+
+
+DEFAULT_WINDOW = 200
+
+
+class StageTimings:
+    """Durations of the most recent `window` runs of each named stage.
+
+    The engine records e.g. "fetch", "extract" and "webhook" so the split of
+    end-to-end latency between page fetching and model time can be read from
+    summary().
+    """
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.window = window
+        self._samples = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, seconds):
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+            samples.append(seconds)
+            self._counts[stage] = self._counts.get(stage, 0) + 1
+
+    def summary(self):
+        """{stage: {count, mean_ms, p50_ms, p95_ms, share}}; `share` is the stage's part of the summed means"""
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self._samples.items()}
+            counts = dict(self._counts)
+
+        means = {stage: statistics.fmean(values) for stage, values in samples.items()}
+        total = sum(means.values())
+        return {
+            stage: {
+                'count': counts[stage],
+                'mean_ms': round(means[stage] * 1000, 1),
+                'p50_ms': round(statistics.median(values) * 1000, 1),
+                'p95_ms': round(values[min(len(values) - 1, int(len(values) * 0.95))] * 1000, 1),
+                'share': round(means[stage] / total, 3) if total else 0.0,
+            }
+            for stage, values in samples.items()
+        }
@@ -0,0 +1,64 @@
+## Streamlit helpers shared by the app pages
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from .assets import poster_url, waiting_video_sources
+from .styles import APP_CSS, STYLE_LOADER_HTML, legacy_css
+
+
+# Function to display error messages with styling
+def display_error(error_type, message, suggestions=None, technical_details=None):
+    icon = "⚠️"
+    color = "#CD574C"
+
+    error_html = f"""
+    <div style="margin-top: 1.5rem; color: {color};">
+        <h4 style="color: {color}; font-family: Inter; margin-bottom: 0.5rem;">{icon} {message}</h4>
+    """
+    if suggestions:
+        error_html += "<ul style='text-align: left; color: #D1D5DB; line-height: 1.6;'>"
+        for s in suggestions:
+            error_html += f"<li>{s}</li>"
+        error_html += "</ul>"
+    if technical_details:
+        error_html += f"""
+        <details style="margin-top: 1rem; text-align: left;">
+            <summary style="color: #9CA3AF; cursor: pointer; font-size: 0.9rem;">Technical Details</summary>
+            <div style="margin-top: 0.5rem; padding: 1rem; background: #272b39bf; border-radius: 8px; font-family: monospace; font-size: 0.8rem; color: #9CA3AF;">
+                {technical_details}
+            </div>
+        </details>
+        """
+    error_html += "</div>"
+
+    st.markdown(error_html, unsafe_allow_html=True)
+
+def inject_app_styles():
+    """Load the dashboard theme: a cached static stylesheet when static serving is on, inline otherwise"""
+    if st.get_option("server.enableStaticServing"):
+        components.html(STYLE_LOADER_HTML, height=0)
+    else:
+        st.markdown(APP_CSS, unsafe_allow_html=True)
+
+def inject_legacy_styles(page):
+    """Inline stylesheet of one of the older app_* pages (see static/legacy/)"""
+    st.markdown(legacy_css(page), unsafe_allow_html=True)
+
+
+def waiting_background_html():
+    """Looping background video for the waiting state, with the poster shown until it plays.
+
+    A self-hosted video comes first with the remote one as a second <source>,
+    so a browser that rejects the local copy plays the remote video instead.
+    """
+    static_serving = st.get_option("server.enableStaticServing")
+    poster = poster_url() if static_serving else None
+    poster_attr = f' poster="{poster}"' if poster else ""
+    sources = "".join(
+        f'\n                <source src="{url}" type="video/webm">' for url in waiting_video_sources(static_serving)
+    )
+    return f"""
+            <video loop autoplay muted class="video__bg"{poster_attr}>{sources}
+                Your browser does not support the video tag.
+            </video>"""
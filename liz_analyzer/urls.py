@@ -0,0 +1,115 @@
+## Article URL validation and canonicalization
+#
+# Every spelling of the same article should reach the cache and the webhook as
+# one URL, so validation also canonicalizes: the scheme and host are lowercased
+# (internationalized hosts go to their punycode form), default ports, fragments,
+# tracking parameters and trailing slashes are dropped, non-ASCII paths are
+# percent-encoded and the remaining query parameters are sorted. All patterns
+# are compiled once at import.
+
+import ipaddress
+import re
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+
+INVALID_URL_MESSAGE = "Please enter a valid URL (e.g., https://example.com/article)"
+EMPTY_URL_MESSAGE = "Please enter a URL"
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Click and campaign identifiers that never change which article is served
+TRACKING_PARAM_PREFIXES = ("utm_", "pk_", "mtm_")
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "gclsrc", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "twclid", "igshid",
+    "li_fat_id", "mc_cid", "mc_eid", "_ga", "_gl", "_hsenc", "_hsmi", "mkt_tok", "ref_src", "s_cid",
+    "vero_id", "oly_anon_id", "oly_enc_id", "wickedid",
+})
+
+_SCHEME_PATTERN = re.compile(r"^[a-z][a-z0-9+.-]*://", re.IGNORECASE)
+_WHITESPACE_PATTERN = re.compile(r"\s")
+_PERCENT_ESCAPE_PATTERN = re.compile(r"%[0-9a-f]{2}", re.IGNORECASE)
+# Characters left as they are when percent-encoding a path (existing escapes included)
+_PATH_SAFE = "/%:@!$&'()*+,;=~"
+# ASCII (post-IDNA) host names; TLDs up to the 63-character label limit, punycode TLDs included
+_HOST_PATTERN = re.compile(
+    r"(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+"
+    r"(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})\Z"
+)
+
+
+def _canonical_host(host):
+    """Lowercase ASCII host, or None if it is not a valid domain, localhost or IP address"""
+    host = host.rstrip(".")
+    if not host.isascii():
+        try:
+            host = host.encode("idna").decode("ascii")
+        except UnicodeError:
+            return None
+    host = host.lower()
+    if host == "localhost" or _HOST_PATTERN.match(host):
+        return host
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return None
+    return f"[{address.compressed}]" if address.version == 6 else address.compressed
+
+
+def _is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def canonicalize_url(url):
+    """Canonical form of an article URL, or None if it is not a valid http(s) URL.
+
+    A missing scheme defaults to https.
+    """
+    if not url:
+        return None
+    url = url.strip()
+    if not url or _WHITESPACE_PATTERN.search(url):
+        return None
+    if not _SCHEME_PATTERN.match(url):
+        url = "https://" + url
+
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or parts.username is not None or not parts.hostname:
+        return None
+
+    host = _canonical_host(parts.hostname)
+    if host is None:
+        return None
+    if port is not None and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    path = parts.path.rstrip("/") or "/"
+    if not path.isascii():
+        path = quote(path, safe=_PATH_SAFE)
+    if "%" in path:
+        path = _PERCENT_ESCAPE_PATTERN.sub(lambda m: m.group(0).upper(), path)
+
+    query = parts.query
+    if query:
+        params = [(name, value) for name, value in parse_qsl(query, keep_blank_values=True)
+                  if not _is_tracking_param(name)]
+        query = urlencode(sorted(params))
+
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+# Function to validate URL format
+def is_valid_url(url):
+    """Validate URL format before sending to API; valid URLs come back canonicalized"""
+    if not url or not url.strip():
+        return False, EMPTY_URL_MESSAGE
+
+    canonical = canonicalize_url(url)
+    if canonical is None:
+        return False, INVALID_URL_MESSAGE
+    return True, canonical
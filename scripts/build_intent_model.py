@@ -0,0 +1,166 @@
+## Train the local intent classifier (liz_analyzer/intent_model.py)
+#
+#     python scripts/build_intent_model.py
+#     python scripts/build_intent_model.py labelled.jsonl more.jsonl --bits 14 --holdout 0.2
+#     python scripts/build_intent_model.py --folds 5
+#
+# Each input line is a JSON object with the article "text" (and optionally
+# its "title") labelled either with an "intent" name or with the workflow's
+# "intentionality_breakdown" percentages, so results exported from past
+# analyses can be used directly. Trains a softmax regression on the same
+# hashed features the classifier computes and writes the float32 weight file.
+# The bundled model is trained on scripts/data/intent_seed.jsonl, a small
+# hand-labelled seed set; train on real labelled articles for production use.
+# scripts/evaluate_intent_model.py scores a trained model on examples it has
+# never seen (scripts/data/intent_holdout.jsonl by default).
+# --folds reports cross-validated precision and coverage at several
+# confidence thresholds, the figures LIZ_CASCADE_THRESHOLD should be set from.
+
+import argparse
+import json
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from liz_analyzer.intent_model import (  # noqa: E402
+    DEFAULT_FEATURE_BITS, INTENT_TYPES, MODEL_PATH, IntentModel, hashed_features
+)
+
+
+# Top-intent probabilities cross-validation reports precision at
+REPORT_THRESHOLDS = (0.5, 0.6, 0.7, 0.8, 0.9)
+
+SEED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "intent_seed.jsonl")
+# Share of a single "intent" label's probability spread over the other intents;
+# articles are rarely purely one intent and the workflow never says they are
+LABEL_SMOOTHING = 0.2
+
+
+def read_examples(paths):
+    examples = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                target = example_target(record)
+                if target is None:
+                    raise SystemExit(f"{path}:{number}: needs an 'intent' or 'intentionality_breakdown'")
+                examples.append((record.get("text", ""), record.get("title", ""), target))
+    return examples
+
+
+def example_target(record):
+    breakdown = record.get("intentionality_breakdown")
+    if isinstance(breakdown, dict):
+        values = np.array([float(breakdown.get(intent, 0)) for intent in INTENT_TYPES])
+        return values / values.sum() if values.sum() > 0 else None
+    intent = str(record.get("intent", "")).lower()
+    if intent not in INTENT_TYPES:
+        return None
+    target = np.full(len(INTENT_TYPES), LABEL_SMOOTHING / (len(INTENT_TYPES) - 1))
+    target[INTENT_TYPES.index(intent)] = 1 - LABEL_SMOOTHING
+    return target
+
+
+def feature_matrix(examples, bits):
+    matrix = np.zeros((len(examples), 1 << bits), dtype=np.float32)
+    for row, (text, title, _) in enumerate(examples):
+        for bucket, value in hashed_features(text, bits, title).items():
+            matrix[row, bucket] = value
+    return matrix
+
+
+def softmax(logits):
+    logits = logits - logits.max(axis=1, keepdims=True)
+    exps = np.exp(logits)
+    return exps / exps.sum(axis=1, keepdims=True)
+
+
+def train(features, targets, epochs, learning_rate, l2):
+    """Full-batch gradient descent on soft-target cross-entropy"""
+    weights = np.zeros((features.shape[1], targets.shape[1]))
+    bias = np.zeros(targets.shape[1])
+    for _ in range(epochs):
+        error = softmax(features @ weights + bias) - targets
+        weights -= learning_rate * (features.T @ error / len(features) + l2 * weights)
+        bias -= learning_rate * error.mean(axis=0)
+    return weights, bias
+
+
+def accuracy(features, targets, weights, bias):
+    if not len(features):
+        return float("nan")
+    predicted = (features @ weights + bias).argmax(axis=1)
+    return float((predicted == targets.argmax(axis=1)).mean())
+
+
+def cross_validate(examples, folds, args):
+    """report() on predictions for each example from a model trained on the other folds"""
+    probabilities = []
+    labels = []
+    for fold in range(folds):
+        train_examples = [example for i, example in enumerate(examples) if i % folds != fold]
+        test_examples = examples[fold::folds]
+        weights, bias = train(
+            feature_matrix(train_examples, args.bits), np.array([target for _, _, target in train_examples]),
+            args.epochs, args.learning_rate, args.l2
+        )
+        probabilities.append(softmax(feature_matrix(test_examples, args.bits) @ weights + bias))
+        labels.extend(target.argmax() for _, _, target in test_examples)
+    report(f"{folds}-fold cross-validation over {len(examples)} examples", np.vstack(probabilities), np.array(labels))
+
+
+def report(heading, probabilities, labels):
+    """Print accuracy, and precision and coverage of the predictions at each REPORT_THRESHOLDS"""
+    top = probabilities.max(axis=1)
+    correct = probabilities.argmax(axis=1) == labels
+    print(f"{heading}: accuracy {correct.mean():.1%}")
+    print(f"{'threshold':>9} {'coverage':>9} {'precision':>10} {'examples':>9}")
+    for threshold in REPORT_THRESHOLDS:
+        kept = top >= threshold
+        precision = f"{correct[kept].mean():.1%}" if kept.any() else "-"
+        print(f"{threshold:9.2f} {kept.mean():9.1%} {precision:>10} {int(kept.sum()):9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the local intent classifier")
+    parser.add_argument("paths", nargs="*", default=[SEED_PATH], help="labelled JSONL files")
+    parser.add_argument("--bits", type=int, default=DEFAULT_FEATURE_BITS, help="hashed feature space is 2**bits")
+    parser.add_argument("--epochs", type=int, default=400)
+    parser.add_argument("--learning-rate", type=float, default=20.0)
+    parser.add_argument("--l2", type=float, default=1e-4)
+    parser.add_argument("--holdout", type=float, default=0.0, help="share of examples kept out to report accuracy on")
+    parser.add_argument("--folds", type=int, default=0, help="report k-fold cross-validated precision by threshold")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default=MODEL_PATH)
+    args = parser.parse_args()
+
+    examples = read_examples(args.paths)
+    random.Random(args.seed).shuffle(examples)
+    if args.folds > 1:
+        cross_validate(examples, args.folds, args)
+    held = int(len(examples) * args.holdout)
+    train_examples, test_examples = examples[held:], examples[:held]
+
+    features = feature_matrix(train_examples, args.bits)
+    targets = np.array([target for _, _, target in train_examples])
+    weights, bias = train(features, targets, args.epochs, args.learning_rate, args.l2)
+    print(f"{len(train_examples)} training examples, accuracy {accuracy(features, targets, weights, bias):.1%}")
+    if test_examples:
+        test_features = feature_matrix(test_examples, args.bits)
+        test_targets = np.array([target for _, _, target in test_examples])
+        print(f"{len(test_examples)} held-out examples, accuracy {accuracy(test_features, test_targets, weights, bias):.1%}")
+
+    flat = np.vstack([weights, bias]).astype(np.float32).ravel()
+    IntentModel(flat.tolist(), args.bits).save(args.output)
+    print(f"{args.output}: {args.bits} feature bits, {os.path.getsize(args.output) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
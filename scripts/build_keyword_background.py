@@ -0,0 +1,113 @@
+## Build the background word-frequency table used by local keyword extraction
+#
+#     python scripts/build_keyword_background.py ~/corpus/articles/ --min-df 3
+#     python scripts/build_keyword_background.py --ranks scripts/data/common_words.txt --documents 100000
+#
+# From a corpus: every .txt, .html or .htm file under the given paths is one
+# document (HTML goes through the same main-content extraction as live pages)
+# and each word's document frequency is counted. Build it from articles like
+# the ones you analyze; the more documents the better the weighting.
+#
+# From a rank list: a file of whitespace-separated words, most frequent first,
+# gets document frequencies estimated from rank (df/N = 40 / (rank + 40)). This
+# is how the bundled seed table was made, from scripts/data/common_words.txt, a
+# list of general-purpose English words (no topical vocabulary, which is what
+# keywords should be made of). Its frequencies are estimates, not counts.
+
+import argparse
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from liz_analyzer.extract import extract_main_text  # noqa: E402
+from liz_analyzer.keywords import BACKGROUND_PATH, document_terms  # noqa: E402
+
+
+DOCUMENT_EXTENSIONS = (".txt", ".html", ".htm")
+# Estimated share of documents containing the word at `rank` (1-based) in a rank list
+RANK_SCALE = 40
+
+
+def iter_documents(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.lower().endswith(DOCUMENT_EXTENSIONS):
+                        yield os.path.join(directory, name)
+        else:
+            yield path
+
+
+def read_document(path):
+    with open(path, encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    if path.lower().endswith((".html", ".htm")):
+        title, text, _ = extract_main_text(text, max_tokens=1_000_000)
+        text = f"{title}\n{text}"
+    return text
+
+
+def frequencies_from_corpus(paths):
+    frequencies = Counter()
+    documents = 0
+    for path in iter_documents(paths):
+        frequencies.update(document_terms(read_document(path)))
+        documents += 1
+    return documents, frequencies
+
+
+def frequencies_from_ranks(path, documents):
+    frequencies = {}
+    with open(path, encoding="utf-8") as f:
+        words = [word for line in f if not line.startswith("#") for word in line.lower().split()]
+    for word in words:
+        # Stopwords and plural forms of listed words are skipped; the first (most frequent) form wins
+        for term in document_terms(word):
+            if term not in frequencies:
+                frequencies[term] = max(1, round(documents * RANK_SCALE / (len(frequencies) + 1 + RANK_SCALE)))
+    return documents, frequencies
+
+
+def write_table(path, documents, frequencies, source, min_df, max_terms):
+    terms = sorted(((term, df) for term, df in frequencies.items() if df >= min_df), key=lambda item: (-item[1], item[0]))
+    if max_terms:
+        terms = terms[:max_terms]
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# Background document frequencies for liz_analyzer/keywords.py (term<TAB>df)\n")
+        f.write(f"# source {source}\n")
+        f.write(f"# documents {documents}\n")
+        for term, df in terms:
+            f.write(f"{term}\t{df}\n")
+    print(f"{path}: {len(terms)} terms from {documents} documents")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the keyword background frequency table")
+    parser.add_argument("paths", nargs="*", help="corpus files or directories (.txt/.html/.htm)")
+    parser.add_argument("--ranks", help="rank-ordered word list to estimate frequencies from instead of a corpus")
+    parser.add_argument("--documents", type=int, default=100_000, help="nominal corpus size for --ranks")
+    parser.add_argument("--min-df", type=int, default=2, help="drop words found in fewer documents")
+    parser.add_argument("--max-terms", type=int, default=50_000)
+    parser.add_argument("--output", default=BACKGROUND_PATH)
+    args = parser.parse_args()
+
+    if args.ranks:
+        documents, frequencies = frequencies_from_ranks(args.ranks, args.documents)
+        source = f"rank-estimated ({os.path.basename(args.ranks)}, df/N = {RANK_SCALE} / (rank + {RANK_SCALE}))"
+    elif args.paths:
+        documents, frequencies = frequencies_from_corpus(args.paths)
+        source = "corpus"
+    else:
+        parser.error("give corpus paths or --ranks")
+    if not frequencies:
+        raise SystemExit("No words found")
+
+    write_table(args.output, documents, frequencies, source, args.min_df, args.max_terms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+## Score a trained intent model on held-out labelled examples
+#
+#     python scripts/evaluate_intent_model.py
+#     python scripts/evaluate_intent_model.py labelled.jsonl --model liz_analyzer/data/intent_model.f32
+#
+# Input lines are the same as for build_intent_model.py. The default set,
+# scripts/data/intent_holdout.jsonl, is hand-labelled like the seed set but
+# never trained on, so its figures are what the bundled model does on text it
+# has not seen; keep it out of training when retraining. Prints accuracy,
+# precision and coverage by confidence threshold, and a confusion matrix.
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from build_intent_model import read_examples, report  # noqa: E402
+from liz_analyzer.intent_model import INTENT_TYPES, MODEL_PATH, IntentModel  # noqa: E402
+
+
+HOLDOUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "intent_holdout.jsonl")
+
+
+def print_confusion(probabilities, labels):
+    predicted = probabilities.argmax(axis=1)
+    width = max(len(intent) for intent in INTENT_TYPES)
+    print(f"{'labelled':<{width}} " + " ".join(f"{intent[:5]:>6}" for intent in INTENT_TYPES) + "  recall")
+    for row, intent in enumerate(INTENT_TYPES):
+        counts = [int(((labels == row) & (predicted == column)).sum()) for column in range(len(INTENT_TYPES))]
+        total = sum(counts)
+        recall = f"{counts[row] / total:.0%}" if total else "-"
+        print(f"{intent:<{width}} " + " ".join(f"{count:6}" for count in counts) + f"  {recall:>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the local intent classifier on held-out examples")
+    parser.add_argument("paths", nargs="*", default=[HOLDOUT_PATH], help="labelled JSONL files")
+    parser.add_argument("--model", default=MODEL_PATH)
+    args = parser.parse_args()
+
+    model = IntentModel.load(args.model)
+    examples = read_examples(args.paths)
+    probabilities = np.array([model.probabilities(text, title) for text, title, _ in examples])
+    labels = np.array([target.argmax() for _, _, target in examples])
+    report(f"{len(examples)} held-out examples", probabilities, labels)
+    print()
+    print_confusion(probabilities, labels)
+
+
+if __name__ == "__main__":
+    main()
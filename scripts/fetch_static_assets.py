@@ -0,0 +1,89 @@
+## Download the waiting-state video and the Inter web font into ./static for self-hosting
+#
+#     python scripts/fetch_static_assets.py
+#     LIZ_SELF_HOSTED_ASSETS=1 streamlit run app.py
+#
+# Run it wherever there is network access (e.g. while building the image for an
+# air-gapped deployment). Fonts are saved as woff2 files plus static/fonts/inter.css,
+# whose @font-face rules point at the local copies.
+
+import argparse
+import os
+import re
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from liz_analyzer.assets import (  # noqa: E402
+    FONT_CSS_FILE, FONT_DIR, REMOTE_FONT_CSS_URL, REMOTE_VIDEO_URL, VIDEO_FILE, static_path, static_url
+)
+
+
+# Google Fonts only serves woff2 to browsers it recognises
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+DEFAULT_SUBSETS = ("latin", "latin-ext")
+
+FONT_FACE_RE = re.compile(r"/\*\s*([\w-]+)\s*\*/\s*(@font-face\s*\{[^}]*\})")
+FONT_URL_RE = re.compile(r"url\(([^)]+)\)")
+
+
+def download(session, url, name):
+    path = static_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with session.get(url, stream=True, timeout=60) as response:
+        response.raise_for_status()
+        with open(path, "wb") as f:
+            for block in response.iter_content(1 << 16):
+                f.write(block)
+    print(f"{name}: {os.path.getsize(path) / 1024:.0f} KiB")
+
+
+def self_host_fonts(session, css, subsets):
+    """Download the font files the Google Fonts stylesheet uses and return it rewritten to point at them"""
+    faces = []
+    local_names = {}
+    for subset, face in FONT_FACE_RE.findall(css):
+        if subset not in subsets:
+            continue
+        remote = FONT_URL_RE.search(face).group(1).strip("'\"")
+        if remote not in local_names:
+            # Inter is a variable font: every weight of a subset shares one file
+            local_names[remote] = f"{FONT_DIR}/inter-{subset}-{len(local_names)}.woff2"
+            download(session, remote, local_names[remote])
+        local = static_url(local_names[remote])
+        faces.append(f"/* {subset} */\n{FONT_URL_RE.sub(f'url({local})', face, count=1)}")
+    if not faces:
+        raise SystemExit(f"No @font-face rules for subsets {', '.join(subsets)} in {REMOTE_FONT_CSS_URL}")
+    return "\n".join(faces) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch the landing video and fonts for LIZ_SELF_HOSTED_ASSETS")
+    parser.add_argument("--subsets", default=",".join(DEFAULT_SUBSETS), help="comma separated font subsets to keep")
+    parser.add_argument("--skip-video", action="store_true")
+    parser.add_argument("--skip-fonts", action="store_true")
+    args = parser.parse_args()
+
+    session = requests.Session()
+    session.headers["User-Agent"] = BROWSER_USER_AGENT
+
+    if not args.skip_video:
+        download(session, REMOTE_VIDEO_URL, VIDEO_FILE)
+
+    if not args.skip_fonts:
+        response = session.get(REMOTE_FONT_CSS_URL, timeout=30)
+        response.raise_for_status()
+        subsets = [subset.strip() for subset in args.subsets.split(",") if subset.strip()]
+        font_css = self_host_fonts(session, response.text, subsets)
+        with open(static_path(FONT_CSS_FILE), "w", encoding="utf-8") as f:
+            f.write(font_css)
+        print(f"{FONT_CSS_FILE}: {len(font_css)} bytes")
+
+
+if __name__ == "__main__":
+    main()
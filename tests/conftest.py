@@ -0,0 +1,23 @@
+## Shared test fixtures
+
+import pytest
+
+
+class Clock:
+    """Stands in for the time module of the module under test; advance it by changing `now`"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """fake_clock(module) replaces `module.time` with a Clock and returns it"""
+    def install(module, now=1000.0):
+        clock = Clock(now)
+        monkeypatch.setattr(module, "time", clock)
+        return clock
+    return install
@@ -0,0 +1,89 @@
+## JSON API request handling against an in-process stub webhook
+
+import asyncio
+import json
+
+import pytest
+
+from liz_analyzer.api import AnalysisAPI
+from liz_analyzer.async_client import AsyncWebhookClient
+from liz_analyzer.cache import AnalysisCache
+from liz_analyzer.stub_server import StubWebhookServer
+
+
+@pytest.fixture(scope="module")
+def webhook():
+    server = StubWebhookServer(seed=1, stream=False).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def api(webhook):
+    return AnalysisAPI(client=AsyncWebhookClient(webhook_url=webhook.url), cache=AnalysisCache(":memory:"))
+
+
+def request(api, method, path, body=None, query=b""):
+    """(status, JSON document) for one request through the ASGI app"""
+    messages = []
+    payload = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8") if body is not None else b""
+
+    async def receive():
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    async def run():
+        await api({"type": "http", "method": method, "path": path, "query_string": query}, receive, send)
+        await api.client.aclose()
+
+    asyncio.run(run())
+    return messages[0]["status"], json.loads(messages[1]["body"])
+
+
+def test_post_analyzes_a_url(api):
+    status, document = request(api, "POST", "/analyze", {"url": "example.com/story", "vertical": None})
+    assert status == 200
+    assert document["url"] == "https://example.com/story"
+    assert document["scores"]["score_type"] == "action_only"
+
+
+def test_get_analyzes_a_url(api):
+    status, document = request(api, "GET", "/analyze", query=b"url=https%3A%2F%2Fexample.com%2Fstory")
+    assert status == 200
+    assert document["tier1_category"]
+
+
+@pytest.mark.parametrize("body, field", [
+    ({"url": 123}, "url"),
+    ({"url": ["https://example.com/story"]}, "url"),
+    ({"url": "https://example.com/story", "campaign_definition": ["x"]}, "campaign_definition"),
+    ({"url": "https://example.com/story", "campaign_definition": "spring sale", "vertical": {"name": "retail"}},
+     "vertical"),
+    ({"url": True}, "url"),
+])
+def test_non_string_fields_are_rejected(api, body, field):
+    status, document = request(api, "POST", "/analyze", body)
+    assert status == 400
+    assert document["error_type"] == "invalid_request"
+    assert field in document["message"]
+
+
+@pytest.mark.parametrize("body", [b"not json", b"[1, 2]"])
+def test_malformed_bodies_are_rejected(api, body):
+    status, document = request(api, "POST", "/analyze", body)
+    assert status == 400
+    assert document["error_type"] == "invalid_request"
+
+
+def test_invalid_url_is_a_client_error(api):
+    status, document = request(api, "POST", "/analyze", {"url": "not a url"})
+    assert status == 400
+    assert document["error_type"] == "invalid_url"
+
+
+def test_unknown_path_and_method(api):
+    assert request(api, "GET", "/nope")[0] == 404
+    assert request(api, "DELETE", "/analyze")[0] == 405
+    assert request(api, "GET", "/healthz") == (200, {"status": "ok"})
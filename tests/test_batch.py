@@ -0,0 +1,92 @@
+## Batch URL parsing and per-host scheduling
+
+import io
+import threading
+import time
+
+from liz_analyzer.batch import HostScheduler, parse_url_list, run_batch
+
+
+def test_parse_url_list_splits_pasted_text_on_whitespace():
+    text = "https://a.com/1\n  https://b.com/2\thttps://c.com/3\n\n"
+    assert parse_url_list(text) == ["https://a.com/1", "https://b.com/2", "https://c.com/3"]
+
+
+def test_parse_url_list_drops_spellings_of_the_same_article():
+    text = "\n".join([
+        "https://a.com/story?id=1",
+        "https://A.com/story/?id=1&utm_source=x",
+        "a.com/story?id=1#comments",
+        "https://a.com/other",
+    ])
+    assert parse_url_list(text) == ["https://a.com/story?id=1", "https://a.com/other"]
+
+
+def test_parse_url_list_keeps_invalid_entries_once():
+    assert parse_url_list("not-a-url not-a-url https://a.com/1") == ["not-a-url", "https://a.com/1"]
+
+
+def test_parse_url_list_reads_the_url_column_of_a_csv():
+    csv_file = io.BytesIO("\ufefftitle,URL\nFirst,https://a.com/1\nSecond, https://b.com/2 \nEmpty,\n".encode("utf-8"))
+    assert parse_url_list(csv_file=csv_file) == ["https://a.com/1", "https://b.com/2"]
+
+
+def test_parse_url_list_reads_the_first_column_of_a_headerless_csv():
+    csv_text = "https://a.com/1,first\nhttps://b.com/2,second\n"
+    assert parse_url_list(csv_file=csv_text) == ["https://a.com/1", "https://b.com/2"]
+
+
+def test_parse_url_list_skips_a_header_row_without_a_url_column():
+    assert parse_url_list(csv_file="link\nhttps://a.com/1\n") == ["https://a.com/1"]
+
+
+def test_parse_url_list_combines_text_and_csv_and_applies_the_limit():
+    urls = parse_url_list("https://a.com/1 https://a.com/2", csv_file="url\nhttps://a.com/1\nhttps://a.com/3\n", limit=3)
+    assert urls == ["https://a.com/1", "https://a.com/2", "https://a.com/3"]
+    assert parse_url_list(" ".join(f"https://a.com/{i}" for i in range(10)), limit=4) == [
+        f"https://a.com/{i}" for i in range(4)
+    ]
+
+
+def test_parse_url_list_empty_input():
+    assert parse_url_list() == []
+    assert parse_url_list("   \n", csv_file="") == []
+
+
+def test_host_scheduler_round_robins_hosts_within_the_limit():
+    urls = ["https://a.com/1", "https://a.com/2", "https://a.com/3", "https://b.com/1", "c.com/1"]
+    scheduler = HostScheduler(urls, per_host_limit=1)
+    started = [scheduler.next_ready() for _ in range(3)]
+    assert [url for _, url in started] == ["https://a.com/1", "https://b.com/1", "c.com/1"]
+    assert scheduler.next_ready() is None
+
+    scheduler.release("https://a.com/1")
+    assert scheduler.next_ready() == (1, "https://a.com/2")
+    assert scheduler.next_ready() is None
+
+
+def test_run_batch_caps_calls_per_host_and_reports_every_url():
+    urls = [f"https://big.com/{i}" for i in range(12)] + [f"https://host{i}.com/" for i in range(6)]
+    lock = threading.Lock()
+    running = {}
+    peak = {}
+
+    def analyze(url):
+        host = url.split("/")[2]
+        with lock:
+            running[host] = running.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), running[host])
+        time.sleep(0.01)
+        with lock:
+            running[host] -= 1
+        if url.endswith("/3"):
+            raise ValueError("boom")
+        return url.upper()
+
+    outcomes = list(run_batch(urls, analyze, max_workers=6, per_host_limit=2))
+
+    assert sorted(outcome.index for outcome in outcomes) == list(range(len(urls)))
+    assert max(peak.values()) <= 2
+    failed = [outcome for outcome in outcomes if outcome.error is not None]
+    assert [outcome.url for outcome in failed] == ["https://big.com/3"]
+    assert all(outcome.result == outcome.url.upper() for outcome in outcomes if outcome.error is None)
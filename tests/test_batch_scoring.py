@@ -0,0 +1,105 @@
+## Vectorized batch scoring must match the scalar scorers exactly
+
+import math
+import random
+
+import pytest
+
+from liz_analyzer import scoring
+from liz_analyzer.batch_scoring import ScoreColumns, intentionality_scores, score_columns, score_results
+from liz_analyzer.models import AnalysisResult
+
+
+INTENT_KEYS = ['transactional', 'commercial', 'navigational', 'informational', 'Commercial', 'other']
+CONFIDENCES = ['high', 'medium', 'low', 'High', 'unknown', None]
+
+
+def random_result(rng):
+    """Synthetic result covering the edge cases the scalar scorers special-case"""
+    keys = rng.sample(INTENT_KEYS[:4], rng.randint(0, 4))
+    if rng.random() < 0.1:
+        keys.append(rng.choice(INTENT_KEYS[4:]))
+    breakdown = {key: rng.choice([0, rng.randint(0, 100), round(rng.uniform(0, 100), 1)]) for key in keys}
+
+    result = {
+        'intentionality_breakdown': breakdown,
+        'primary_keywords': ['kw'] * rng.randint(0, 8),
+        'secondary_keywords': ['kw'] * rng.randint(0, 8),
+        'tier2_categories': ['cat'] * rng.randint(0, 4),
+        'audience_profile': {
+            'type': ['t'] * rng.randint(0, 5),
+            'interest_groups': ['g'] * rng.randint(0, 6),
+        },
+        'intention': {'primary': 'informational'},
+    }
+    confidence = rng.choice(CONFIDENCES)
+    if confidence is not None:
+        result['intention']['confidence'] = confidence
+    if rng.random() < 0.7:
+        result['campaign_relevancy'] = {'overall_relevancy_score': rng.randint(0, 100)} if rng.random() < 0.9 else {}
+    return AnalysisResult.from_dict(result)
+
+
+def edge_case_results():
+    """Hand-picked payloads at the scorers' boundaries"""
+    documents = [
+        {'intentionality_breakdown': {}},
+        {'intentionality_breakdown': {'transactional': 0, 'commercial': 0}},
+        {'intentionality_breakdown': {'Transactional': 100, 'other': 50}, 'intention': {'confidence': 'high'}},
+        {'intentionality_breakdown': {'transactional': 100, 'commercial': 100}, 'intention': {'confidence': 'high'}},
+        {'intentionality_breakdown': {'informational': 12.5}, 'intention': {'confidence': 'unknown'}},
+        {'intentionality_breakdown': {}, 'campaign_relevancy': {}},
+        {'intentionality_breakdown': {'commercial': 40}, 'campaign_relevancy': {'overall_relevancy_score': 0}},
+        {'campaign_relevancy': {'overall_relevancy_score': 100}, 'intentionality_breakdown': {'transactional': 100}},
+        {
+            'primary_keywords': ['kw'] * 20, 'secondary_keywords': ['kw'] * 20, 'tier2_categories': ['c'] * 10,
+            'audience_profile': {'type': ['t'] * 10, 'interest_groups': ['g'] * 10},
+            'intention': {'confidence': 'high'}, 'intentionality_breakdown': {'navigational': 30},
+        },
+    ]
+    return [AnalysisResult.from_dict(dict({'intention': {'primary': 'informational'}}, **document)) for document in documents]
+
+
+def assert_matches_scalar(results, campaign_enabled, vectorized):
+    for i, result in enumerate(results):
+        expected = scoring.score_result(result, campaign_enabled)
+        for field, value in expected.items():
+            actual = vectorized[field][i]
+            if value is None:
+                assert math.isnan(actual), f"row {i} {field}: expected NaN, got {actual!r}"
+            else:
+                assert actual == value, f"row {i} {field}: scalar={value!r} vectorized={actual!r}"
+
+
+@pytest.mark.parametrize("campaign_enabled", [False, True])
+def test_random_results_match_score_result(campaign_enabled):
+    rng = random.Random(7)
+    results = [random_result(rng) for _ in range(2000)]
+    vectorized = score_columns(ScoreColumns.from_results(results, campaign_enabled))
+    assert_matches_scalar(results, campaign_enabled, vectorized)
+
+
+@pytest.mark.parametrize("campaign_enabled", [False, True])
+def test_edge_cases_match_score_result(campaign_enabled):
+    results = edge_case_results()
+    assert_matches_scalar(results, campaign_enabled, score_results(results, campaign_enabled))
+
+
+def test_intentionality_scores_match_calculate_intentionality_score():
+    rng = random.Random(11)
+    results = [random_result(rng) for _ in range(500)] + edge_case_results()
+    scores = intentionality_scores(ScoreColumns.from_results(results))
+    assert list(scores) == [scoring.calculate_intentionality_score(result) for result in results]
+
+
+def test_content_and_accuracy_match_scalar_scorers():
+    rng = random.Random(13)
+    results = [random_result(rng) for _ in range(500)] + edge_case_results()
+    vectorized = score_results(results)
+    assert list(vectorized['content_score']) == [scoring.calculate_content_score(r) for r in results]
+    assert list(vectorized['intent_accuracy']) == [scoring.calculate_intent_accuracy(r) for r in results]
+
+
+def test_empty_batch():
+    vectorized = score_results([])
+    assert all(len(values) == 0 for values in vectorized.values())
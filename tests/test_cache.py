@@ -0,0 +1,120 @@
+## AnalysisCache expiry, stale serving and LRU eviction
+
+import pytest
+
+from liz_analyzer import cache as cache_module
+from liz_analyzer.cache import AnalysisCache, make_cache_key
+
+
+@pytest.fixture
+def clock(fake_clock):
+    return fake_clock(cache_module)
+
+
+def test_get_returns_what_was_set(clock):
+    cache = AnalysisCache(":memory:")
+    cache.set("k", {"a": [1, 2]}, "https://example.com/")
+    assert cache.get("k") == {"a": [1, 2]}
+    assert cache.get("missing") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_expired_entry_is_a_miss_but_served_as_stale(clock):
+    cache = AnalysisCache(":memory:", ttl_seconds=60, stale_seconds=600)
+    cache.set("k", {"v": 1})
+
+    clock.now += 61
+    assert cache.get("k") is None
+    assert cache.stats()["expirations"] == 0
+    result, age = cache.get_stale("k")
+    assert result == {"v": 1}
+    assert age == pytest.approx(61)
+
+
+def test_entry_past_stale_window_is_gone(clock):
+    cache = AnalysisCache(":memory:", ttl_seconds=60, stale_seconds=600)
+    cache.set("k", {"v": 1})
+
+    clock.now += 661
+    assert cache.get_stale("k") is None
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_each_expired_row_is_counted_once(clock):
+    cache = AnalysisCache(":memory:", ttl_seconds=60, stale_seconds=600)
+    cache.set("purged", {"v": 1})
+    cache.set("looked_up", {"v": 2})
+
+    clock.now += 300
+    for _ in range(3):
+        assert cache.get("purged") is None
+    assert cache.stats()["expirations"] == 0
+    assert cache.stats()["misses"] == 3
+
+    clock.now += 400
+    assert cache.purge_expired() == 2
+    assert cache.get("looked_up") is None
+    assert cache.stats()["expirations"] == 2
+
+    cache.set("late", {"v": 3})
+    clock.now += 700
+    assert cache.get("late") is None
+    assert cache.get("late") is None
+    assert cache.purge_expired() == 0
+    assert cache.stats()["expirations"] == 3
+
+
+def test_zero_ttl_never_expires(clock):
+    cache = AnalysisCache(":memory:", ttl_seconds=0)
+    cache.set("k", {"v": 1})
+    clock.now += 10 ** 9
+    assert cache.get("k") == {"v": 1}
+    assert cache.purge_expired() == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = AnalysisCache(":memory:", max_entries=2)
+    cache.set("a", {"v": "a"})
+    clock.now += 1
+    cache.set("b", {"v": "b"})
+    clock.now += 1
+    assert cache.get("a") == {"v": "a"}  # "b" is now the least recently used
+    clock.now += 1
+    cache.set("c", {"v": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": "a"}
+    assert cache.get("c") == {"v": "c"}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_set_replaces_and_refreshes_an_entry(clock):
+    cache = AnalysisCache(":memory:", ttl_seconds=60)
+    cache.set("k", {"v": 1})
+    clock.now += 50
+    cache.set("k", {"v": 2})
+    clock.now += 50
+    assert cache.get("k") == {"v": 2}
+    assert cache.stats()["entries"] == 1
+
+
+def test_purge_expired_keeps_entries_inside_the_stale_window(clock):
+    cache = AnalysisCache(":memory:", ttl_seconds=60, stale_seconds=600)
+    cache.set("old", {"v": 1})
+    clock.now += 300
+    cache.set("new", {"v": 2})
+    clock.now += 400
+
+    assert cache.purge_expired() == 1
+    assert cache.get_stale("old") is None
+    assert cache.get_stale("new")[0] == {"v": 2}
+
+
+def test_cache_keys():
+    url = "https://example.com/a"
+    assert make_cache_key(url) == make_cache_key(url, "", "")
+    assert make_cache_key(url, " spring sale ", "retail ") == make_cache_key(url, "spring sale", "retail")
+    assert make_cache_key(url, "spring sale", "retail") != make_cache_key(url)
+    assert make_cache_key(url, variant="local") != make_cache_key(url)
@@ -0,0 +1,100 @@
+## Cascade routing and the categorizer it shares with the pipeline
+
+import pytest
+
+from liz_analyzer.cache import AnalysisCache
+from liz_analyzer.cascade import (
+    REASON_CAMPAIGN, REASON_CONFIDENT, REASON_FULL_REQUESTED, REASON_LOW_CONFIDENCE, REASON_NO_CONTENT, Cascade
+)
+from liz_analyzer.categories import CategoryPrediction
+from liz_analyzer.extract import ExtractedArticle
+from liz_analyzer.intent_model import IntentPrediction
+from liz_analyzer.pipeline import AnalysisPipeline
+
+
+ARTICLE = ExtractedArticle(
+    url="https://example.com/a", title="Marathon training", text="A plan for your first marathon, week by week.",
+    tokens=12, truncated=False, bytes=1000, fetch_seconds=0.01, extract_seconds=0.001,
+)
+
+
+class FixedExtractor:
+    def extract(self, url):
+        return ARTICLE
+
+
+class FixedIntentModel:
+    def __init__(self, probability):
+        self.probability = probability
+
+    def predict(self, text, title=""):
+        breakdown = {'transactional': 5, 'commercial': 5, 'navigational': 5, 'informational': 85}
+        return IntentPrediction(breakdown, "informational", "high", self.probability)
+
+
+class CountingCategorizer:
+    def __init__(self, tier1, confidence):
+        self.prediction = CategoryPrediction(tier1, (f"{tier1} News",), confidence, ((tier1, 1.0),), ())
+        self.calls = 0
+
+    def __call__(self, text, title=""):
+        self.calls += 1
+        return self.prediction
+
+
+def pipeline(categorizer, intent_probability=0.9, threshold=0.7):
+    return AnalysisPipeline(
+        AnalysisCache(":memory:"), extractor=FixedExtractor(), intent_model=FixedIntentModel(intent_probability),
+        cascade=Cascade(threshold=threshold, categorizer=categorizer),
+    )
+
+
+def test_local_answer_uses_the_categories_its_confidence_was_gated_on():
+    categorizer = CountingCategorizer("Sports", 0.8)
+    local = pipeline(categorizer).prepare("https://example.com/a")
+    assert local.reason == REASON_CONFIDENT
+    assert local.result.tier1_category == "Sports"
+    assert local.result.tier2_categories == ("Sports News",)
+    assert local.result.analysis_metadata['local_confidence'] == 0.8
+    assert categorizer.calls == 1
+
+
+def test_unsure_categorizer_escalates_and_its_answer_is_kept_for_the_workflow_result():
+    categorizer = CountingCategorizer("Travel", 0.4)
+    local = pipeline(categorizer).prepare("https://example.com/a")
+    assert local.reason == REASON_LOW_CONFIDENCE
+    assert local.result is None
+    assert local.category is categorizer.prediction
+    assert categorizer.calls == 1
+
+
+def test_pipeline_runs_the_cascade_categorizer():
+    categorizer = CountingCategorizer("Sports", 0.8)
+    assert pipeline(categorizer).categorizer is categorizer
+    cascade = Cascade(categorizer=categorizer)
+    assert AnalysisPipeline(AnalysisCache(":memory:"), categorizer=categorizer, cascade=cascade).categorizer is categorizer
+
+
+def test_different_categorizers_for_the_pipeline_and_cascade_are_refused():
+    cascade = Cascade(categorizer=CountingCategorizer("Sports", 0.8))
+    with pytest.raises(ValueError):
+        AnalysisPipeline(AnalysisCache(":memory:"), categorizer=CountingCategorizer("Travel", 0.8), cascade=cascade)
+
+
+def test_cascade_without_a_categorizer_routes_by_intent_alone():
+    cascade = Cascade(threshold=0.7)
+    prediction = FixedIntentModel(0.75).predict("")
+    assert cascade.confidence(prediction, None) == 0.75
+    assert cascade.route(ARTICLE, prediction, None) == REASON_CONFIDENT
+
+
+@pytest.mark.parametrize("article, campaign, full, reason", [
+    (ARTICLE, "", True, REASON_FULL_REQUESTED),
+    (ARTICLE, "spring sale", False, REASON_CAMPAIGN),
+    (None, "", False, REASON_NO_CONTENT),
+])
+def test_routes_that_always_go_to_the_workflow(article, campaign, full, reason):
+    cascade = Cascade(threshold=0.1, categorizer=CountingCategorizer("Sports", 1.0))
+    prediction = FixedIntentModel(1.0).predict("")
+    category = cascade.categorizer("")
+    assert cascade.route(article, prediction, category, campaign, full) == reason
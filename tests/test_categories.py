@@ -0,0 +1,117 @@
+## Category term matching (overlaps, word boundaries) and tier 1 / tier 2 scoring order
+
+import math
+
+import pytest
+
+from liz_analyzer.categories import (
+    EVIDENCE_SATURATION, TITLE_WEIGHT, CategoryClassifier, TermMatcher, classify_category, words
+)
+
+
+PHRASES = [("stock",), ("in", "stock"), ("stock", "market"), ("market",), ("a", "b", "c"), ("b", "d")]
+
+
+def matched(matcher, text):
+    return [" ".join(PHRASES[phrase_id]) for phrase_id in matcher.longest_matches(words(text))]
+
+
+@pytest.fixture
+def matcher():
+    return TermMatcher(PHRASES)
+
+
+def test_all_overlapping_matches_are_found(matcher):
+    found = sorted((start, end, PHRASES[phrase_id]) for start, end, phrase_id in matcher.matches(words("in stock market")))
+    assert found == [
+        (0, 1, ("in", "stock")), (1, 1, ("stock",)), (1, 2, ("stock", "market")), (2, 2, ("market",)),
+    ]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("back in stock", ["in stock"]),
+    ("the stock market fell", ["stock market"]),
+    # "in stock" starts first, so the overlapping "stock market" is dropped and "market" is not re-used
+    ("in stock market", ["in stock", "market"]),
+    ("stock stock", ["stock", "stock"]),
+    # A failed partial match of "a b c" falls back to "b d"
+    ("a b d", ["b d"]),
+    ("a b c", ["a b c"]),
+])
+def test_overlapping_matches_keep_the_leftmost_longest(matcher, text, expected):
+    assert matched(matcher, text) == expected
+
+
+@pytest.fixture
+def classifier():
+    return CategoryClassifier([
+        ("Automotive", "Auto Repair", "tire"),
+        ("Automotive", "Auto Repair", "oil change"),
+        ("Automotive", "Car Reviews", "horsepower"),
+        ("Automotive", "Electric Vehicles", "ev"),
+        ("Business", "Finance", "stock market"),
+        ("Business", "Retail", "in stock"),
+        ("Shopping", "Deals", "discount"),
+        ("Shopping", "Deals", "in stock"),
+        ("Sports", "Running", "marathon"),
+    ])
+
+
+@pytest.mark.parametrize("text", [
+    "The entire event was retired early; everyone left.",
+    "A stockist in the marketplace, with oil-changes.",
+    "Horsepowered marathoners",
+])
+def test_terms_only_match_whole_words(classifier, text):
+    assert classifier.classify(text) is None
+
+
+def test_plurals_and_case_are_folded(classifier):
+    prediction = classifier.classify("New TIRES and an Oil Change.")
+    assert prediction.tier1_category == "Automotive"
+    assert prediction.tier2_categories == ("Auto Repair",)
+
+
+def test_a_shared_term_splits_its_weight_between_its_categories(classifier):
+    prediction = classifier.classify("Back in stock today.")
+    assert prediction.tier1_scores == (("Business", 0.5), ("Shopping", 0.5))
+
+
+def test_tier1_ties_go_to_the_alphabetically_first(classifier):
+    assert classifier.classify("Back in stock today.").tier1_category == "Business"
+    assert classifier.classify("A marathon and a discount.").tier1_category == "Shopping"
+
+
+def test_tier2_candidates_are_ordered_by_score_then_name(classifier):
+    prediction = classifier.classify("ev horsepower tire tire")
+    assert prediction.tier1_category == "Automotive"
+    repair = 1 + math.log(2)
+    assert prediction.tier2_scores == (("Auto Repair", round(repair, 2)), ("Car Reviews", 1.0), ("Electric Vehicles", 1.0))
+    assert prediction.tier2_categories == ("Auto Repair", "Car Reviews", "Electric Vehicles")
+
+
+def test_repeats_are_damped_and_title_matches_count_extra(classifier):
+    body = classifier.classify("marathon " * 4 + "discount discount")
+    assert body.tier1_scores == (("Sports", round(1 + math.log(4), 2)), ("Shopping", round(1 + math.log(2), 2)))
+
+    titled = classifier.classify("discount", title="Marathon")
+    assert titled.tier1_category == "Sports"
+    assert dict(titled.tier1_scores)["Sports"] == round(1 + math.log(TITLE_WEIGHT), 2)
+
+
+def test_confidence_grows_with_evidence_and_a_clear_winner(classifier):
+    thin = classifier.classify("marathon")
+    assert thin.confidence == pytest.approx(1 / EVIDENCE_SATURATION)
+    split = classifier.classify("marathon discount")
+    assert split.confidence == pytest.approx(0.5 / EVIDENCE_SATURATION)
+
+
+@pytest.mark.parametrize("text, tier1", [
+    ("Back in stock.", "Shopping"),
+    ("Stock prices.", "Personal Finance"),
+    ("The board of directors met.", "Business"),
+    ("The film director spoke.", "Arts & Entertainment"),
+    ("Pet insurance.", "Pets"),
+])
+def test_bundled_dictionary_prefers_the_longer_overlapping_term(text, tier1):
+    assert classify_category(text).tier1_category == tier1
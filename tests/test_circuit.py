@@ -0,0 +1,115 @@
+## CircuitBreaker state transitions
+
+import pytest
+
+from liz_analyzer import circuit as circuit_module
+from liz_analyzer.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from liz_analyzer.client import AnalysisError
+
+
+@pytest.fixture
+def clock(fake_clock):
+    return fake_clock(circuit_module)
+
+
+def upstream_failure():
+    return AnalysisError("api_request_failed", "Webhook returned 503")
+
+
+def fail(breaker):
+    def call():
+        raise upstream_failure()
+    with pytest.raises(AnalysisError):
+        breaker.call(call)
+
+
+def test_opens_after_consecutive_upstream_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    fail(breaker)
+    fail(breaker)
+    assert breaker.state == CLOSED
+    fail(breaker)
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 1
+
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+    fail(breaker)
+    assert breaker.call(lambda: "ok") == "ok"
+    fail(breaker)
+    assert breaker.state == CLOSED
+
+
+def test_open_circuit_rejects_calls_without_running_them(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    fail(breaker)
+    calls = []
+    clock.now += 10
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.call(calls.append, 1)
+    assert calls == []
+    assert excinfo.value.retry_in == pytest.approx(20)
+    assert breaker.rejected == 1
+    assert breaker.retry_in() == pytest.approx(20)
+
+
+def test_half_opens_after_the_timeout_and_closes_on_a_successful_probe(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    fail(breaker)
+    clock.now += 30
+    assert breaker.state == HALF_OPEN
+    assert breaker.retry_in() == 0.0
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CLOSED
+
+
+def test_failed_probe_reopens_for_another_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    for _ in range(3):
+        fail(breaker)
+    clock.now += 30
+    fail(breaker)
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 2
+    clock.now += 29
+    assert breaker.state == OPEN
+    clock.now += 1
+    assert breaker.state == HALF_OPEN
+
+
+def test_half_open_lets_only_the_allowed_probes_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, half_open_max_calls=1)
+    fail(breaker)
+    clock.now += 30
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.release()
+    breaker.before_call()
+
+
+def test_workflow_errors_do_not_count_against_the_circuit(clock):
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    def call():
+        raise AnalysisError("fetch_failed", "The article could not be fetched")
+
+    with pytest.raises(AnalysisError):
+        breaker.call(call)
+    assert breaker.state == CLOSED
+
+
+def test_other_exceptions_release_a_probe_without_closing(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    fail(breaker)
+    clock.now += 30
+
+    def call():
+        raise ValueError("bug in the caller")
+
+    with pytest.raises(ValueError):
+        breaker.call(call)
+    assert breaker.state == HALF_OPEN
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CLOSED
@@ -0,0 +1,113 @@
+## Webhook client endpoint failover and health accounting
+
+import asyncio
+
+import pytest
+
+from liz_analyzer.async_client import AsyncWebhookClient
+from liz_analyzer.client import AnalysisError, RetryPolicy, WebhookClient
+from liz_analyzer.endpoints import EndpointRegistry
+from liz_analyzer.stub_server import LatencyModel, StubWebhookServer
+
+
+@pytest.fixture(scope="module")
+def servers():
+    """servers(**options) starts a stub webhook once per set of options for the whole module"""
+    started = {}
+
+    def start(**options):
+        key = tuple(sorted(options.items()))
+        if key not in started:
+            started[key] = StubWebhookServer(seed=1, stream=False, **options).start()
+        return started[key]
+
+    yield start
+    for server in started.values():
+        server.stop()
+
+
+class SyncCaller:
+    def __init__(self, registry):
+        self.endpoints = registry
+        self.client = WebhookClient(endpoints=registry, retry_policy=RetryPolicy(max_retries=0, backoff_base=0))
+
+    def analyze(self, params):
+        return self.client.analyze(params)
+
+
+class AsyncCaller:
+    def __init__(self, registry):
+        self.endpoints = registry
+
+    def analyze(self, params):
+        async def run():
+            client = AsyncWebhookClient(endpoints=self.endpoints, retry_policy=RetryPolicy(max_retries=0, backoff_base=0))
+            try:
+                return await client.analyze(params)
+            finally:
+                await client.aclose()
+        return asyncio.run(run())
+
+
+@pytest.fixture(params=[SyncCaller, AsyncCaller], ids=["sync", "async"])
+def client_preferring(request):
+    """client_preferring(first, second): a sync or async client whose registry tries `first` before `second`"""
+    def build(first, second):
+        registry = EndpointRegistry([first.url, second.url], explore_rate=0)
+        registry.record_success(registry.endpoints[0], 0.001)
+        registry.record_success(registry.endpoints[1], 1.0)
+        return request.param(registry)
+    return build
+
+
+def test_server_error_fails_over_and_counts_against_the_endpoint(servers, client_preferring):
+    failing = servers(failure_rate=1.0, failure_status=503)
+    healthy = servers()
+    client = client_preferring(failing, healthy)
+    healthy_requests = healthy.stats()['requests']
+
+    result = client.analyze({'url': "https://example.com/a"})
+
+    assert result['tier1_category']
+    assert healthy.stats()['requests'] == healthy_requests + 1
+    assert client.endpoints.endpoints[0].failures == 1
+
+
+@pytest.mark.parametrize("status", [400, 404, 422])
+def test_client_error_is_returned_without_failover_or_health_penalty(servers, client_preferring, status):
+    rejecting = servers(failure_rate=1.0, failure_status=status)
+    healthy = servers()
+    client = client_preferring(rejecting, healthy)
+    healthy_requests = healthy.stats()['requests']
+
+    with pytest.raises(AnalysisError) as excinfo:
+        client.analyze({'url': "https://example.com/a"})
+
+    assert str(status) in excinfo.value.message
+    assert healthy.stats()['requests'] == healthy_requests
+    assert client.endpoints.endpoints[0].failures == 0
+    assert client.endpoints.stats()[0]['healthy']
+
+
+def test_rate_limiting_counts_against_the_endpoint(servers, client_preferring):
+    limited = servers(failure_rate=1.0, failure_status=429)
+    healthy = servers()
+    client = client_preferring(limited, healthy)
+
+    assert client.analyze({'url': "https://example.com/a"})['tier1_category']
+    assert client.endpoints.endpoints[0].failures == 1
+
+
+def test_streamed_call_latency_covers_the_whole_stream():
+    server = StubWebhookServer(seed=1, latency=LatencyModel("fixed", median_ms=300)).start()
+    try:
+        client = WebhookClient(webhook_url=server.url)
+        sections = []
+        result = client.analyze_stream({'url': "https://example.com/a"}, lambda name, value: sections.append(name))
+    finally:
+        server.stop()
+
+    assert result['tier1_category'] and len(sections) > 1
+    endpoint = client.endpoints.endpoints[0]
+    assert endpoint.requests == 1
+    assert endpoint.latency >= 0.25
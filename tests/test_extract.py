@@ -0,0 +1,233 @@
+## Main-content extraction, the SSRF guard and the download caps, against a local http.server
+
+import http.server
+import threading
+
+import pytest
+
+from liz_analyzer import extract as extract_module
+from liz_analyzer.client import AnalysisError
+from liz_analyzer.extract import ArticleExtractor, check_public_url, extract_main_text, is_public_address
+
+
+STORY = " ".join(f"Sentence {i} of the story explains how the spring running shoe lineup compares." for i in range(12))
+
+ARTICLE_PAGE = f"""<!doctype html>
+<html><head>
+<title>Site title | Example News</title>
+<meta property="og:title" content="Spring running shoes compared">
+<script>var tracking = "Sentence from a script that must never appear";</script>
+</head><body>
+<header><a href="/">Example News</a> <p>Subscribe to our daily newsletter for more updates</p></header>
+<nav><ul><li>Home page link</li><li>World news section link</li></ul></nav>
+<article>
+  <h1>Spring running shoes</h1>
+  <p class="byline">By Staff</p>
+  <p>{STORY}</p>
+  <div class="ad-slot"><p>Buy the sponsored running shoes today at a discount</p></div>
+  <p>The lightweight trainers held up best over a month of daily test runs.</p>
+  <section id="comments"><p>Great article, I bought a pair last week myself</p></section>
+</article>
+<aside><p>Related stories you might also enjoy reading</p></aside>
+<footer><p>Copyright Example News and all of its partners</p></footer>
+</body></html>"""
+
+PADDED_PAGE = (
+    "<html><body><article><p>" + STORY + "</p>"
+    + "<script>" + "x" * (64 * 1024) + "</script>"
+    + "<p>The closing paragraph sits past the byte cap of the download.</p></article></body></html>"
+)
+
+
+class ArticleHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        status, headers, body = self.server.routes.get(self.path, (404, {}, b""))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def html(body, content_type="text/html; charset=utf-8"):
+    return 200, {"Content-Type": content_type}, body.encode("utf-8")
+
+
+def redirect(location):
+    return 302, {"Location": location}, b""
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ArticleHandler)
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    server.routes = {
+        "/article": html(ARTICLE_PAGE),
+        "/padded": html(PADDED_PAGE),
+        "/empty": html("<html><body><nav><p>Only navigation links on this page</p></nav></body></html>"),
+        "/json": html('{"a": 1}', content_type="application/json"),
+        "/moved": redirect("/article"),
+        "/to-metadata": redirect("http://169.254.169.254/latest/meta-data/"),
+        "/loop": redirect("/loop"),
+    }
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def requests_seen(server):
+    server.requests.clear()
+    return server.requests
+
+
+@pytest.fixture
+def loopback_is_public(monkeypatch):
+    """Treat the local test server's address as public, so only the hops under test are refused"""
+    def patched(address):
+        return address == "127.0.0.1" or is_public_address(address)
+    monkeypatch.setattr(extract_module, "is_public_address", patched)
+
+
+def test_main_text_drops_page_chrome():
+    title, text, truncated = extract_main_text(ARTICLE_PAGE)
+    assert title == "Spring running shoes compared"
+    assert text.startswith("Spring running shoes\n\n")
+    assert STORY in text
+    assert "The lightweight trainers held up best" in text
+    for chrome in ("newsletter", "Home page", "script", "sponsored", "Great article", "Related stories", "Copyright"):
+        assert chrome not in text
+    assert not truncated
+
+
+def test_short_main_region_falls_back_to_the_whole_page():
+    page = "<html><body><main><p>Too short to be the article body</p></main><p>" + STORY + "</p></body></html>"
+    _, text, _ = extract_main_text(page)
+    assert STORY in text
+
+
+def test_text_is_cut_to_the_token_budget_on_a_word_boundary():
+    _, text, truncated = extract_main_text(ARTICLE_PAGE, max_tokens=30)
+    assert truncated
+    assert len(text) <= 30 * extract_module.CHARS_PER_TOKEN
+    assert (text + " ") in ("Spring running shoes\n\n" + STORY + " ")
+
+
+@pytest.mark.parametrize("address, public", [
+    ("93.184.216.34", True),
+    ("2606:4700::1111", True),
+    ("127.0.0.1", False),
+    ("10.1.2.3", False),
+    ("192.168.0.10", False),
+    ("169.254.169.254", False),
+    ("100.64.0.1", False),
+    ("::1", False),
+    ("fe80::1", False),
+    ("::ffff:127.0.0.1", False),
+    ("224.0.0.1", False),
+])
+def test_is_public_address(address, public):
+    assert is_public_address(address) is public
+
+
+@pytest.mark.parametrize("url", [
+    "http://127.0.0.1/",
+    "http://localhost:8080/admin",
+    "http://10.0.0.5/",
+    "http://169.254.169.254/latest/meta-data/",
+    "http://[::1]/",
+    "http://[::ffff:127.0.0.1]/",
+    "ftp://93.184.216.34/",
+    "http:///no-host",
+    "http://93.184.216.34:99999/",
+])
+def test_check_public_url_refuses(url):
+    with pytest.raises(AnalysisError) as excinfo:
+        check_public_url(url)
+    assert excinfo.value.error_type == "content_fetch_failed"
+
+
+def test_check_public_url_accepts_a_public_address():
+    check_public_url("https://93.184.216.34/article")
+
+
+def test_extractor_fetches_and_extracts(server):
+    extractor = ArticleExtractor(allow_private=True)
+    article = extractor.extract(server.url + "/moved")
+    assert article.url == server.url + "/moved"
+    assert article.title == "Spring running shoes compared"
+    assert STORY in article.text
+    assert article.tokens == extract_module.estimate_tokens(article.text)
+    assert article.bytes == len(ARTICLE_PAGE.encode("utf-8"))
+    assert not article.truncated
+    extractor.close()
+
+
+def test_extractor_refuses_private_hosts_without_sending_a_request(server, requests_seen):
+    extractor = ArticleExtractor()
+    with pytest.raises(AnalysisError) as excinfo:
+        extractor.extract(server.url + "/article")
+    assert "non-public address 127.0.0.1" in excinfo.value.technical_details
+    assert requests_seen == []
+
+
+def test_extractor_checks_every_redirect_hop(server, requests_seen, loopback_is_public):
+    extractor = ArticleExtractor()
+    with pytest.raises(AnalysisError) as excinfo:
+        extractor.extract(server.url + "/to-metadata")
+    assert "169.254.169.254" in excinfo.value.technical_details
+    assert requests_seen == ["/to-metadata"]
+
+
+def test_extractor_checks_the_connected_address(server, requests_seen, monkeypatch):
+    # The name checked out as public, then resolved to loopback when the connection was made
+    monkeypatch.setattr(extract_module, "check_public_url", lambda url: None)
+    extractor = ArticleExtractor()
+    with pytest.raises(AnalysisError) as excinfo:
+        extractor.extract(server.url + "/article")
+    assert "non-public address 127.0.0.1" in excinfo.value.technical_details
+    assert requests_seen == []
+
+
+def test_extractor_stops_after_too_many_redirects(server):
+    with pytest.raises(AnalysisError) as excinfo:
+        ArticleExtractor(allow_private=True).extract(server.url + "/loop")
+    assert "redirects" in excinfo.value.technical_details
+
+
+@pytest.mark.parametrize("path, details", [
+    ("/missing", "status code 404"),
+    ("/json", "Unsupported content type"),
+    ("/empty", "No article text"),
+])
+def test_extractor_failures(server, path, details):
+    with pytest.raises(AnalysisError) as excinfo:
+        ArticleExtractor(allow_private=True).extract(server.url + path)
+    assert excinfo.value.error_type == "content_fetch_failed"
+    assert details in excinfo.value.technical_details
+
+
+def test_extractor_token_cap(server):
+    article = ArticleExtractor(max_tokens=25, allow_private=True).extract(server.url + "/article")
+    assert article.truncated
+    assert len(article.text) <= 25 * extract_module.CHARS_PER_TOKEN
+
+
+def test_extractor_byte_cap_stops_the_download_and_reports_truncation(server):
+    full = ArticleExtractor(allow_private=True).extract(server.url + "/padded")
+    assert "closing paragraph" in full.text
+    assert not full.truncated
+
+    capped = ArticleExtractor(max_bytes=8 * 1024, allow_private=True).extract(server.url + "/padded")
+    assert STORY in capped.text
+    assert "closing paragraph" not in capped.text
+    assert capped.truncated
+    assert capped.bytes < len(PADDED_PAGE)
@@ -0,0 +1,128 @@
+## AnalysisHistory recording, search filters and recency ordering on a SQLite file
+
+import pytest
+
+from liz_analyzer import history as history_module
+from liz_analyzer.fixtures import load_fixture
+from liz_analyzer.history import AnalysisHistory
+from liz_analyzer.models import AnalysisResult
+
+
+@pytest.fixture
+def clock(fake_clock):
+    return fake_clock(history_module)
+
+
+@pytest.fixture
+def history(tmp_path, clock):
+    return AnalysisHistory(str(tmp_path / "history" / "analysis_history.sqlite3"))
+
+
+def result(category="Shopping", intent="Commercial", keywords=(), breakdown=None):
+    return AnalysisResult.from_dict({
+        'intention': {'primary': intent},
+        'intentionality_breakdown': breakdown or {'commercial': 80, 'informational': 20},
+        'tier1_category': category,
+        'primary_keywords': list(keywords),
+    })
+
+
+def record_at(history, clock, when, url, analysis, campaign_definition=""):
+    clock.now = when
+    return history.record(url, analysis, campaign_definition)
+
+
+def test_record_stores_a_searchable_summary_and_the_full_result(history, clock):
+    analysis = AnalysisResult.from_dict(load_fixture("basic_article")[0])
+    entry_id = record_at(history, clock, 1000.0, "https://example.com/marathon", analysis)
+
+    entry, loaded = history.load(entry_id)
+    assert loaded == analysis
+    assert (entry.url, entry.analyzed_at, entry.tier1_category, entry.primary_intent) == (
+        "https://example.com/marathon", 1000.0, "Sports", "commercial"
+    )
+    assert (entry.final_score, entry.final_grade, entry.score_type) == (56, "C+", "action_only")
+    assert entry.keywords == analysis.primary_keywords + analysis.secondary_keywords
+    assert history.load(entry_id + 1) is None
+
+
+def test_entries_survive_reopening_the_file(tmp_path, clock):
+    path = str(tmp_path / "analysis_history.sqlite3")
+    first = AnalysisHistory(path)
+    first.record("https://example.com/a", result())
+    del first
+
+    reopened = AnalysisHistory(path)
+    assert [entry.url for entry in reopened.search()] == ["https://example.com/a"]
+
+
+def test_search_returns_the_most_recent_first_and_respects_the_limit(history, clock):
+    for when, name in ((1000.0, "old"), (3000.0, "new"), (2000.0, "middle")):
+        record_at(history, clock, when, f"https://example.com/{name}", result())
+    assert [entry.url.rsplit("/", 1)[1] for entry in history.search()] == ["new", "middle", "old"]
+    assert [entry.url.rsplit("/", 1)[1] for entry in history.search(limit=2)] == ["new", "middle"]
+
+
+def test_reanalysis_refreshes_the_entry_and_moves_it_to_the_top(history, clock):
+    first_id = record_at(history, clock, 1000.0, "https://example.com/a", result(category="Shopping"))
+    record_at(history, clock, 2000.0, "https://example.com/b", result())
+    again_id = record_at(history, clock, 3000.0, "https://example.com/a", result(category="Travel"))
+
+    assert again_id == first_id
+    assert len(history) == 2
+    entries = history.search()
+    assert [entry.url for entry in entries] == ["https://example.com/a", "https://example.com/b"]
+    assert entries[0].tier1_category == "Travel"
+
+    record_at(history, clock, 4000.0, "https://example.com/a", result(), campaign_definition="spring sale")
+    assert len(history) == 3
+
+
+def test_search_filters_combine(history, clock):
+    record_at(history, clock, 1000.0, "https://shop.com/shoes", result("Shopping", "Commercial", ["running shoes"]))
+    record_at(history, clock, 2000.0, "https://news.com/race", result(
+        "Sports", "Informational", ["marathon"], {'informational': 90, 'commercial': 10}
+    ))
+    record_at(history, clock, 3000.0, "https://shop.com/gels", result("Sports", "Transactional", ["energy gels"], {
+        'transactional': 90, 'commercial': 10
+    }))
+
+    def urls(**filters):
+        return [entry.url for entry in history.search(**filters)]
+
+    assert urls(category="Sports") == ["https://shop.com/gels", "https://news.com/race"]
+    assert urls(intent="INFORMATIONAL") == ["https://news.com/race"]
+    assert urls(text="shop.com") == ["https://shop.com/gels", "https://shop.com/shoes"]
+    assert urls(text="Marathon") == ["https://news.com/race"]
+    assert urls(category="Sports", text="shop") == ["https://shop.com/gels"]
+    top_score = max(entry.final_score for entry in history.search())
+    assert urls(min_score=top_score) == [entry.url for entry in history.search() if entry.final_score == top_score]
+    assert history.categories() == ["Shopping", "Sports"]
+    assert history.intents() == ["commercial", "informational", "transactional"]
+
+
+def test_text_search_treats_like_wildcards_literally(history, clock):
+    record_at(history, clock, 1000.0, "https://example.com/a", result(keywords=["100% cotton"]))
+    record_at(history, clock, 2000.0, "https://example.com/b", result(keywords=["1000 cotton"]))
+    record_at(history, clock, 3000.0, "https://example.com/c", result(keywords=["t_shirt"]))
+    record_at(history, clock, 4000.0, "https://example.com/d", result(keywords=["tXshirt"]))
+
+    assert [entry.url for entry in history.search(text="100%")] == ["https://example.com/a"]
+    assert [entry.url for entry in history.search(text="t_s")] == ["https://example.com/c"]
+
+
+def test_oldest_entries_are_dropped_beyond_max_entries(tmp_path, clock):
+    store = AnalysisHistory(str(tmp_path / "analysis_history.sqlite3"), max_entries=2)
+    for when in (1000.0, 2000.0, 3000.0):
+        record_at(store, clock, when, f"https://example.com/{int(when)}", result())
+    assert [entry.url for entry in store.search()] == ["https://example.com/3000", "https://example.com/2000"]
+
+
+def test_delete_and_clear(history, clock):
+    keep = record_at(history, clock, 1000.0, "https://example.com/keep", result())
+    drop = record_at(history, clock, 2000.0, "https://example.com/drop", result())
+    history.delete(drop)
+    assert [entry.id for entry in history.search()] == [keep]
+    history.clear()
+    assert len(history) == 0
+    assert history.search() == []
@@ -0,0 +1,81 @@
+## AnalysisResult validation and the from_dict / to_dict round trip
+
+import copy
+
+import pytest
+
+from liz_analyzer.client import AnalysisError
+from liz_analyzer.fixtures import load_fixture
+from liz_analyzer.models import AnalysisResult
+
+
+def minimal_payload(**fields):
+    return dict({'intention': {'primary': 'informational'}, 'intentionality_breakdown': {}}, **fields)
+
+
+@pytest.mark.parametrize("name", ["basic_article", "campaign_article"])
+def test_recorded_payloads_round_trip(name):
+    payload = load_fixture(name)[0]
+    result = AnalysisResult.from_dict(payload)
+    assert result.to_dict() == payload
+    assert AnalysisResult.from_dict(result.to_dict()) == result
+
+
+def test_from_dict_does_not_alias_the_payload():
+    payload = load_fixture("campaign_article")[0]
+    original = copy.deepcopy(payload)
+    document = AnalysisResult.from_dict(payload).to_dict()
+    document['intentionality_breakdown']['transactional'] = -1
+    document['audience_profile']['type'].append("extra")
+    assert payload == original
+
+
+def test_unknown_fields_and_metadata_survive_the_round_trip():
+    payload = minimal_payload(
+        workflow_version="2.3", debug={'nodes': 7}, analysis_metadata={'analysis_path': 'local'}
+    )
+    result = AnalysisResult.from_dict(payload)
+    assert result.extras == {'workflow_version': "2.3", 'debug': {'nodes': 7}}
+    assert result.analysis_metadata == {'analysis_path': 'local'}
+
+    document = result.to_dict()
+    assert document['workflow_version'] == "2.3"
+    assert document['debug'] == {'nodes': 7}
+    assert document['analysis_metadata'] == {'analysis_path': 'local'}
+    assert AnalysisResult.from_dict(document) == result
+
+
+def test_missing_optional_fields_get_defaults():
+    result = AnalysisResult.from_dict(minimal_payload())
+    assert result.intention.confidence is None
+    assert result.tier2_categories == ()
+    assert result.audience_profile.demographics.age_distribution == {}
+    assert result.campaign_relevancy is None
+    assert result.performance_summary is None
+    assert 'campaign_relevancy' not in result.to_dict()
+    assert 'confidence' not in result.to_dict()['intention']
+
+
+def test_breakdown_key_order_is_kept():
+    breakdown = {'navigational': 10, 'transactional': 60, 'informational': 30}
+    result = AnalysisResult.from_dict(minimal_payload(intentionality_breakdown=breakdown))
+    assert list(result.to_dict()['intentionality_breakdown']) == list(breakdown)
+
+
+@pytest.mark.parametrize("payload, path", [
+    ([], "result"),
+    ({'intentionality_breakdown': {}}, "result.intention"),
+    ({'intention': {}}, "result.intentionality_breakdown"),
+    (minimal_payload(intentionality_breakdown={'transactional': "60"}), "result.intentionality_breakdown.transactional"),
+    (minimal_payload(intentionality_breakdown={'transactional': True}), "result.intentionality_breakdown.transactional"),
+    (minimal_payload(primary_keywords="shoes"), "result.primary_keywords"),
+    (minimal_payload(primary_keywords=["shoes", 3]), "result.primary_keywords[1]"),
+    (minimal_payload(audience_profile={'demographics': []}), "result.audience_profile.demographics"),
+    (minimal_payload(campaign_relevancy={'overall_relevancy_score': "high"}),
+     "result.campaign_relevancy.overall_relevancy_score"),
+])
+def test_malformed_payloads_raise_a_parse_error(payload, path):
+    with pytest.raises(AnalysisError) as excinfo:
+        AnalysisResult.from_dict(payload)
+    assert excinfo.value.error_type == "parse_error"
+    assert excinfo.value.technical_details.startswith(f"Invalid result: {path}:")
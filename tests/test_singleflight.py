@@ -0,0 +1,134 @@
+## SingleFlight and AsyncSingleFlight coalescing of concurrent identical calls
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from liz_analyzer.singleflight import AsyncSingleFlight, SingleFlight
+
+
+CALLERS = 8
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for callers"
+        time.sleep(0.001)
+
+
+def run_concurrently(group, key, fn, callers=CALLERS):
+    """Outcomes (('ok', result) or ('error', exception)) of `callers` threads calling group.do(key, fn) at once"""
+    outcomes = [None] * callers
+
+    def call(index):
+        try:
+            outcomes[index] = ("ok", group.do(key, fn))
+        except Exception as e:
+            outcomes[index] = ("error", e)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def test_concurrent_callers_share_one_call_and_its_result():
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return {"answer": 42}
+
+    threads, outcomes = run_concurrently(group, "k", fetch)
+    wait_for(lambda: group.coalesced == CALLERS - 1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    results = [result for status, result in outcomes if status == "ok"]
+    assert len(results) == CALLERS
+    assert all(result is results[0] for result in results)
+    assert group.stats() == {"executions": 1, "coalesced": CALLERS - 1, "in_flight": 0}
+
+
+def test_an_error_reaches_every_waiter_and_clears_the_key():
+    group = SingleFlight()
+    release = threading.Event()
+    error = RuntimeError("upstream failed")
+
+    def fetch():
+        release.wait(5)
+        raise error
+
+    threads, outcomes = run_concurrently(group, "k", fetch)
+    wait_for(lambda: group.coalesced == CALLERS - 1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert outcomes == [("error", error)] * CALLERS
+    assert group.in_flight() == 0
+    assert group.do("k", lambda: "fresh") == "fresh"
+    assert group.executions == 2
+
+
+def test_different_keys_run_separately_and_finished_calls_are_not_remembered():
+    group = SingleFlight()
+    assert group.do("a", lambda: 1) == 1
+    assert group.do("b", lambda: 2) == 2
+    assert group.do("a", lambda: 3) == 3
+    assert group.stats() == {"executions": 3, "coalesced": 0, "in_flight": 0}
+
+
+def test_async_callers_share_one_call_and_an_error_reaches_every_waiter():
+    async def scenario():
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"answer": 42}
+
+        results = await asyncio.gather(*(group.do("k", fetch) for _ in range(CALLERS)))
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+        error = RuntimeError("upstream failed")
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise error
+
+        outcomes = await asyncio.gather(*(group.do("k", fail) for _ in range(CALLERS)), return_exceptions=True)
+        assert outcomes == [error] * CALLERS
+
+        async def fresh():
+            return "fresh"
+
+        assert await group.do("k", fresh) == "fresh"
+        assert (group.executions, group.coalesced) == (3, 2 * (CALLERS - 1))
+
+    asyncio.run(scenario())
+
+
+def test_async_waiters_are_released_when_the_leader_is_cancelled():
+    async def scenario():
+        group = AsyncSingleFlight()
+        leader = asyncio.ensure_future(group.do("k", asyncio.sleep, 10))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(group.do("k", asyncio.sleep, 10))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert await group.do("k", asyncio.sleep, 0, "fresh") == "fresh"
+
+    asyncio.run(scenario())
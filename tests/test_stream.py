@@ -0,0 +1,92 @@
+## Streamed (NDJSON) analysis parsing
+
+import json
+
+import pytest
+
+from liz_analyzer.client import AnalysisError, parse_analysis_stream
+
+
+def ndjson(*documents):
+    return [json.dumps(document) for document in documents]
+
+
+def parse_error(lines, on_section=None):
+    with pytest.raises(AnalysisError) as excinfo:
+        parse_analysis_stream(lines, on_section)
+    assert excinfo.value.error_type == "parse_error"
+    return excinfo.value.technical_details
+
+
+def test_sections_from_several_lines_are_merged_and_later_lines_win():
+    lines = ndjson(
+        {'intention': {'primary': 'informational'}},
+        {'tier1_category': "Sports", 'primary_keywords': ["marathon"]},
+        {'tier1_category': "Health & Fitness"},
+    )
+    assert parse_analysis_stream(lines) == {
+        'intention': {'primary': 'informational'},
+        'tier1_category': "Health & Fitness",
+        'primary_keywords': ["marathon"],
+    }
+
+
+def test_blank_lines_and_bytes_are_accepted():
+    lines = ["", "   ", b'{"tier1_category": "Sports"}', "\n", '  {"tier2_categories": ["Running"]}  ']
+    assert parse_analysis_stream(lines) == {'tier1_category': "Sports", 'tier2_categories': ["Running"]}
+
+
+def test_a_line_wrapped_in_a_list_is_unwrapped():
+    assert parse_analysis_stream(ndjson([{'tier1_category': "Sports"}])) == {'tier1_category': "Sports"}
+
+
+def test_on_section_is_called_in_arrival_order():
+    seen = []
+    lines = ndjson(
+        {'tier1_category': "Sports"},
+        {'intention': {'primary': 'commercial'}, 'intentionality_breakdown': {'commercial': 70}},
+        {'tier1_category': "Shopping"},
+    )
+    parse_analysis_stream(lines, lambda name, value: seen.append((name, value)))
+    assert seen == [
+        ('tier1_category', "Sports"),
+        ('intention', {'primary': 'commercial'}),
+        ('intentionality_breakdown', {'commercial': 70}),
+        ('tier1_category', "Shopping"),
+    ]
+
+
+def test_a_stream_cut_off_mid_line_is_a_parse_error_after_the_complete_sections():
+    seen = []
+    lines = ['{"tier1_category": "Sports"}', '{"intention": {"primary": "inform']
+    details = parse_error(lines, lambda name, value: seen.append(name))
+    assert details.startswith("Parse error in streamed line:")
+    assert seen == ['tier1_category']
+
+
+@pytest.mark.parametrize("line, type_name", [
+    ("42", "int"),
+    ('"Sports"', "str"),
+    ("null", "NoneType"),
+    ("[]", "list"),
+    ("[42]", "int"),
+])
+def test_non_object_payloads_are_parse_errors(line, type_name):
+    assert parse_error([line]) == f"Unexpected streamed payload type: {type_name}"
+
+
+@pytest.mark.parametrize("lines", [[], ["", "  "]])
+def test_a_stream_without_sections_is_a_parse_error(lines):
+    assert parse_error(lines) == "Streamed response contained no sections"
+
+
+@pytest.mark.parametrize("payload", [
+    {'error': True, 'error_type': "fetch_failed", 'message': "Could not fetch the article"},
+    [{'error': True, 'error_type': "fetch_failed", 'message': "Could not fetch the article"}],
+])
+def test_a_workflow_error_line_raises_its_error(payload):
+    lines = ndjson({'tier1_category': "Sports"}, payload)
+    with pytest.raises(AnalysisError) as excinfo:
+        parse_analysis_stream(lines)
+    assert excinfo.value.error_type == "fetch_failed"
+    assert excinfo.value.message == "Could not fetch the article"